@@ -0,0 +1,58 @@
+"""Gợi ý chỉ mục còn thiếu/thừa cho system_elearning.sql, xếp theo tần suất truy vấn trong các service.
+
+Chạy: python advise_indexes.py [--sql-out add_indexes.sql] [--kinds fk lookup ...]
+"""
+import argparse
+import os
+
+from doctools.entity_scan import scan_entities
+from doctools.index_advisor import KINDS, advise_indexes, scan_query_usage
+from doctools.sql_schema import load_schema_model
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SQL_PATH = os.path.join(BASE_DIR, 'system_elearning.sql')
+ENTITIES_DIR = os.path.join(BASE_DIR, '..', 'backend', 'src', 'entities')
+MODULES_DIR = os.path.join(BASE_DIR, '..', 'backend', 'src', 'modules')
+
+KIND_LABELS = {
+    'fk': 'Khóa ngoại thiếu chỉ mục',
+    'lookup': 'Cột tra cứu thiếu chỉ mục',
+    'redundant': 'Chỉ mục thừa',
+    'wide_unique': 'Khóa UNIQUE rộng',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sql', default=SQL_PATH)
+    parser.add_argument('--entities', default=ENTITIES_DIR)
+    parser.add_argument('--modules', default=MODULES_DIR)
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS), help='chỉ báo các loại gợi ý này')
+    parser.add_argument('--top', type=int, default=10, help='số cột được truy vấn nhiều nhất cần in')
+    parser.add_argument('--sql-out', help='ghi các câu ALTER TABLE ra file thay vì in ra màn hình')
+    args = parser.parse_args()
+
+    entities, _ = scan_entities(args.entities)
+    usage = scan_query_usage(args.modules, entities)
+    advice = [a for a in advise_indexes(load_schema_model(args.sql), usage) if a.kind in args.kinds]
+
+    print(f'Cột được lọc nhiều nhất trong service ({sum(usage.values())} lần dùng):')
+    for (table, column), hits in usage.most_common(args.top):
+        print(f'  {hits:4d}  {table}.{column}')
+
+    print(f'\n{len(advice)} gợi ý:')
+    for rank, item in enumerate(advice, 1):
+        print(f"{rank:3d}. [{KIND_LABELS[item.kind]}] {item.table}({', '.join(item.columns)}) "
+              f'- {item.detail} (truy vấn {item.hits} lần)')
+
+    statements = [item.statement for item in advice if item.statement]
+    if args.sql_out:
+        with open(args.sql_out, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(statements) + '\n')
+        print(f'\nĐã ghi {len(statements)} câu lệnh vào {args.sql_out}')
+    elif statements:
+        print('\n' + '\n'.join(statements))
+
+
+if __name__ == '__main__':
+    main()
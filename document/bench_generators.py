@@ -0,0 +1,106 @@
+"""Benchmark đầu-cuối của hai script sinh tài liệu trên đầu vào tổng hợp, so với baseline đã lưu.
+
+Mỗi trường hợp có dạng schema:BẢNGxCỘT (generate_db_schema_docx.py) hoặc
+screens:ẢNHxNHÓM (word_report_with_image.py). Đầu vào được sinh một lần và giữ
+trong .cache/bench. Trả về mã lỗi 1 khi có chỉ số vượt dung sai so với baseline.
+
+bench_baseline.json là baseline tham chiếu của repo (bộ nhanh, ghi kèm thông
+tin máy đo). bench_baseline.local.json (không commit) là baseline của máy đang
+dùng: có file này thì so với nó, và --save ghi vào nó. Khi baseline được đo trên
+máy khác, chỉ so đỉnh RSS và kích thước đầu ra (dung sai mặc định 20%), còn
+thời gian chỉ được so khi có baseline của chính máy này. Cập nhật baseline
+tham chiếu: --save --baseline bench_baseline.json.
+
+Chạy: python bench_generators.py [--full] [--no-startup] [--cases ...] [--repeat N] [--tolerance 0.2 warm_s=0.5] [--save]
+"""
+import argparse
+import os
+import sys
+
+from doctools.benchmark import METRICS, PORTABLE_METRICS, case_key, compare, load_baseline, machine_info, \
+    measure_case, measure_startup, parse_case, save_baseline
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BASE_DIR, 'bench_baseline.json')
+LOCAL_BASELINE_PATH = os.path.join(BASE_DIR, 'bench_baseline.local.json')
+
+# Bộ mặc định chạy trong vài phút; --full thêm các trường hợp lớn (tới 10 000 bảng, 2 000 ảnh)
+QUICK_CASES = ('schema:10x5', 'schema:100x20', 'schema:500x40', 'schema:50x200', 'screens:10x1', 'screens:100x3')
+FULL_CASES = QUICK_CASES + ('schema:2000x20', 'schema:10000x10', 'screens:500x3', 'screens:2000x3')
+# Thời gian khởi động của các lệnh không dựng tài liệu (chỉ nạp module và đọc tham số)
+STARTUP_COMMANDS = {
+    'startup-schema-help': ('generate_db_schema_docx.py', '--help'),
+    'startup-schema-dry-run': ('generate_db_schema_docx.py', '--dry-run'),
+    'startup-screens-help': ('word_report_with_image.py', '--help'),
+}
+
+
+def parse_tolerances(values):
+    """['0.2', 'warm_s=0.5'] -> {None: 0.2, 'warm_s': 0.5}."""
+    tolerances = {None: 0.2}
+    for value in values:
+        metric, _, number = value.rpartition('=')
+        if metric and metric not in METRICS:
+            raise ValueError(f"chỉ số không hợp lệ: {metric} (chọn trong {', '.join(METRICS)})")
+        tolerances[metric or None] = float(number)
+    return tolerances
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cases', nargs='+', metavar='CASE', help='các trường hợp cần đo (mặc định: bộ nhanh)')
+    parser.add_argument('--full', action='store_true', help='đo cả các trường hợp lớn')
+    parser.add_argument('--no-startup', action='store_true', help='không đo thời gian khởi động của các script')
+    parser.add_argument('--repeat', type=int, default=3, help='số lần đo mỗi trường hợp, lấy thời gian nhỏ nhất')
+    parser.add_argument('--tolerance', nargs='+', default=[], metavar='[CHỈ_SỐ=]TỈ_LỆ',
+                        help='dung sai tương đối so với baseline (mặc định 0.2); CHỈ_SỐ=TỈ_LỆ cho riêng một chỉ số')
+    parser.add_argument('--baseline', help='file JSON chứa baseline (mặc định: bench_baseline.local.json nếu có, '
+                                           'không thì bench_baseline.json; --save ghi bench_baseline.local.json)')
+    parser.add_argument('--save', action='store_true', help='ghi kết quả lần đo này làm baseline mới')
+    args = parser.parse_args()
+
+    try:
+        cases = [parse_case(text) for text in args.cases or (FULL_CASES if args.full else QUICK_CASES)]
+        tolerances = parse_tolerances(args.tolerance)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.baseline is None:
+        args.baseline = LOCAL_BASELINE_PATH if args.save or os.path.exists(LOCAL_BASELINE_PATH) else BASELINE_PATH
+    baseline = load_baseline(args.baseline)
+    same_machine = baseline is not None and baseline.get('machine') == machine_info()
+    metrics = METRICS if same_machine else PORTABLE_METRICS
+    if baseline and not same_machine:
+        print(f"Baseline đo trên máy khác ({baseline.get('machine')}): chỉ so {', '.join(metrics)}")
+
+    print(f"{'trường hợp':<20}{'nguội (s)':>10}{'ấm (s)':>9}{'mục/s':>9}{'đỉnh RSS (MB)':>15}{'đầu ra (KB)':>13}")
+    results = {}
+    for case in cases:
+        result = results[case_key(case)] = measure_case(case, repeat=args.repeat)
+        rate = result.get('tables_per_s', result.get('images_per_s'))
+        print(f"{case_key(case):<20}{result['cold_s']:>10.2f}{result['warm_s']:>9.2f}{rate:>9.1f}"
+              f"{result['peak_rss_mb']:>15.1f}{result['output_bytes'] / 1024:>13.1f}")
+    if not args.no_startup:
+        for key, command in STARTUP_COMMANDS.items():
+            result = results[key] = measure_startup(command)
+            print(f"{key:<28}{result['startup_ms']:>8.1f} ms")
+
+    if args.save:
+        # Giữ kết quả của các trường hợp không đo lần này (nếu baseline cũ đo trên cùng máy)
+        merged = dict(baseline['cases']) if same_machine else {}
+        merged.update(results)
+        print(f'Đã ghi baseline vào {save_baseline(args.baseline, merged)}')
+        return 0
+    if baseline is None:
+        print(f'Chưa có baseline ({args.baseline}); chạy lại với --save để lưu.')
+        return 0
+    regressions = compare(results, baseline, tolerances, metrics)
+    for key, metric, before, after, change in regressions:
+        print(f'CHẬM ĐI: {key} {metric}: {before} -> {after} (+{change:.0%})')
+    if not regressions:
+        print('Không có chỉ số nào vượt dung sai so với baseline.')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Đo chi phí dựng mỗi bảng trong database_schema.docx theo số lượng bảng.
+
+Chạy: python bench_schema_docx.py [--sizes 40 500 1000 5000] [--proxy] [--legacy] [--check]
+
+Với bộ dựng nối đuôi, thời gian trên mỗi bảng phải gần như không đổi từ 40 tới
+5.000 bảng. Cờ --proxy chạy thêm cách điền từng ô qua đối tượng proxy của
+python-docx, --legacy chạy vòng lặp cũ (chèn đoạn tạm rồi xóa qua
+doc.paragraphs[-1]) để so sánh. Cờ --check kiểm tra document.xml do template XML
+sinh ra giống hệt cách dựng bằng proxy.
+"""
+import argparse
+import time
+
+from docx import Document
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt
+
+from doctools.docx_append import BodyAppender
+from doctools.schema_docx import COLUMN_WIDTHS, HEADER, add_schema_tables
+
+
+def synthetic_schema(n_tables, n_fields=8):
+    return [
+        {
+            'name': f'Bảng thử {i} (table_{i})',
+            'fields': [
+                (f'column_{j}', 'varchar(255)', 'PK' if j == 0 else '', f'Mô tả cột {j} <a & b>' if j % 3 else '')
+                for j in range(n_fields)
+            ],
+        }
+        for i in range(n_tables)
+    ]
+
+
+def new_document():
+    doc = Document()
+    bang_style = doc.styles.add_style('bang', 1)
+    bang_style.font.name = 'Times New Roman'
+    bang_style.font.size = Pt(13)
+    return doc
+
+
+def proxy_add_schema_tables(doc, db_schema):
+    """Điền từng ô qua đối tượng proxy của python-docx, dùng làm chuẩn đối chiếu."""
+    body = BodyAppender(doc)
+    for table_counter, table in enumerate(db_schema, 1):
+        p = body.add_paragraph(f"Bảng 4.{table_counter} {table['name']}", style='bang')
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        t = body.add_table(rows=1, cols=len(HEADER), style='Table Grid')
+        t.alignment = WD_TABLE_ALIGNMENT.RIGHT
+        for column, width in zip(t.columns, COLUMN_WIDTHS):
+            column.width = width
+        for cell, text in zip(t.rows[0].cells, HEADER):
+            cell.text = text
+        for idx, field in enumerate(table['fields'], 1):
+            row_cells = t.add_row().cells
+            row_cells[0].text = str(idx)
+            for cell, value in zip(row_cells[1:], field):
+                cell.text = value
+        body.add_paragraph()
+
+
+def legacy_add_schema_tables(doc, db_schema):
+    """Vòng lặp trước đây, giữ lại chỉ để so sánh."""
+    for table_counter, table in enumerate(db_schema, 1):
+        p = doc.add_paragraph(f"Bảng 4.{table_counter} {table['name']}", style='bang')
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        t = doc.add_table(rows=1, cols=len(HEADER))
+        t.alignment = WD_TABLE_ALIGNMENT.RIGHT
+        t.style = 'Table Grid'
+        for column, width in zip(t.columns, COLUMN_WIDTHS):
+            column.width = width
+        paragraph = doc.add_paragraph()
+        paragraph._p.addnext(t._element)
+        doc.paragraphs[-1]._element.getparent().remove(paragraph._element)
+        for cell, text in zip(t.rows[0].cells, HEADER):
+            cell.text = text
+        for idx, field in enumerate(table['fields'], 1):
+            row_cells = t.add_row().cells
+            row_cells[0].text = str(idx)
+            for cell, value in zip(row_cells[1:], field):
+                cell.text = value
+        doc.add_paragraph()
+
+
+def measure(builder, n_tables):
+    db_schema = synthetic_schema(n_tables)
+    doc = new_document()
+    start = time.perf_counter()
+    builder(doc, db_schema)
+    return time.perf_counter() - start
+
+
+def check_equivalent(n_tables=40, db_schema=None):
+    """True nếu document.xml do template XML sinh ra giống hệt bản dựng bằng proxy."""
+    if db_schema is None:
+        db_schema = synthetic_schema(n_tables)
+        db_schema[0]['fields'].append(('tab\tcolumn', ' int ', 'FK', 'xuống\ndòng'))
+    fast, reference = new_document(), new_document()
+    add_schema_tables(fast, db_schema)
+    proxy_add_schema_tables(reference, db_schema)
+    return fast.element.xml == reference.element.xml
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[40, 500, 1000, 2000, 5000])
+    parser.add_argument('--proxy', action='store_true', help='chạy thêm cách điền ô qua proxy python-docx')
+    parser.add_argument('--legacy', action='store_true', help='chạy thêm vòng lặp cũ để so sánh')
+    parser.add_argument('--check', action='store_true', help='so sánh XML với cách dựng bằng proxy')
+    args = parser.parse_args()
+
+    if args.check:
+        print('XML giống hệt bản dựng bằng proxy:', check_equivalent())
+
+    builders = [('xml', add_schema_tables)]
+    if args.proxy:
+        builders.append(('proxy', proxy_add_schema_tables))
+    if args.legacy:
+        builders.append(('legacy', legacy_add_schema_tables))
+
+    print(f"{'builder':<8} {'tables':>7} {'total (s)':>10} {'per table (ms)':>15}")
+    for name, builder in builders:
+        for n_tables in args.sizes:
+            elapsed = measure(builder, n_tables)
+            print(f'{name:<8} {n_tables:>7} {elapsed:>10.3f} {elapsed / n_tables * 1000:>15.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Build các tài liệu sinh tự động: chỉ chạy lại target có đầu vào thay đổi, các target độc lập chạy song song.
+
+Chạy: python build.py [target ...] [--force] [--jobs N] [--dry-run]
+"""
+import argparse
+import os
+import sys
+import time
+
+from doctools.build_graph import BuildGraph, Target
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Đường dẫn tương đối với document/; mọi target phụ thuộc toàn bộ doctools/*.py
+TARGETS = (
+    Target(
+        'database_schema.docx',
+        outputs=('database_schema.docx', 'database_schema_summary.docx', 'database_schema_relations.docx'),
+        inputs=('generate_db_schema_docx.py', 'system_elearning.sql', 'schema_overlay.json',
+                'templates/report_base.dotx', 'doctools/*.py'),
+        command=('generate_db_schema_docx.py',),
+    ),
+    Target(
+        'bao_cao_chuong5.docx',
+        outputs=('bao_cao_chuong5.docx',),
+        inputs=('word_report_with_image.py', 'chuong5_manifest.json', 'images/**/*.png',
+                'templates/report_base.dotx', 'doctools/*.py'),
+        command=('word_report_with_image.py',),
+    ),
+    Target(
+        'README.md',
+        outputs=('../README.md',),
+        inputs=('generate_readme.py', '../backend/src/modules/**/*.ts', '../backend/src/entities/*.ts',
+                '../frontend/src/**/*.tsx', 'doctools/*.py'),
+        command=('generate_readme.py',),
+    ),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('targets', nargs='*', metavar='target',
+                        help='các target cần build (mặc định: tất cả): ' + ', '.join(t.name for t in TARGETS))
+    parser.add_argument('--force', action='store_true', help='build lại kể cả khi đầu vào không đổi')
+    parser.add_argument('--jobs', type=int, help='số target build song song (mặc định: tất cả)')
+    parser.add_argument('--dry-run', action='store_true', help='chỉ in các target cần build')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = BuildGraph(BASE_DIR, TARGETS)
+    try:
+        if args.dry_run:
+            for target, _, needed in graph.plan(args.targets, args.force):
+                print(f"{target.name}: {'cần build' if needed else 'không đổi'}")
+            return 0
+        results = graph.build(args.targets, args.force, args.jobs)
+    except KeyError as e:
+        parser.error(e.args[0])
+    for result in results:
+        if result.status == 'up-to-date':
+            print(f'{result.name}: không đổi')
+            continue
+        print(f'{result.name}: {"xong" if result.status == "built" else "LỖI"} ({result.seconds:.2f}s)')
+        if result.log.strip():
+            print('    ' + result.log.strip().replace('\n', '\n    '))
+    print(f'Tổng: {(time.perf_counter() - start) * 1000:.0f} ms')
+    return 1 if any(result.status == 'failed' for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Kiểm tra độ lệch giữa entity TypeORM (backend/src/entities), system_elearning.sql và schema_overlay.json.
+
+Chạy: python check_schema_drift.py [--kinds type relation ...] [--strict]
+"""
+import argparse
+import os
+import time
+from collections import Counter
+
+from doctools.entity_scan import scan_entities
+from doctools.schema_drift import compare_entities
+from doctools.sql_schema import load_overlay, load_schema_model
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SQL_PATH = os.path.join(BASE_DIR, 'system_elearning.sql')
+OVERLAY_PATH = os.path.join(BASE_DIR, 'schema_overlay.json')
+ENTITIES_DIR = os.path.join(BASE_DIR, '..', 'backend', 'src', 'entities')
+
+KINDS = ('table', 'column', 'type', 'nullable', 'relation', 'overlay')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', default=ENTITIES_DIR)
+    parser.add_argument('--sql', default=SQL_PATH)
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS), help='chỉ báo các loại lệch này')
+    parser.add_argument('--strict', action='store_true', help='trả mã lỗi 1 nếu có độ lệch')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entities, reparsed = scan_entities(args.entities)
+    findings = compare_entities(entities, load_schema_model(args.sql), load_overlay(OVERLAY_PATH))
+    findings = [f for f in findings if f.kind in args.kinds]
+    elapsed = (time.perf_counter() - start) * 1000
+
+    current = None
+    for finding in findings:
+        if finding.table != current:
+            current = finding.table
+            print(f'\n{current}')
+        column = f'{finding.column}: ' if finding.column else ''
+        print(f'  [{finding.kind}] {column}{finding.detail}')
+
+    counts = ', '.join(f'{kind} {n}' for kind, n in sorted(Counter(f.kind for f in findings).items()))
+    print(f'\n{len(entities)} entity (phân tích lại {reparsed} file), {len(findings)} độ lệch'
+          f'{f" ({counts})" if counts else ""}, {elapsed:.0f} ms')
+    if args.strict and findings:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
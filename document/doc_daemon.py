@@ -0,0 +1,136 @@
+"""Daemon giữ sẵn model CSDL, danh mục ảnh, template và cache fragment trong bộ nhớ, tự build lại khi lưu file.
+
+Daemon theo dõi đầu vào của database_schema.docx và bao_cao_chuong5.docx (khai
+báo trong build.py: system_elearning.sql, schema_overlay.json, images/,
+chuong5_manifest.json, template) và ghi lại tài liệu tương ứng trong khoảng
+một giây sau khi lưu.
+
+Chạy:
+  python doc_daemon.py serve [--interval S]   chạy daemon (Ctrl+C hoặc lệnh stop để dừng)
+  python doc_daemon.py build [target ...] [--force]
+  python doc_daemon.py status | follow | stop
+"""
+import argparse
+import os
+import sys
+
+from build import TARGETS
+from doctools.daemon import DEFAULT_INTERVAL, DEFAULT_SOCKET_PATH, request
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SQL_PATH = os.path.join(BASE_DIR, 'system_elearning.sql')
+OVERLAY_PATH = os.path.join(BASE_DIR, 'schema_overlay.json')
+MANIFEST_PATH = os.path.join(BASE_DIR, 'chuong5_manifest.json')
+CHAPTER_PATH = os.path.join(BASE_DIR, 'bao_cao_chuong5.docx')
+
+
+class WarmBuilders:
+    """Hàm build của từng target, dùng lại model và danh mục ảnh giữa các lần build.
+
+    Chỉ được gọi từ luồng build của daemon (kết nối SQLite gắn với luồng tạo ra nó).
+    """
+
+    def __init__(self):
+        # Import nặng một lần khi daemon khởi động, không phải mỗi lần build
+        from doctools.builders import build_schema_doc, build_screenshot_chapter
+        from doctools.figure_docx import new_report_document
+
+        self.build_schema_doc = build_schema_doc
+        self.build_screenshot_chapter = build_screenshot_chapter
+        new_report_document()  # nạp template vào cache của report_template
+        self.model = self.model_key = None
+        self.catalog = None
+
+    def schema(self):
+        from doctools.sql_schema import load_model
+
+        key = tuple((stat.st_mtime_ns, stat.st_size) for stat in map(os.stat, (SQL_PATH, OVERLAY_PATH)))
+        if key != self.model_key:
+            self.model, self.model_key = load_model([SQL_PATH], OVERLAY_PATH), key
+        results = self.build_schema_doc(self.model, BASE_DIR, workers=1)
+        return '\n'.join(f'Bảng ({profile}): {summary}' for profile, _, summary, _ in results if summary)
+
+    def chapter(self):
+        from doctools.image_catalog import ImageCatalog
+
+        if self.catalog is None:
+            self.catalog = ImageCatalog()
+        result = self.build_screenshot_chapter(MANIFEST_PATH, CHAPTER_PATH, workers=1, catalog=self.catalog)
+        return '\n'.join(f'Hình nhóm {code} ({count}): {summary}' for code, count, summary in result.groups if summary)
+
+
+def serve(args):
+    from doctools.daemon import BuildDaemon
+
+    warm = WarmBuilders()
+    builders = {'database_schema.docx': warm.schema, 'bao_cao_chuong5.docx': warm.chapter}
+    daemon = BuildDaemon(BASE_DIR, TARGETS, builders, socket_path=args.socket, interval=args.interval)
+    try:
+        daemon.run()
+    except RuntimeError as e:
+        print(e)
+        return 1
+    return 0
+
+
+def print_results(reply):
+    if 'error' in reply:
+        print(f"Lỗi: {reply['error']}")
+        return 1
+    for result in reply['results']:
+        if result['status'] == 'up-to-date':
+            print(f"{result['name']}: không đổi")
+            continue
+        print(f"{result['name']}: {'xong' if result['status'] == 'built' else 'LỖI'} ({result['seconds']:.2f}s)")
+        if result['log'].strip():
+            print('    ' + result['log'].strip().replace('\n', '\n    '))
+    return 1 if any(result['status'] == 'failed' for result in reply['results']) else 0
+
+
+def follow(socket_path):
+    """In từng lần build của daemon cho tới khi daemon dừng (Ctrl+C để thoát)."""
+    seq = request(socket_path, {'cmd': 'status'})['seq']
+    try:
+        while True:
+            for event in request(socket_path, {'cmd': 'wait', 'after': seq, 'timeout': 30})['events']:
+                print(f"[{event['at']}] {event['target']}: {event['status']} ({event['seconds']:.2f}s)")
+                seq = event['seq']
+    except KeyboardInterrupt:
+        return 0
+    except OSError:
+        print('Daemon đã dừng.')
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=('serve', 'build', 'status', 'follow', 'stop'))
+    parser.add_argument('targets', nargs='*', metavar='target', help='các target cần build (lệnh build)')
+    parser.add_argument('--force', action='store_true', help='build lại kể cả khi đầu vào không đổi (lệnh build)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help='chu kỳ kiểm tra thay đổi, giây (lệnh serve)')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='đường dẫn socket Unix của daemon')
+    args = parser.parse_intermixed_args()
+
+    if args.command == 'serve':
+        return serve(args)
+    try:
+        if args.command == 'build':
+            return print_results(request(args.socket, {'cmd': 'build', 'targets': args.targets, 'force': args.force}))
+        if args.command == 'stop':
+            request(args.socket, {'cmd': 'stop'})
+            print('Đã dừng daemon.')
+        elif args.command == 'status':
+            status = request(args.socket, {'cmd': 'status'})
+            for name, event in status['targets'].items():
+                print(f"{name}: {'chưa build' if event is None else event['status'] + ' lúc ' + event['at']}")
+        else:
+            return follow(args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f'Không kết nối được daemon tại {args.socket}; chạy "python doc_daemon.py serve" trước.')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Các công cụ dùng chung cho những script sinh tài liệu trong thư mục document/.
+
+API dựng tài liệu (xem builders) được export ở đây và chỉ import khi dùng lần
+đầu, nên `import doctools` không nạp python-docx hay Pillow:
+
+    from doctools import build_schema_doc, build_screenshot_chapter, load_model
+
+    build_schema_doc(load_model(['system_elearning.sql'], 'schema_overlay.json'), 'out/')
+    build_screenshot_chapter('chuong5_manifest.json', 'out/bao_cao_chuong5.docx')
+"""
+import importlib
+
+# Tên export -> module con chứa nó
+_EXPORTS = {
+    'build_schema_doc': 'builders',
+    'build_screenshot_chapter': 'builders',
+    'plan_screenshot_chapter': 'builders',
+    'load_model': 'sql_schema',
+    'Profiler': 'profiling',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,294 @@
+"""Benchmark đầu-cuối cho generate_db_schema_docx.py và word_report_with_image.py.
+
+Đầu vào được sinh tổng hợp theo kích thước: dump MySQL với N bảng, mỗi bảng C
+cột (kiểu, comment, index, khóa ngoại như dump thật) và các thư mục ảnh chụp
+màn hình PNG kích thước màn hình thật kèm manifest chương 5. Đầu vào được sinh
+một lần (theo seed) và giữ lại trong .cache/bench để các lần đo sau dùng lại.
+
+Mỗi trường hợp chạy script trong process con với DOCTOOLS_CACHE_DIR trỏ tới
+một thư mục cache trống (lần chạy nguội), rồi chạy lại với cache đó (lần chạy
+ấm). Kết quả gồm thời gian, thông lượng, đỉnh RSS (os.wait4, tính cả process
+con của script) và tổng kích thước file đầu ra; so sánh với baseline đã lưu
+theo dung sai tương đối, kèm ngưỡng tuyệt đối để bỏ qua nhiễu của các lần đo ngắn.
+Thời gian khởi động (--help, --dry-run) được đo riêng bằng measure_startup.
+"""
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+from .sql_schema import DEFAULT_CACHE_DIR
+
+# Tăng số này khi đổi cách sinh đầu vào: đầu vào cũ trong .cache/bench được sinh lại
+INPUT_VERSION = 1
+
+DOCUMENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_WORK_DIR = os.path.join(DEFAULT_CACHE_DIR, 'bench')
+
+# kind: 'schema' (size = số bảng, detail = số cột mỗi bảng) hoặc 'screens' (size = số ảnh, detail = số nhóm)
+Case = namedtuple('Case', 'kind size detail')
+
+# Chỉ số càng nhỏ càng tốt, được so với baseline; thông lượng chỉ để báo cáo (suy ra từ cold_s)
+METRICS = ('cold_s', 'warm_s', 'peak_rss_mb', 'output_bytes', 'startup_ms')
+# Chỉ số gần như không phụ thuộc tốc độ máy, vẫn so được với baseline đo trên máy khác
+PORTABLE_METRICS = ('peak_rss_mb', 'output_bytes')
+# Chênh lệch tuyệt đối dưới ngưỡng này không tính là chậm đi, dù vượt dung sai tương đối: chỉ đủ lọc
+# nhiễu đo (vài ms), nhỏ hơn nhiều so với trường hợp nhỏ nhất để không che mất chậm đi ở đó
+ABSOLUTE_SLACK = {'cold_s': 0.02, 'warm_s': 0.02, 'peak_rss_mb': 2.0, 'output_bytes': 0, 'startup_ms': 5.0}
+
+_COLUMN_TYPES = (
+    "int NOT NULL DEFAULT '0'",
+    'bigint DEFAULT NULL',
+    'varchar(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci NOT NULL',
+    'varchar(50) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci DEFAULT NULL',
+    'text CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci',
+    "tinyint(1) NOT NULL DEFAULT '1'",
+    "decimal(10,2) NOT NULL DEFAULT '0.00'",
+    "enum('active','inactive','pending') CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci DEFAULT 'active'",
+    'datetime DEFAULT NULL',
+    'json DEFAULT NULL',
+)
+_COMMENTS = ('Mã định danh', 'Trạng thái', 'Tên hiển thị', 'Ghi chú của người dùng', 'Thời điểm cập nhật cuối')
+_SCREEN_SIZES = ((1920, 1080), (1366, 768), (1440, 900), (1280, 720))
+
+
+def case_key(case):
+    return f'{case.kind}-{case.size}x{case.detail}'
+
+
+def parse_case(text):
+    """'schema:1000x20' hoặc 'screens:200x3' -> Case."""
+    kind, _, dims = text.partition(':')
+    size, _, detail = dims.partition('x')
+    if kind not in ('schema', 'screens') or not size.isdigit() or not detail.isdigit() \
+            or int(size) < 1 or int(detail) < 1:
+        raise ValueError(f'trường hợp không hợp lệ: {text!r} (dạng schema:BẢNGxCỘT hoặc screens:ẢNHxNHÓM, các số từ 1)')
+    return Case(kind, int(size), int(detail))
+
+
+def synthetic_dump(n_tables, n_columns, seed=0):
+    """Dump MySQL giả lập: mỗi bảng có id, tối đa 2 khóa ngoại tới bảng trước, n_columns cột tổng cộng."""
+    rng = random.Random(seed)
+    parts = ['-- Dump tổng hợp cho benchmark\n', '/*!40101 SET NAMES utf8mb4 */;\n\n']
+    for t in range(n_tables):
+        name = f'bench_table_{t:05d}'
+        lines = ['  `id` bigint NOT NULL AUTO_INCREMENT']
+        keys = ['  PRIMARY KEY (`id`)']
+        refs = rng.sample(range(t), min(t, 2)) if n_columns > 3 else []
+        for ref in refs:
+            column = f'table_{ref:05d}_id'
+            lines.append(f'  `{column}` bigint NOT NULL')
+            keys.append(f'  KEY `{column}` (`{column}`)')
+            keys.append(f'  CONSTRAINT `{name}_{ref:05d}_fk` FOREIGN KEY (`{column}`) '
+                        f'REFERENCES `bench_table_{ref:05d}` (`id`)')
+        for c in range(n_columns - 1 - len(refs)):
+            column = f'field_{c:03d}'
+            definition = f'  `{column}` {rng.choice(_COLUMN_TYPES)}'
+            if rng.random() < 0.4:
+                definition += f" COMMENT '{rng.choice(_COMMENTS)} {c}'"
+            lines.append(definition)
+            if c == 0:
+                keys.append(f'  UNIQUE KEY `{name}_{column}_unique` (`{column}`)')
+        parts.append(f'DROP TABLE IF EXISTS `{name}`;\nCREATE TABLE `{name}` (\n' + ',\n'.join(lines + keys)
+                     + '\n) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;\n\n')
+    return ''.join(parts)
+
+
+def synthetic_screenshot(path, size, seed):
+    """Ảnh giao diện giả lập: thanh tiêu đề, menu bên, các thẻ và dòng "chữ", nén PNG như ảnh chụp thật."""
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    width, height = size
+    accent = tuple(rng.randrange(40, 200) for _ in range(3))
+    image = Image.new('RGB', size, (245, 246, 248))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, width, 64), fill=accent)
+    draw.rectangle((0, 64, 240, height), fill=(33, 37, 41))
+    for y in range(96, height - 40, 36):
+        draw.rectangle((24, y, 24 + rng.randrange(80, 190), y + 12), fill=(173, 181, 189))
+    x, y = 272, 96
+    while y < height - 120:
+        card_w = rng.randrange(280, 520)
+        card_h = rng.randrange(120, 260)
+        if x + card_w > width - 32:
+            x, y = 272, y + card_h + 24
+            continue
+        draw.rectangle((x, y, x + card_w, y + card_h), fill=(255, 255, 255), outline=(222, 226, 230))
+        for line in range(y + 20, y + card_h - 16, 18):
+            # "Chữ" có độ dài và nhiễu ngẫu nhiên để kích thước PNG gần với ảnh chụp thật
+            end = x + 16 + rng.randrange(card_w // 3, card_w - 32)
+            for word in range(x + 16, end, 9):
+                if rng.random() < 0.85:
+                    shade = rng.randrange(30, 110)
+                    draw.rectangle((word, line, word + rng.randrange(3, 8), line + 9), fill=(shade, shade, shade))
+        x += card_w + 24
+    image.save(path, 'PNG', optimize=False)
+
+
+def _inputs_ready(folder, meta):
+    try:
+        with open(os.path.join(folder, 'inputs.json'), encoding='utf-8') as f:
+            return json.load(f) == meta
+    except (OSError, ValueError):
+        return False
+
+
+def _mark_ready(folder, meta):
+    with open(os.path.join(folder, 'inputs.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+
+def prepare_inputs(case, work_dir=DEFAULT_WORK_DIR, seed=0):
+    """Sinh (hoặc dùng lại) đầu vào của một trường hợp; trả về đường dẫn dump SQL hoặc manifest."""
+    folder = os.path.join(work_dir, 'inputs', case_key(case))
+    meta = {'version': INPUT_VERSION, 'case': list(case), 'seed': seed}
+    target = os.path.join(folder, 'schema.sql' if case.kind == 'schema' else 'manifest.json')
+    if _inputs_ready(folder, meta):
+        return target
+    shutil.rmtree(folder, ignore_errors=True)
+    os.makedirs(folder)
+    if case.kind == 'schema':
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(synthetic_dump(case.size, case.detail, seed))
+    else:
+        rng = random.Random(seed)
+        groups, descriptions = [], {}
+        for g in range(case.detail):
+            group_dir = os.path.join(folder, f'nhom{g + 1}')
+            os.makedirs(group_dir)
+            groups.append({'folder': f'nhom{g + 1}', 'code': f'5.{g + 1}', 'title': f'Giao diện nhóm {g + 1}',
+                           'order': []})
+        for i in range(case.size):
+            group = groups[i % case.detail]
+            name = f'Màn hình {i + 1:04d}.png'
+            path = os.path.join(folder, group['folder'], name)
+            if i >= 20 and i % 20 == 0:
+                # Khoảng 5% ảnh trùng một ảnh trước đó (cùng màn hình chụp lại), như bộ ảnh thật
+                previous = rng.randrange(i - 20, i)
+                shutil.copyfile(os.path.join(folder, groups[previous % case.detail]['folder'],
+                                             f'Màn hình {previous + 1:04d}.png'), path)
+            else:
+                synthetic_screenshot(path, _SCREEN_SIZES[i % len(_SCREEN_SIZES)], seed * 1_000_003 + i)
+            group['order'].append(name)
+            descriptions[name] = f'Màn hình số {i + 1} của {group["title"].lower()}, mô tả chức năng chính.'
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump({'groups': groups, 'descriptions': descriptions}, f, ensure_ascii=False, indent=2)
+    _mark_ready(folder, meta)
+    return target
+
+
+def run_measured(command, env, log_path):
+    """Chạy lệnh, trả về (giây, đỉnh RSS MB); đỉnh RSS lấy từ os.wait4 nên tính cả process con đã kết thúc."""
+    with open(log_path, 'ab') as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(command, cwd=DOCUMENT_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        seconds = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, command)
+    # Linux trả ru_maxrss theo KB, macOS theo byte
+    peak = usage.ru_maxrss / (2**20 if sys.platform == 'darwin' else 2**10)
+    return seconds, peak
+
+
+def _command(case, input_path, out_dir):
+    if case.kind == 'schema':
+        return [sys.executable, 'generate_db_schema_docx.py', '--sql', input_path, '--out-dir', out_dir]
+    return [sys.executable, 'word_report_with_image.py', '--manifest', input_path,
+            '--out', os.path.join(out_dir, 'bao_cao_chuong5.docx')]
+
+
+def _output_bytes(out_dir):
+    with os.scandir(out_dir) as it:
+        return sum(entry.stat().st_size for entry in it if entry.name.endswith('.docx'))
+
+
+def measure_case(case, work_dir=DEFAULT_WORK_DIR, repeat=1, seed=0):
+    """Đo một trường hợp `repeat` lần (mỗi lần một cặp chạy nguội + ấm), lấy thời gian nhỏ nhất."""
+    input_path = prepare_inputs(case, work_dir, seed)
+    run_dir = os.path.join(work_dir, 'run')
+    log_path = os.path.join(work_dir, f'{case_key(case)}.log')
+    if os.path.exists(log_path):
+        os.remove(log_path)
+    cold, warm, peaks = [], [], []
+    for _ in range(repeat):
+        shutil.rmtree(run_dir, ignore_errors=True)
+        out_dir = os.path.join(run_dir, 'out')
+        os.makedirs(out_dir)
+        env = dict(os.environ, DOCTOOLS_CACHE_DIR=os.path.join(run_dir, 'cache'))
+        command = _command(case, input_path, out_dir)
+        for times in (cold, warm):
+            seconds, peak = run_measured(command, env, log_path)
+            times.append(seconds)
+            peaks.append(peak)
+        output_bytes = _output_bytes(out_dir)
+    shutil.rmtree(run_dir, ignore_errors=True)
+    result = {
+        'cold_s': round(min(cold), 4),
+        'warm_s': round(min(warm), 4),
+        'peak_rss_mb': round(max(peaks), 1),
+        'output_bytes': output_bytes,
+    }
+    unit = 'tables_per_s' if case.kind == 'schema' else 'images_per_s'
+    result[unit] = round(case.size / result['cold_s'], 1)
+    return result
+
+
+def measure_startup(args, repeat=10):
+    """Thời gian khởi động (ms, nhỏ nhất trong `repeat` lần) của `python <args>`, ví dụ một script với --help."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=DOCUMENT_DIR, stdout=subprocess.DEVNULL, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {'startup_ms': round(best * 1000, 1)}
+
+
+def machine_info():
+    return {'python': platform.python_version(), 'platform': platform.platform(), 'cpus': os.cpu_count()}
+
+
+def load_baseline(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path, results):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'machine': machine_info(), 'cases': results}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+    return path
+
+
+def compare(results, baseline, tolerances, metrics=METRICS):
+    """Các chỉ số chậm/lớn hơn baseline quá dung sai: (trường hợp, chỉ số, baseline, hiện tại, tỉ lệ thay đổi).
+
+    `tolerances` là {chỉ số: dung sai tương đối}, khóa None là dung sai mặc định.
+    """
+    regressions = []
+    for key, result in results.items():
+        old = baseline['cases'].get(key)
+        if old is None:
+            continue
+        for metric in metrics:
+            if metric not in old:
+                continue
+            before, after = old[metric], result[metric]
+            change = (after - before) / before if before else 0.0
+            limit = tolerances.get(metric, tolerances[None])
+            if change > limit and after - before > ABSOLUTE_SLACK[metric]:
+                regressions.append((key, metric, before, after, change))
+    return regressions
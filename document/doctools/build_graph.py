@@ -0,0 +1,157 @@
+"""Đồ thị build cho các tài liệu sinh tự động: mỗi target khai báo rõ đầu vào, đầu ra và lệnh chạy.
+
+Khóa của một target là hash của lệnh, danh sách đầu ra và nội dung mọi file
+đầu vào. Hash từng file được nhớ theo (mtime, kích thước) trong file trạng
+thái, nên lần build không có gì thay đổi chỉ tốn vài lệnh stat; target có khóa
+không đổi và đầu ra còn nguyên được bỏ qua. Các target cần build chạy song song
+(mỗi target là một process con chạy script tương ứng).
+"""
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .sql_schema import DEFAULT_CACHE_DIR
+
+# Tăng số này khi đổi cách tính khóa để mọi target được build lại
+BUILD_VERSION = 1
+
+DEFAULT_STATE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'build-state.json')
+
+# outputs, inputs (glob, hỗ trợ **) và command (script + tham số) đều tương đối với thư mục gốc của build
+Target = namedtuple('Target', 'name outputs inputs command')
+# status: 'up-to-date', 'built' hoặc 'failed'; log: stdout + stderr của lệnh
+BuildResult = namedtuple('BuildResult', 'name status seconds log')
+
+
+def _stamp(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class FileHasher:
+    """sha256 của file, chỉ đọc lại file khi (mtime, kích thước) thay đổi."""
+
+    def __init__(self, known=None):
+        self.known = dict(known or {})
+
+    def digest(self, path):
+        stamp = _stamp(path)
+        if stamp is None:
+            return None
+        cached = self.known.get(path)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        self.known[path] = stamp + [digest.hexdigest()]
+        return digest.hexdigest()
+
+
+def expand_inputs(root, patterns):
+    """Các file đầu vào (tương đối với `root`, đã sắp); mẫu không có ký tự glob được giữ kể cả khi chưa tồn tại."""
+    paths = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.update(os.path.relpath(path, root)
+                         for path in glob.glob(os.path.join(root, pattern), recursive=True) if os.path.isfile(path))
+        else:
+            paths.add(os.path.normpath(pattern))
+    return sorted(paths)
+
+
+class BuildGraph:
+    def __init__(self, root, targets, state_path=DEFAULT_STATE_PATH):
+        self.root = root
+        self.targets = {target.name: target for target in targets}
+        self.state_path = state_path
+        try:
+            with open(state_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        if state.get('version') != BUILD_VERSION:
+            state = {}
+        self.hasher = FileHasher(state.get('files'))
+        self.built = state.get('targets', {})
+
+    def _path(self, relpath):
+        return os.path.normpath(os.path.join(self.root, relpath))
+
+    def target_key(self, target):
+        digest = hashlib.sha256(repr((BUILD_VERSION, tuple(target.command), tuple(target.outputs))).encode())
+        for relpath in expand_inputs(self.root, target.inputs):
+            digest.update(f'{relpath}\0{self.hasher.digest(self._path(relpath))}\0'.encode())
+        return digest.hexdigest()
+
+    def is_stale(self, target, key):
+        record = self.built.get(target.name)
+        if not record or record['key'] != key:
+            return True
+        # Đầu ra bị xóa hoặc sửa tay sau lần build trước cũng phải build lại
+        return any(_stamp(self._path(out)) != record['outputs'].get(out) for out in target.outputs)
+
+    def plan(self, names=None, force=False):
+        """Các cặp (target, khóa, cần build) theo thứ tự khai báo."""
+        names = names or list(self.targets)
+        unknown = [name for name in names if name not in self.targets]
+        if unknown:
+            raise KeyError(f"không có target: {', '.join(unknown)}")
+        planned = []
+        for name in names:
+            target = self.targets[name]
+            key = self.target_key(target)
+            planned.append((target, key, force or self.is_stale(target, key)))
+        return planned
+
+    def _run(self, target):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, *target.command], cwd=self.root, capture_output=True, text=True)
+        status = 'built' if proc.returncode == 0 else 'failed'
+        return BuildResult(target.name, status, time.perf_counter() - start, proc.stdout + proc.stderr)
+
+    def build(self, names=None, force=False, jobs=None):
+        """Build các target cần thiết (song song), ghi lại trạng thái; trả về các BuildResult theo thứ tự."""
+        planned = self.plan(names, force)
+        stale = [target for target, _, needed in planned if needed]
+        results = {}
+        if len(stale) == 1 or jobs == 1:
+            results = {target.name: self._run(target) for target in stale}
+        elif stale:
+            with ThreadPoolExecutor(max_workers=jobs or len(stale)) as pool:
+                results = dict(zip((target.name for target in stale), pool.map(self._run, stale)))
+        for target, key, needed in planned:
+            result = results.get(target.name)
+            if result is not None and result.status == 'built':
+                self.record(target, key)
+        self.save()
+        return [results.get(target.name) or BuildResult(target.name, 'up-to-date', 0.0, '')
+                for target, _, _ in planned]
+
+    def record(self, target, key):
+        """Ghi nhận target vừa build xong; `key` là khóa tính trước khi build.
+
+        Đầu vào bị sửa trong lúc build sẽ khiến lần sau build lại. Trạng thái chỉ
+        được ghi ra đĩa khi gọi save().
+        """
+        self.built[target.name] = {
+            'key': key,
+            'outputs': {out: _stamp(self._path(out)) for out in target.outputs},
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': BUILD_VERSION, 'files': self.hasher.known, 'targets': self.built}, f)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,119 @@
+"""API thư viện của hai tài liệu sinh tự động: tài liệu CSDL và chương 5 (ảnh chụp màn hình).
+
+Hai script generate_db_schema_docx.py và word_report_with_image.py chỉ còn
+phần đọc tham số và in kết quả, phần dựng tài liệu nằm ở đây để có thể gọi từ
+code khác. Module này chỉ import thư viện chuẩn; python-docx, Pillow và
+process pool chỉ được import khi gọi hàm dựng, nên `--help` hay `--dry-run`
+của các script không phải trả chi phí đó.
+"""
+import os
+from collections import namedtuple
+from contextlib import nullcontext
+
+from .sql_schema import DEFAULT_CACHE_DIR, PROFILE_OUTPUTS, load_model
+
+DOCUMENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Overlay mô tả dùng khi build_schema_doc nhận đường dẫn dump thay vì model
+DEFAULT_OVERLAY_PATH = os.path.join(DOCUMENT_DIR, 'schema_overlay.json')
+FIGURE_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'figure_fragments')
+
+# changes: thống kê cập nhật danh mục ảnh; images: số hình; reprocessed: số ảnh xử lý lại (None nếu
+# không xử lý ảnh); dedup: thống kê gộp ảnh trùng (None nếu tắt); groups: [(số mục, số hình, thống kê cache)]
+ChapterResult = namedtuple('ChapterResult', 'out changes images reprocessed dedup groups')
+
+
+def build_schema_doc(model, out, profiles=None, stream=False, use_cache=True, workers=None, profile_options=None):
+    """Sinh các tài liệu CSDL vào thư mục `out`; trả về [(profile, file, thống kê cache, report)].
+
+    `model` là kết quả của load_model, hoặc một/nhiều đường dẫn dump MySQL (ghép
+    với overlay mặc định).
+    """
+    from .schema_profiles import render_profiles
+
+    if isinstance(model, (str, os.PathLike)):
+        model = [model]
+    if not isinstance(model, dict):
+        model = load_model(model, DEFAULT_OVERLAY_PATH)
+    os.makedirs(out, exist_ok=True)
+    return render_profiles(model, profiles or list(PROFILE_OUTPUTS), out, stream=stream, use_cache=use_cache,
+                           workers=workers, profile_options=profile_options)
+
+
+def plan_screenshot_chapter(manifest, rescan=False, catalog=None):
+    """Cập nhật danh mục ảnh và sắp các hình theo manifest; trả về (thống kê danh mục, [(nhóm, [Figure])]).
+
+    Mỗi thư mục được quét lại, nhưng chỉ file mới hoặc có kích thước/mtime thay đổi bị đọc lại.
+    Không truyền `catalog` thì mở danh mục mặc định và đóng lại sau khi dùng.
+    """
+    from .figure_manifest import iter_figures, load_manifest
+    from .image_catalog import ImageCatalog
+
+    compiled = load_manifest(manifest)
+    with ImageCatalog() if catalog is None else nullcontext(catalog) as catalog:
+        changes = catalog.refresh([group['path'] for group in compiled['groups']], force=rescan)
+        return changes, list(iter_figures(compiled, catalog))
+
+
+def build_screenshot_chapter(manifest, out, dpi=None, prep=True, dedup=True, near_dup=None, use_cache=True,
+                             rescan=False, workers=None, profiler=None, profile_options=None, catalog=None):
+    """Dựng chương 5 từ manifest ảnh chụp màn hình và ghi ra `out`; trả về ChapterResult.
+
+    `profiler` đo các giai đoạn ở process này, `profile_options` (tham số của
+    Profiler) bật đo trong process dựng từng nhóm.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .figure_docx import build_group_document, merge_documents, new_report_document
+    from .image_dedup import dedup_images
+    from .image_prep import DEFAULT_SETTINGS, prepare_images
+    from .profiling import NULL_PROFILER
+
+    profiler = profiler or NULL_PROFILER
+    doc = new_report_document()
+
+    with profiler.stage('load'):
+        changes, groups = plan_screenshot_chapter(manifest, rescan, catalog)
+
+    # Thu nhỏ, bỏ alpha và nén lại ảnh trước khi chèn (song song, có cache)
+    img_paths = [figure.path for group, figures in groups for figure in figures]
+    reprocessed = None
+    if not prep:
+        prepared = {path: path for path in img_paths}
+    else:
+        digests = {figure.path: figure.digest for group, figures in groups for figure in figures}
+        settings = DEFAULT_SETTINGS if dpi is None else DEFAULT_SETTINGS._replace(dpi=dpi)
+        with profiler.stage('prep'):
+            prepared, reprocessed = prepare_images(img_paths, settings=settings, workers=workers, digests=digests)
+
+    # Ảnh trùng (hoặc gần giống, nếu có near_dup) dùng chung một phần media trong file Word
+    stats = None
+    if dedup:
+        with profiler.stage('dedup'):
+            canonical, stats = dedup_images([prepared[path] for path in img_paths], max_distance=near_dup)
+        prepared = {path: canonical[prepared[path]] for path in img_paths}
+
+    # Mỗi nhóm (người học, giảng viên, quản trị viên) được dựng thành tài liệu con trong process
+    # riêng, sau đó ghép lại: ảnh được nhúng lại, rId/id đối tượng vẽ và số hình được đánh lại
+    jobs = []
+    for group, figures in groups:
+        cache_path = None
+        if use_cache:
+            cache_path = os.path.join(FIGURE_CACHE_DIR, f"bao_cao_chuong5-{group['code']}.pickle")
+        jobs.append((group['code'], group['title'],
+                     [(figure.idx, figure.name, figure.description, prepared[figure.path]) for figure in figures],
+                     cache_path, profile_options))
+    with profiler.stage('groups'):
+        if len(jobs) <= 1 or workers == 1:
+            results = [build_group_document(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers or len(jobs)) as pool:
+                futures = [pool.submit(build_group_document, *job) for job in jobs]
+                results = [future.result() for future in futures]
+    for job, (_, _, _, report) in zip(jobs, results):
+        profiler.merge(report, f'{job[0]}/')
+    merge_documents(doc, [blob for blob, _, _, _ in results], profiler=profiler)
+
+    with profiler.stage('save'):
+        doc.save(out)
+    return ChapterResult(out, changes, len(img_paths), reprocessed, stats,
+                         [(job[0], count, summary) for job, (_, count, summary, _) in zip(jobs, results)])
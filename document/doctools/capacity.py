@@ -0,0 +1,141 @@
+"""Ước tính dung lượng lưu trữ MySQL/InnoDB từ kiểu cột và các khóa đã khai báo.
+
+Độ rộng hàng và kích thước chỉ mục trên mỗi hàng được tính cho từng bảng, sau đó
+nhân với các kịch bản số hàng (10^5 .. 10^9) trong một phép nhân ma trận NumPy.
+Các con số là ước lượng để chọn cấu hình máy chủ, không thay thế đo thực tế.
+"""
+import csv
+import re
+
+import numpy as np
+
+# Kịch bản số hàng mặc định: 10^5, 10^6, ..., 10^9
+DEFAULT_ROW_COUNTS = np.logspace(5, 9, 5)
+# Các bảng tăng nhanh nhất, được nêu riêng trong báo cáo
+HOT_TABLES = ('messages', 'notifications', 'session_attendances')
+
+# Byte cố định theo kiểu (InnoDB, định dạng hàng DYNAMIC)
+FIXED_WIDTHS = {
+    'tinyint': 1, 'smallint': 2, 'mediumint': 3, 'int': 4, 'bigint': 8,
+    'float': 4, 'double': 8, 'date': 3, 'time': 3, 'year': 1,
+    'datetime': 5, 'timestamp': 4, 'enum': 1, 'set': 1, 'bool': 1, 'boolean': 1,
+}
+# Độ dài trung bình giả định cho cột độ dài thay đổi
+VARCHAR_FILL = 0.5        # tỷ lệ lấp đầy trung bình của varchar(n)
+BYTES_PER_CHAR = 1.3      # utf8mb4, phần lớn nội dung tiếng Việt/ASCII
+TEXT_AVG_BYTES = 400      # text, mediumtext: phần lớn mô tả/nội dung ngắn
+JSON_AVG_BYTES = 300
+# Overhead mỗi bản ghi: header 5 byte + DB_TRX_ID 6 byte + DB_ROLL_PTR 7 byte
+ROW_OVERHEAD = 18
+# Overhead mỗi bản ghi trong chỉ mục phụ
+INDEX_RECORD_OVERHEAD = 6
+# Tỉ lệ lấp đầy trang B-tree. InnoDB lấp khoảng 15/16 trang khi chèn tuần tự theo khóa chính, nhưng chỉ mục
+# phụ và bảng khóa UUID nhận chèn ngẫu nhiên, trang bị tách còn khoảng 1/2 tới 3/4; chọn 0.8 để ước tính
+# dung lượng không bị thấp hơn thực tế
+PAGE_FILL = 0.8
+
+_TYPE_RE = re.compile(r'(\w+)(?:\((\d+)(?:,(\d+))?\))?')
+
+
+def column_width(sql_type):
+    """Số byte trung bình của một giá trị cột theo kiểu trong system_elearning.sql."""
+    m = _TYPE_RE.match(sql_type.lower())
+    base, size, scale = m.group(1), m.group(2), m.group(3)
+    if base in FIXED_WIDTHS:
+        return FIXED_WIDTHS[base]
+    if base == 'decimal':
+        precision, scale = int(size or 10), int(scale or 0)
+        # 4 byte cho mỗi 9 chữ số, phần lẻ theo bảng của MySQL
+        leftover = (0, 1, 1, 2, 2, 3, 3, 4, 4, 4)
+        integer, fraction = precision - scale, scale
+        return sum(d // 9 * 4 + leftover[d % 9] for d in (integer, fraction))
+    if base in ('varchar', 'char', 'varbinary', 'binary'):
+        n = int(size or 255)
+        prefix = 1 if n * 4 <= 255 else 2
+        return prefix + n * VARCHAR_FILL * BYTES_PER_CHAR
+    if base == 'json':
+        return JSON_AVG_BYTES
+    if base.endswith('text') or base.endswith('blob'):
+        return TEXT_AVG_BYTES
+    return 8
+
+
+def _index_column_sets(table):
+    """Các chỉ mục phụ (không tính PRIMARY), kể cả chỉ mục InnoDB tự tạo cho khóa ngoại."""
+    indexes = [uk['columns'] for uk in table['unique_keys']] + [k['columns'] for k in table['keys']]
+    for fk in table['foreign_keys']:
+        if not any(cols[:len(fk['columns'])] == fk['columns'] for cols in indexes + [table['primary_key']]):
+            indexes.append(fk['columns'])
+    return indexes
+
+
+def table_widths(table):
+    """(byte trung bình mỗi hàng, byte chỉ mục phụ mỗi hàng) của một bảng."""
+    widths = {c['name']: column_width(c['raw_type'] if 'raw_type' in c else c['type']) for c in table['columns']}
+    nullable = sum(1 for c in table['columns'] if c['nullable'])
+    row = ROW_OVERHEAD + (nullable + 7) // 8 + sum(widths.values())
+    pk = sum(widths.get(c, 8) for c in table['primary_key']) or 6  # không có PK: InnoDB dùng row id 6 byte
+    index = sum(
+        INDEX_RECORD_OVERHEAD + pk + sum(widths.get(c, 8) for c in cols)
+        for cols in _index_column_sets(table)
+    )
+    return row, index
+
+
+def plan_capacity(tables, row_counts=DEFAULT_ROW_COUNTS):
+    """Ma trận dung lượng dữ liệu và chỉ mục (byte) cho mọi bảng × mọi kịch bản số hàng."""
+    widths = np.array([table_widths(t) for t in tables], dtype=np.float64).reshape(-1, 2)
+    row_counts = np.asarray(row_counts, dtype=np.float64)
+    # Một phép broadcast: (số bảng × 2 × 1) * (số kịch bản) -> (số bảng × 2 × số kịch bản)
+    volumes = (widths / PAGE_FILL)[:, :, np.newaxis] * row_counts
+    data, index = volumes[:, 0, :], volumes[:, 1, :]
+    return {
+        'tables': [t['name'] for t in tables],
+        'row_counts': row_counts,
+        'row_bytes': widths[:, 0],
+        'index_bytes': widths[:, 1],
+        'data': data,
+        'index': index,
+        'total': data + index,
+    }
+
+
+def format_bytes(n):
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if n < 1024 or unit == 'TB':
+            return f'{n:.0f} {unit}' if unit == 'B' else f'{n:.1f} {unit}'
+        n /= 1024
+
+
+def format_rows(n):
+    return f'10^{int(round(np.log10(n)))}' if n >= 10 else str(int(n))
+
+
+def table_rows(plan, i):
+    """Các dòng (số hàng, dữ liệu, chỉ mục, tổng) đã định dạng cho bảng thứ i trong plan."""
+    return [
+        (format_rows(rows), format_bytes(plan['data'][i, j]), format_bytes(plan['index'][i, j]),
+         format_bytes(plan['total'][i, j]))
+        for j, rows in enumerate(plan['row_counts'])
+    ]
+
+
+def capacity_by_table(plan):
+    """{tên bảng: (byte mỗi hàng, byte chỉ mục mỗi hàng, các dòng đã định dạng)} để đưa vào tài liệu."""
+    return {
+        name: (float(plan['row_bytes'][i]), float(plan['index_bytes'][i]), table_rows(plan, i))
+        for i, name in enumerate(plan['tables'])
+    }
+
+
+def write_csv(plan, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['table', 'row_bytes', 'index_bytes_per_row', 'rows', 'data_bytes', 'index_bytes', 'total_bytes'])
+        for i, name in enumerate(plan['tables']):
+            for j, rows in enumerate(plan['row_counts']):
+                writer.writerow([
+                    name, round(plan['row_bytes'][i], 1), round(plan['index_bytes'][i], 1), int(rows),
+                    int(plan['data'][i, j]), int(plan['index'][i, j]), int(plan['total'][i, j]),
+                ])
+    return path
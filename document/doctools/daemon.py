@@ -0,0 +1,267 @@
+"""Daemon build tài liệu chạy nền, nhận lệnh qua socket Unix.
+
+Daemon giữ sẵn trong bộ nhớ những gì mỗi lần chạy script phải làm lại: các
+module đã import (python-docx, Pillow), template đã nạp, model CSDL, kết nối
+danh mục ảnh. Các target (cùng khai báo với build.py) được theo dõi bằng cách
+hỏi BuildGraph định kỳ; nhờ hash nhớ theo (mtime, kích thước), mỗi lần hỏi chỉ
+tốn vài lệnh stat. Target có khóa đổi và giữ nguyên qua hai lần hỏi liên tiếp
+(file đã lưu xong) được build lại ngay trong process daemon, rồi ghi vào trạng
+thái của build.py để lần chạy build.py sau không build lại.
+
+Mọi lần build chạy trên một luồng duy nhất (luồng chính); luồng socket chỉ
+chuyển yêu cầu sang và chờ kết quả. Khi mã nguồn Python đã nạp thay đổi,
+daemon tự dừng vì code trong bộ nhớ đã cũ.
+
+Giao thức: mỗi yêu cầu là một dòng JSON {"cmd": ...}, daemon trả lời một dòng JSON.
+  status                                trạng thái các target và các sự kiện gần nhất
+  build  {"targets": [...], "force": b}  build ngay, trả về kết quả từng target
+  wait   {"after": seq, "timeout": s}    chờ sự kiện build có số thứ tự lớn hơn `after`
+  stop                                  dừng daemon
+"""
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from .build_graph import DEFAULT_STATE_PATH, BuildGraph, BuildResult
+from .sql_schema import DEFAULT_CACHE_DIR
+
+DEFAULT_SOCKET_PATH = os.path.join(DEFAULT_CACHE_DIR, 'daemon.sock')
+DEFAULT_INTERVAL = 0.2
+
+
+def _code_stamps(root):
+    """(mtime, kích thước) của mọi file .py đã import nằm dưới `root`."""
+    stamps = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if path and path.endswith('.py') and os.path.abspath(path).startswith(root + os.sep):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stat = None
+            stamps[path] = stat and (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+class _Job:
+    __slots__ = ('names', 'force', 'done', 'results')
+
+    def __init__(self, names, force):
+        self.names = names
+        self.force = force
+        self.done = threading.Event()
+        self.results = None
+
+
+class BuildDaemon:
+    """Theo dõi và build các target bằng `builders` ({tên target: hàm không tham số, trả về dòng log})."""
+
+    def __init__(self, root, targets, builders, socket_path=DEFAULT_SOCKET_PATH, interval=DEFAULT_INTERVAL,
+                 log=print, state_path=DEFAULT_STATE_PATH):
+        self.root = os.path.abspath(root)
+        self.graph = BuildGraph(self.root, [target for target in targets if target.name in builders], state_path)
+        self.builders = builders
+        self.socket_path = socket_path
+        self.interval = interval
+        self.log = log
+        self.last = {}  # tên target -> sự kiện build gần nhất
+        self.events = deque(maxlen=100)
+        self._seq = 0
+        self._changed = threading.Condition()
+        self._jobs = queue.Queue()
+        self._stop = threading.Event()
+        self._pending = {}  # target cần build -> khóa ở lần hỏi trước
+        self._failed = {}  # target build lỗi -> khóa lúc lỗi (không thử lại tới khi đầu vào đổi)
+        self._code = _code_stamps(self.root)
+
+    # Luồng chính: build theo yêu cầu và theo dõi thay đổi
+
+    def _build(self, names=None, force=False):
+        results = []
+        for target, key, needed in self.graph.plan(names, force):
+            if not needed:
+                results.append(BuildResult(target.name, 'up-to-date', 0.0, ''))
+                continue
+            start = time.perf_counter()
+            try:
+                log = self.builders[target.name]() or ''
+                status = 'built'
+                self.graph.record(target, key)
+                self._failed.pop(target.name, None)
+            except Exception:
+                log = traceback.format_exc()
+                status = 'failed'
+                self._failed[target.name] = key
+            result = BuildResult(target.name, status, time.perf_counter() - start, log)
+            results.append(result)
+            self._publish(result)
+        self.graph.save()
+        return results
+
+    def _publish(self, result):
+        with self._changed:
+            self._seq += 1
+            event = {'seq': self._seq, 'target': result.name, 'status': result.status,
+                     'seconds': round(result.seconds, 3), 'at': time.strftime('%H:%M:%S')}
+            self.last[result.name] = event
+            self.events.append(event)
+            self._changed.notify_all()
+        self.log(f"[{event['at']}] {result.name}: {result.status} ({result.seconds:.2f}s)")
+        if result.status == 'failed' or result.log.strip():
+            self.log('    ' + result.log.strip().replace('\n', '\n    '))
+
+    def _code_changed(self):
+        current = _code_stamps(self.root)
+        if any(path in self._code and self._code[path] != stamp for path, stamp in current.items()):
+            return True
+        # Module import muộn (lúc build lần đầu) được ghi nhận từ lần đầu thấy
+        self._code.update((path, stamp) for path, stamp in current.items() if path not in self._code)
+        return False
+
+    def _poll(self):
+        if self._code_changed():
+            self.log('Mã nguồn Python đã thay đổi, daemon dừng; hãy khởi động lại.')
+            self._stop.set()
+            return
+        try:
+            planned = self.graph.plan()
+        except Exception:
+            # Ví dụ file đang được lưu dở không đọc được: ghi log, lần hỏi sau thử lại
+            self.log('Lỗi khi kiểm tra đầu vào:\n    ' + traceback.format_exc().strip().replace('\n', '\n    '))
+            return
+        stale = {target.name: key for target, key, needed in planned
+                 if needed and self._failed.get(target.name) != key}
+        # Chỉ build khi khóa không đổi qua hai lần hỏi: file đang được ghi dở sẽ đợi lần sau
+        ready = [name for name, key in stale.items() if self._pending.get(name) == key]
+        self._pending = stale
+        if ready:
+            self._build(ready)
+
+    def run(self):
+        """Mở socket và chạy tới khi nhận lệnh stop (hoặc Ctrl+C)."""
+        if os.path.exists(self.socket_path):
+            try:
+                request(self.socket_path, {'cmd': 'status'}, timeout=1)
+            except OSError:
+                os.remove(self.socket_path)  # socket sót lại từ daemon đã chết
+            else:
+                raise RuntimeError(f'daemon đã chạy tại {self.socket_path}')
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        server = socketserver.ThreadingUnixStreamServer(self.socket_path, _handler(self))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.log(f"Daemon theo dõi {', '.join(self.graph.targets)} tại {self.socket_path}")
+        try:
+            try:
+                self._build()
+            except Exception:
+                self.log('Lỗi khi build lần đầu:\n    ' + traceback.format_exc().strip().replace('\n', '\n    '))
+            while not self._stop.is_set():
+                try:
+                    job = self._jobs.get(timeout=self.interval)
+                except queue.Empty:
+                    self._poll()
+                    continue
+                try:
+                    job.results = self._build(job.names, job.force)
+                except KeyError as e:
+                    job.results = e.args[0]
+                except Exception as e:
+                    job.results = f'lỗi khi kiểm tra đầu vào: {e}'
+                job.done.set()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+            server.server_close()
+            os.remove(self.socket_path)
+
+    # Các luồng socket
+
+    def submit(self, names=None, force=False):
+        job = _Job(names, force)
+        self._jobs.put(job)
+        while not job.done.wait(self.interval):
+            if self._stop.is_set():
+                return 'daemon đang dừng'
+        return job.results
+
+    def wait(self, after, timeout):
+        with self._changed:
+            self._changed.wait_for(lambda: self._seq > after or self._stop.is_set(), timeout)
+            return [event for event in self.events if event['seq'] > after]
+
+    def status(self):
+        with self._changed:
+            return {'targets': {name: self.last.get(name) for name in self.graph.targets},
+                    'events': list(self.events)[-10:], 'seq': self._seq}
+
+    def stop(self):
+        self._stop.set()
+        with self._changed:
+            self._changed.notify_all()
+
+
+def _targets_arg(message):
+    targets = message.get('targets') or None
+    if targets is not None and (not isinstance(targets, list) or not all(isinstance(t, str) for t in targets)):
+        raise TypeError('"targets" phải là danh sách tên target')
+    return targets
+
+
+def _number_arg(message, name, default):
+    value = message.get(name, default)
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        raise TypeError(f'"{name}" phải là số')
+    return value
+
+
+def _handler(daemon):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                message = json.loads(self.rfile.readline())
+                if not isinstance(message, dict):
+                    raise TypeError('yêu cầu phải là một đối tượng JSON')
+                cmd = message.get('cmd')
+                if cmd == 'status':
+                    reply = daemon.status()
+                elif cmd == 'build':
+                    results = daemon.submit(_targets_arg(message), bool(message.get('force')))
+                    if isinstance(results, str):
+                        reply = {'error': results}
+                    else:
+                        reply = {'results': [result._asdict() for result in results]}
+                elif cmd == 'wait':
+                    after, timeout = _number_arg(message, 'after', 0), _number_arg(message, 'timeout', None)
+                    reply = {'events': daemon.wait(after, timeout)}
+                elif cmd == 'stop':
+                    daemon.stop()
+                    reply = {'stopped': True}
+                else:
+                    reply = {'error': f'lệnh không hợp lệ: {cmd!r}'}
+            except (ValueError, TypeError, AttributeError, KeyError) as e:
+                reply = {'error': f'yêu cầu không hợp lệ: {e}'}
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    return Handler
+
+
+def request(socket_path, message, timeout=None):
+    """Gửi một yêu cầu tới daemon và trả về câu trả lời (dict)."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError('daemon đóng kết nối không trả lời')
+    return json.loads(line)
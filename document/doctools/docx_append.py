@@ -0,0 +1,43 @@
+"""Bộ dựng tài liệu chỉ nối thêm vào cuối body với chi phí O(1) mỗi lần.
+
+python-docx chèn mỗi đoạn/bảng mới bằng cách tìm lại `w:sectPr` trong body, còn
+`doc.paragraphs` dựng lại danh sách toàn bộ đoạn văn mỗi lần gọi. Với hàng nghìn
+bảng, hai thao tác đó làm thời gian tăng theo bình phương số bảng. Lớp dưới đây
+giữ sẵn tham chiếu tới phần tử cuối (`w:sectPr`) và chèn ngay trước nó.
+"""
+from docx.oxml import OxmlElement
+from docx.oxml.table import CT_Tbl
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+
+class BodyAppender:
+    def __init__(self, document):
+        self.document = document
+        self._body = document.element.body
+        self._container = document._body
+        # sectPr luôn là phần tử cuối của body; None nếu tài liệu không có
+        self._tail = self._body.sectPr
+        self._block_width = document._block_width
+
+    def append(self, element):
+        """Nối một phần tử XML (w:p, w:tbl, ...) vào cuối body."""
+        if self._tail is not None:
+            self._tail.addprevious(element)
+        else:
+            self._body.append(element)
+        return element
+
+    def add_paragraph(self, text='', style=None):
+        paragraph = Paragraph(self.append(OxmlElement('w:p')), self._container)
+        if text:
+            paragraph.add_run(text)
+        if style is not None:
+            paragraph.style = style
+        return paragraph
+
+    def add_table(self, rows, cols, style=None):
+        tbl = self.append(CT_Tbl.new_tbl(rows, cols, self._block_width))
+        table = Table(tbl, self._container)
+        table.style = style
+        return table
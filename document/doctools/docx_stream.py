@@ -0,0 +1,42 @@
+"""Ghi file .docx theo kiểu streaming: word/document.xml được ghi dần vào zip.
+
+`doc` chỉ là bộ khung (styles, section, các đoạn mở đầu nếu có); nội dung chính
+là một iterable các đoạn XML của body, được nén thẳng vào zip từng phần một.
+Nhờ vậy không cần dựng toàn bộ cây tài liệu trong bộ nhớ, bộ nhớ đỉnh không
+phụ thuộc vào số bảng.
+"""
+import io
+import zipfile
+
+DOCUMENT_PART = 'word/document.xml'
+
+
+def _split_document_xml(xml):
+    """Tách document.xml của bộ khung tại vị trí nối nội dung (ngay trước w:sectPr cuối body)."""
+    pos = xml.rfind(b'<w:sectPr')
+    if pos == -1:
+        pos = xml.rfind(b'</w:body>')
+    return xml[:pos], xml[pos:]
+
+
+def save_streaming(doc, out_path, fragments, encoding='utf-8'):
+    """Lưu `doc` ra `out_path`, chèn lần lượt các đoạn XML trong `fragments` vào cuối body."""
+    skeleton = io.BytesIO()
+    doc.save(skeleton)
+    skeleton.seek(0)
+    with zipfile.ZipFile(skeleton) as src, \
+            zipfile.ZipFile(out_path, 'w', compression=zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            if info.filename != DOCUMENT_PART:
+                dst.writestr(info, src.read(info))
+                continue
+            head, tail = _split_document_xml(src.read(info))
+            part_info = zipfile.ZipInfo(DOCUMENT_PART, date_time=info.date_time)
+            part_info.compress_type = zipfile.ZIP_DEFLATED
+            # Chưa biết trước kích thước; bật ZIP64 để không lỗi khi document.xml vượt 2 GiB
+            with dst.open(part_info, 'w', force_zip64=True) as part:
+                part.write(head)
+                for fragment in fragments:
+                    part.write(fragment.encode(encoding))
+                part.write(tail)
+    return out_path
@@ -0,0 +1,205 @@
+"""Đọc metadata TypeORM (@Entity, @Column, @ManyToOne, @JoinColumn, ...) từ backend/src/entities.
+
+Các file được đọc song song; kết quả phân tích từng file được cache theo
+(mtime, kích thước) và hash nội dung, nên lần kiểm tra lại khi không có file
+nào đổi chỉ tốn vài lệnh stat.
+"""
+import hashlib
+import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from .sql_schema import DEFAULT_CACHE_DIR
+
+# Tăng số này khi đổi cấu trúc kết quả để cache cũ tự hết hiệu lực
+SCANNER_VERSION = 1
+
+COLUMN_DECORATORS = {
+    'Column', 'PrimaryGeneratedColumn', 'PrimaryColumn', 'CreateDateColumn', 'UpdateDateColumn',
+    'DeleteDateColumn', 'VersionColumn',
+}
+RELATION_DECORATORS = {'ManyToOne', 'OneToOne', 'OneToMany', 'ManyToMany'}
+
+_DECORATOR_RE = re.compile(r'@(\w+)\s*\(')
+_PROPERTY_RE = re.compile(r'\s*(?:readonly\s+)?(\w+)\s*[?!]?\s*:\s*([^;=]+)')
+_CLASS_RE = re.compile(r'\bclass\s+(\w+)')
+_ENTITY_NAME_RE = re.compile(r"^\s*(?:'([^']+)'|\"([^\"]+)\"|\{[^}]*name\s*:\s*'([^']+)')")
+_OPTION_RE = {
+    'name': re.compile(r"\bname\s*:\s*'([^']+)'"),
+    'type': re.compile(r"\btype\s*:\s*'([^']+)'"),
+    'length': re.compile(r'\blength\s*:\s*(\d+)'),
+    'precision': re.compile(r'\bprecision\s*:\s*(\d+)'),
+    'scale': re.compile(r'\bscale\s*:\s*(\d+)'),
+    'nullable': re.compile(r'\bnullable\s*:\s*(true|false)'),
+    'unique': re.compile(r'\bunique\s*:\s*(true|false)'),
+}
+_FIRST_STRING_RE = re.compile(r"^\s*'([^']+)'")
+_TARGET_RE = re.compile(r'\(\s*\)\s*=>\s*(\w+)')
+
+# Kiểu MySQL mặc định TypeORM dùng khi @Column không khai báo type
+_TS_DEFAULT_TYPES = {'number': 'int', 'string': 'varchar(255)', 'boolean': 'tinyint(1)', 'Date': 'datetime'}
+_DECORATOR_DEFAULT_TYPES = {
+    'PrimaryGeneratedColumn': 'int',
+    'CreateDateColumn': 'datetime(6)',
+    'UpdateDateColumn': 'datetime(6)',
+    'DeleteDateColumn': 'datetime(6)',
+}
+
+
+def balanced_args(text, start):
+    """Trả về (nội dung trong ngoặc, vị trí sau dấu đóng ngoặc) bắt đầu từ `start` (ngay sau '(')."""
+    depth, i, quote = 1, start, None
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in '\'"`':
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                return text[start:i], i + 1
+        i += 1
+    return text[start:], len(text)
+
+
+def normalize_type(raw_type, length=None, precision=None, scale=None):
+    """Đưa kiểu TypeORM về dạng viết như trong system_elearning.sql (varchar(50), decimal(10,2), ...)."""
+    base = raw_type.lower()
+    if base in ('boolean', 'bool'):
+        return 'tinyint(1)'
+    if base == 'integer':
+        return 'int'
+    if base in ('varchar', 'char') and length:
+        return f'{base}({length})'
+    if base == 'varchar':
+        return 'varchar(255)'
+    if base == 'decimal' and precision:
+        return f'decimal({precision},{scale or 0})'
+    if base == 'tinyint' and length:
+        return f'tinyint({length})'
+    return base
+
+
+def _column_info(decorator, args, prop, ts_type):
+    options = {key: m.group(1) for key, rx in _OPTION_RE.items() if (m := rx.search(args))}
+    declared = options.get('type')
+    if declared is None and decorator == 'Column' and (m := _FIRST_STRING_RE.match(args)):
+        declared = m.group(1)
+    if declared:
+        sql_type = normalize_type(declared, options.get('length'), options.get('precision'), options.get('scale'))
+    elif decorator in _DECORATOR_DEFAULT_TYPES:
+        sql_type = _DECORATOR_DEFAULT_TYPES[decorator]
+    elif options.get('length'):
+        sql_type = f"varchar({options['length']})"
+    else:
+        sql_type = _TS_DEFAULT_TYPES.get(ts_type.strip().split('|')[0].strip(), ts_type.strip())
+    return {
+        'name': options.get('name', prop),
+        'property': prop,
+        'type': sql_type,
+        'decorator': decorator,
+        # Kiểu mặc định của TypeORM (không khai báo type) dễ lệch với SQL hơn
+        'type_inferred': not declared,
+        'nullable': options.get('nullable') == 'true',
+        'unique': options.get('unique') == 'true',
+        'primary': decorator.startswith('Primary'),
+    }
+
+
+def parse_entity_source(text):
+    """Phân tích một file entity, trả về danh sách entity trong file."""
+    entities = []
+    current = None
+    pending = []
+    pos = 0
+    while True:
+        m = _DECORATOR_RE.search(text, pos)
+        if not m:
+            break
+        name = m.group(1)
+        args, pos = balanced_args(text, m.end())
+        if name == 'Entity':
+            class_match = _CLASS_RE.search(text, pos)
+            table = _ENTITY_NAME_RE.match(args)
+            current = {
+                'class': class_match.group(1) if class_match else None,
+                'table': next((g for g in table.groups() if g), None) if table else None,
+                'columns': [],
+                'relations': [],
+            }
+            entities.append(current)
+            pending = []
+            continue
+        pending.append((name, args))
+        # Gom các decorator liên tiếp, dừng ở khai báo thuộc tính
+        if _DECORATOR_RE.match(text[pos:].lstrip()):
+            continue
+        prop = _PROPERTY_RE.match(text, pos)
+        if current is None or not prop:
+            pending = []
+            continue
+        prop_name, ts_type = prop.group(1), prop.group(2)
+        join_column = None
+        for dec_name, dec_args in pending:
+            if dec_name == 'JoinColumn':
+                join = _OPTION_RE['name'].search(dec_args)
+                join_column = join.group(1) if join else None
+        for dec_name, dec_args in pending:
+            if dec_name in COLUMN_DECORATORS:
+                current['columns'].append(_column_info(dec_name, dec_args, prop_name, ts_type))
+            elif dec_name in RELATION_DECORATORS:
+                target = _TARGET_RE.search(dec_args)
+                current['relations'].append({
+                    'kind': dec_name,
+                    'property': prop_name,
+                    'target': target.group(1) if target else None,
+                    'join_column': join_column,
+                })
+        pending = []
+    return entities
+
+
+def _scan_file(path, cached):
+    stat = os.stat(path)
+    if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        return path, cached
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()
+    if cached and cached[1] == digest:
+        return path, ((stat.st_mtime_ns, stat.st_size), digest, cached[2])
+    return path, ((stat.st_mtime_ns, stat.st_size), digest, parse_entity_source(raw.decode('utf-8')))
+
+
+def scan_entities(entities_dir, cache_dir=DEFAULT_CACHE_DIR, workers=8):
+    """Đọc toàn bộ *.ts trong `entities_dir`, trả về (danh sách entity, số file phải phân tích lại)."""
+    cache_path = os.path.join(cache_dir, f'entities-v{SCANNER_VERSION}.pickle') if cache_dir else None
+    cache = {}
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cache = {}
+    entities_dir = os.path.abspath(entities_dir)
+    with os.scandir(entities_dir) as it:
+        paths = sorted(entry.path for entry in it if entry.is_file() and entry.name.endswith('.ts'))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = dict(pool.map(lambda p: _scan_file(p, cache.get(p)), paths))
+    reparsed = sum(1 for p in paths if cache.get(p) is None or cache[p][1] != results[p][1])
+    changed = set(cache) != set(paths) or any(results[p] is not cache.get(p) for p in paths)
+    if cache_path and changed:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    entities = [entity for p in paths for entity in results[p][2]]
+    return entities, reparsed
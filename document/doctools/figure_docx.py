@@ -0,0 +1,209 @@
+"""Dựng các hình (tiêu đề mục, ảnh, chú thích, mô tả) của báo cáo chương 5 dưới dạng đoạn XML.
+
+Mỗi hình được render thành một đoạn XML không chứa số hình, rId của ảnh và id
+của đối tượng vẽ; các giá trị này chỉ được điền ở bước ghép cuối cùng. Nhờ vậy
+đoạn XML có thể được cache theo hash ảnh + mô tả + vị trí, và khi sửa một mô tả
+chỉ hình đó phải render lại, số hình của cả chương vẫn được đánh lại đúng.
+
+Mỗi nhóm ảnh có thể được dựng thành một tài liệu con trong process riêng
+(build_group_document), sau đó merge_documents ghép các tài liệu con vào tài
+liệu chính: nhúng lại ảnh để lấy rId mới, đánh lại id đối tượng vẽ và số hình.
+"""
+import hashlib
+import io
+import os
+import re
+
+from docx import Document
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Inches
+
+from .docx_append import BodyAppender
+from .fragment_cache import FragmentCache, content_key
+from .image_pipeline import prefetch_images
+from .profiling import NULL_PROFILER, Profiler
+from .report_template import StyleRegistry, load_base_document
+from .schema_docx import BATCH_SIZE, append_fragments
+from .table_xml import paragraph_xml
+
+CAPTION_PREFIX = 'Hình 5.'
+_CAPTION_RE = re.compile(re.escape(CAPTION_PREFIX) + r'\d+')
+
+# Các ký tự đánh dấu chỗ điền khi ghép (không thể xuất hiện trong XML hợp lệ)
+_COUNTER = '\x00'
+_RID = '\x01'
+_SHAPE_ID = '\x02'
+
+# Namespace dùng trong các đoạn hình (a, pic được khai báo ngay trên wp:inline như python-docx)
+FIGURE_PREFIXES = ('w', 'wp', 'r')
+
+_INLINE = (
+    '<w:r><w:drawing><wp:inline ' + nsdecls('a', 'pic') + '>'
+    '<wp:extent cx="{cx}" cy="{cy}"/>'
+    f'<wp:docPr id="{_SHAPE_ID}" name="Picture {_SHAPE_ID}"/>'
+    '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name="image.png"/><pic:cNvPicPr/></pic:nvPicPr>'
+    f'<pic:blipFill><a:blip r:embed="{_RID}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"/></pic:spPr></pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r>'
+)
+
+
+def image_digest(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def new_report_document():
+    """Tài liệu trống từ template dùng chung (style 'hinh' cho chú thích, 'mota' cho đoạn mô tả)."""
+    return load_base_document()
+
+
+class FigureRenderer:
+    """Render một hình thành chuỗi XML có chỗ trống cho số hình, rId và id đối tượng vẽ."""
+
+    def __init__(self, doc, caption_style='hinh', heading_style='Heading 3', description_style='mota',
+                 width=Inches(5.5)):
+        styles = StyleRegistry(doc)
+        self.caption_style_id = styles[caption_style]
+        self.heading_style_id = styles[heading_style]
+        self.description_style_id = styles[description_style]
+        self.width = width
+        self.settings_key = content_key(self.caption_style_id, self.heading_style_id, self.description_style_id,
+                                        int(width), _INLINE)
+
+    def _render(self, figure):
+        px_width, px_height = figure['size']
+        cx = int(self.width)
+        cy = round(cx * px_height / px_width)
+        return ''.join((
+            paragraph_xml(figure['heading'], self.heading_style_id),
+            '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>' + _INLINE.format(cx=cx, cy=cy) + '</w:p>',
+            paragraph_xml(f"{CAPTION_PREFIX}{_COUNTER} {figure['caption']}", self.caption_style_id, 'center'),
+            paragraph_xml(figure['description'], self.description_style_id),
+        ))
+
+    def render(self, figure, cache=None):
+        """`figure`: dict gồm heading, caption, description, size (điểm ảnh) và digest của ảnh."""
+        if cache is None:
+            return self._render(figure)
+        key = content_key(self.settings_key, figure['digest'], figure['heading'], figure['caption'],
+                          figure['description'], tuple(figure['size']))
+        return cache.get_or_render(key, lambda: self._render(figure))
+
+
+def splice_figures(doc, items, batch_size=BATCH_SIZE, profiler=None):
+    """Bước ghép cuối: đánh số hình, nhúng ảnh (lấy rId) và nối các đoạn vào body.
+
+    `items` là các cặp (đoạn XML, bytes ảnh); đoạn không có ảnh (tiêu đề nhóm) đi kèm None.
+    Trả về số hình đã chèn.
+    """
+    profiler = profiler or NULL_PROFILER
+    part = doc.part
+    # next_id quét toàn bộ tài liệu, chỉ gọi một lần rồi tự tăng
+    shape_id = part.next_id
+    counter = 0
+
+    def fragments():
+        nonlocal shape_id, counter
+        for fragment, data in items:
+            if data is None:
+                yield fragment
+                continue
+            counter += 1
+            with profiler.stage('embed'):
+                rid, _ = part.get_or_add_image(io.BytesIO(data))
+            yield (fragment.replace(_COUNTER, str(counter), 1)
+                   .replace(_RID, rid, 1)
+                   .replace(_SHAPE_ID, str(shape_id)))
+            shape_id += 1
+
+    append_fragments(doc, fragments(), batch_size, FIGURE_PREFIXES, profiler)
+    return counter
+
+
+def build_group_document(code, title, figures, cache_path=None, profile_options=None):
+    """Dựng một nhóm ảnh thành tài liệu con (bytes .docx), chạy được trong process worker.
+
+    `figures` là các bộ (số thứ tự trong nhóm, tên file, mô tả, đường dẫn ảnh cần nhúng).
+    Với `profile_options` (tham số của Profiler), nhóm được đo trong process của nó.
+    Trả về (bytes tài liệu, số hình, thống kê cache hoặc None, Profiler.report() hoặc None).
+    """
+    profiler = Profiler(**profile_options).start() if profile_options is not None else NULL_PROFILER
+    doc = new_report_document()
+    renderer = FigureRenderer(doc)
+    cache = FragmentCache(cache_path) if cache_path else None
+    # Thêm heading nhóm (5.1, 5.2, 5.3, 5.4) là heading 2
+    items = [(paragraph_xml(f'{code} {title}', StyleRegistry(doc)['Heading 2']), None)]
+    with profiler.cprofile(code):
+        # Ảnh được đọc trước trên thread pool theo đúng thứ tự chèn, song song với việc dựng tài liệu
+        images = prefetch_images(path for _, _, _, path in figures)
+        for idx, img_file, description, _ in figures:
+            name = os.path.splitext(img_file)[0].replace('_', ' ')
+            # Kích thước lấy từ header ảnh, không cần giải mã ảnh
+            with profiler.stage('read'):
+                _, data, size = next(images)
+            with profiler.item('figure', img_file), profiler.stage('render'):
+                figure = {
+                    # Heading mục 5.x.y là heading 3, hình căn giữa, caption đánh số tuần tự, mô tả chức năng
+                    'heading': f'{code}.{idx} {name.capitalize()}',
+                    'caption': name.capitalize(),
+                    'description': description,
+                    'size': size,
+                    'digest': image_digest(data),
+                }
+                items.append((renderer.render(figure, cache), data))
+        count = splice_figures(doc, items, profiler=profiler)
+    summary = None
+    if cache is not None:
+        cache.save()
+        summary = cache.summary()
+    with profiler.stage('save'):
+        out = io.BytesIO()
+        doc.save(out)
+    return out.getvalue(), count, summary, profiler.report() if profiler.enabled else None
+
+
+def merge_documents(doc, sub_documents, caption_style='hinh', profiler=None):
+    """Nối body của các tài liệu con (bytes .docx) vào cuối `doc` theo thứ tự.
+
+    Ảnh được nhúng lại vào `doc` (ảnh trùng byte dùng chung một phần media), rId,
+    id đối tượng vẽ và số hình được đánh lại trên toàn tài liệu. Trả về tổng số hình.
+    Giai đoạn 'merge' của `profiler` bao gồm cả 'embed' (nhúng lại ảnh).
+    """
+    profiler = profiler or NULL_PROFILER
+    with profiler.stage('merge'):
+        return _merge_documents(doc, sub_documents, caption_style, profiler)
+
+
+def _merge_documents(doc, sub_documents, caption_style, profiler):
+    body = BodyAppender(doc)
+    part = doc.part
+    caption_style_id = StyleRegistry(doc)[caption_style]
+    shape_id = part.next_id
+    counter = 0
+    for blob in sub_documents:
+        sub = Document(io.BytesIO(blob))
+        related = sub.part.related_parts
+        rids = {}
+        for element in list(sub.element.body):
+            if element.tag == qn('w:sectPr'):
+                continue
+            for blip in element.iter(qn('a:blip')):
+                old_rid = blip.get(qn('r:embed'))
+                if old_rid not in rids:
+                    with profiler.stage('embed'):
+                        rids[old_rid], _ = part.get_or_add_image(io.BytesIO(related[old_rid].blob))
+                blip.set(qn('r:embed'), rids[old_rid])
+            for doc_pr in element.iter(qn('wp:docPr')):
+                doc_pr.set('id', str(shape_id))
+                doc_pr.set('name', f'Picture {shape_id}')
+                shape_id += 1
+            style = element.find(f"{qn('w:pPr')}/{qn('w:pStyle')}")
+            if style is not None and style.get(qn('w:val')) == caption_style_id:
+                text = element.find(f"{qn('w:r')}/{qn('w:t')}")
+                if text is not None and _CAPTION_RE.match(text.text or ''):
+                    counter += 1
+                    text.text = _CAPTION_RE.sub(f'{CAPTION_PREFIX}{counter}', text.text, 1)
+            body.append(element)
+    return counter
@@ -0,0 +1,117 @@
+"""Manifest ảnh chụp màn hình của chương 5 (chuong5_manifest.json).
+
+Manifest chứa các nhóm ảnh (thư mục, số mục, tiêu đề), thứ tự ảnh trong từng
+nhóm và mô tả chức năng của từng ảnh. Khi nạp, manifest được biên dịch một lần
+thành bảng thứ hạng {tên file: vị trí} cho mỗi nhóm và lưu cache nhị phân theo
+hash nội dung, nên sắp xếp ảnh chỉ là một lần sort theo khóa, tuyến tính theo
+số ảnh thay vì kiểm tra `in` trên danh sách cho từng file.
+
+Tên file trong manifest và trên đĩa đều được so sánh ở dạng NFC, nên tên tiếng
+Việt vẫn khớp khi hệ thống file trả về dạng NFD.
+"""
+import hashlib
+import json
+import os
+import pickle
+import unicodedata
+from collections import namedtuple
+
+from .sql_schema import DEFAULT_CACHE_DIR
+
+# Tăng số này khi đổi cấu trúc bản biên dịch để cache cũ tự hết hiệu lực
+MANIFEST_VERSION = 2
+
+# Mô tả mặc định; ảnh có mô tả này bị bỏ qua khi dựng chương
+MISSING_DESCRIPTION = 'Chức năng chưa được mô tả.'
+
+# idx: số thứ tự trong nhóm; name: tên file dạng NFC; path: đường dẫn thật trên đĩa;
+# digest: sha256 của ảnh gốc nếu lấy từ danh mục ảnh, ngược lại None
+Figure = namedtuple('Figure', 'idx name description path digest')
+
+
+def _nfc(name):
+    return unicodedata.normalize('NFC', name)
+
+
+def compile_manifest(manifest):
+    """Bản biên dịch: các nhóm kèm bảng thứ hạng file và bảng mô tả."""
+    return {
+        'groups': [
+            {
+                'folder': group['folder'],
+                'code': group['code'],
+                'title': group['title'],
+                'rank': {_nfc(name): i for i, name in enumerate(group.get('order', []))},
+            }
+            for group in manifest['groups']
+        ],
+        'descriptions': {_nfc(name): text for name, text in manifest.get('descriptions', {}).items()},
+    }
+
+
+def load_manifest(manifest_path, cache_dir=DEFAULT_CACHE_DIR):
+    """Đọc bản biên dịch từ cache nếu manifest chưa đổi, ngược lại biên dịch và ghi cache.
+
+    Đường dẫn thư mục của các nhóm được hiểu tương đối với thư mục chứa manifest.
+    """
+    with open(manifest_path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    compiled = None
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, 'manifest', f'v{MANIFEST_VERSION}-{digest}.pickle')
+        try:
+            with open(cache_path, 'rb') as f:
+                compiled = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            compiled = None
+    if compiled is None:
+        compiled = compile_manifest(json.loads(raw.decode('utf-8')))
+        if cache_path:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    for group in compiled['groups']:
+        group['path'] = os.path.join(base_dir, group['folder'])
+    return compiled
+
+
+def order_files(group, files):
+    """Sắp file theo thứ tự trong manifest; file không có trong manifest giữ thứ tự gốc ở cuối."""
+    rank = group['rank']
+    last = len(rank)
+    # sort ổn định: các file cùng khóa `last` giữ nguyên thứ tự liệt kê
+    return sorted(files, key=lambda name: rank.get(name, last))
+
+
+def iter_figures(compiled, catalog=None):
+    """Sinh (nhóm, [Figure]) cho các nhóm có thư mục ảnh, chỉ gồm các hình có mô tả.
+
+    Với `catalog` (ImageCatalog đã refresh), danh sách ảnh lấy từ danh mục thay vì
+    quét thư mục; ảnh đổi tên ngoài manifest vẫn tìm được mô tả qua khóa mô tả cũ.
+    Số thứ tự tính cả ảnh chưa có mô tả (bị bỏ qua), giống cách đánh số mục 5.x.y trước đây.
+    """
+    descriptions = compiled['descriptions']
+    for group in compiled['groups']:
+        if catalog is not None:
+            if group['path'] not in catalog:
+                continue
+            files = {entry.name: (entry.path, entry.digest, entry.description_key)
+                     for entry in catalog.files(group['path']) if entry.name.lower().endswith('.png')}
+        else:
+            if not os.path.isdir(group['path']):
+                continue
+            with os.scandir(group['path']) as it:
+                files = {_nfc(entry.name): (entry.path, None, None)
+                         for entry in it if entry.name.lower().endswith('.png')}
+        figures = []
+        for idx, name in enumerate(order_files(group, files), 1):
+            path, digest, description_key = files[name]
+            description = descriptions.get(name) or descriptions.get(description_key, MISSING_DESCRIPTION)
+            if description != MISSING_DESCRIPTION:
+                figures.append(Figure(idx, name, description, path, digest))
+        yield group, figures
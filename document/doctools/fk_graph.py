@@ -0,0 +1,105 @@
+"""Chỉ mục quan hệ khóa ngoại giữa các bảng, dựng từ FOREIGN KEY ... REFERENCES trong SQL.
+
+Dựng trong thời gian tuyến tính theo số bảng + số khóa ngoại; hỗ trợ tra cứu
+bảng tham chiếu đến một bảng, độ sâu phụ thuộc và các bảng trong phạm vi N bước.
+
+Chạy: python -m doctools.fk_graph users --hops 2
+"""
+import argparse
+import os
+from collections import deque
+
+
+class FkGraph:
+    def __init__(self, tables):
+        # outgoing[t]: các khóa ngoại của t; incoming[t]: các khóa ngoại từ bảng khác trỏ tới t
+        self.outgoing = {}
+        self.incoming = {}
+        for table in tables:
+            self.outgoing.setdefault(table['name'], [])
+            self.incoming.setdefault(table['name'], [])
+        for table in tables:
+            for fk in table['foreign_keys']:
+                edge = (table['name'], tuple(fk['columns']), fk['ref_table'], tuple(fk['ref_columns']))
+                self.outgoing[table['name']].append(edge)
+                self.incoming.setdefault(fk['ref_table'], []).append(edge)
+        self._depth = None
+
+    def referenced_by(self, table):
+        """Danh sách (bảng, cột) có khóa ngoại trỏ tới `table`."""
+        return [(src, cols) for src, cols, _, _ in self.incoming.get(table, [])]
+
+    def depths(self):
+        """Độ sâu phụ thuộc của từng bảng: 0 nếu không tham chiếu bảng nào, ngược lại
+        1 + độ sâu lớn nhất của các bảng được tham chiếu. Bỏ qua tự tham chiếu và cạnh tạo chu trình."""
+        if self._depth is not None:
+            return self._depth
+        depth = {}
+        on_stack = set()
+        for root in self.outgoing:
+            if root in depth:
+                continue
+            # DFS không đệ quy để chịu được lược đồ rất lớn
+            stack = [(root, iter(self.outgoing[root]))]
+            on_stack.add(root)
+            while stack:
+                node, edges = stack[-1]
+                for _, _, ref, _ in edges:
+                    if ref != node and ref not in depth and ref not in on_stack and ref in self.outgoing:
+                        stack.append((ref, iter(self.outgoing[ref])))
+                        on_stack.add(ref)
+                        break
+                else:
+                    stack.pop()
+                    on_stack.discard(node)
+                    depth[node] = max(
+                        (depth[ref] + 1 for _, _, ref, _ in self.outgoing[node] if ref in depth and ref != node),
+                        default=0,
+                    )
+        self._depth = depth
+        return depth
+
+    def within_hops(self, start, hops=2, direction='both'):
+        """Các bảng cách `start` không quá `hops` bước, trả về {bảng: số bước}.
+
+        direction: 'out' (bảng mà start tham chiếu), 'in' (bảng tham chiếu tới start) hoặc 'both'.
+        """
+        distance = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            if distance[node] >= hops:
+                continue
+            neighbours = []
+            if direction in ('out', 'both'):
+                neighbours += [ref for _, _, ref, _ in self.outgoing.get(node, [])]
+            if direction in ('in', 'both'):
+                neighbours += [src for src, _, _, _ in self.incoming.get(node, [])]
+            for other in neighbours:
+                if other not in distance:
+                    distance[other] = distance[node] + 1
+                    queue.append(other)
+        del distance[start]
+        return distance
+
+
+def main():
+    from .sql_schema import load_schema_model
+
+    default_sql = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'system_elearning.sql')
+    parser = argparse.ArgumentParser(description='Tra cứu quan hệ khóa ngoại giữa các bảng.')
+    parser.add_argument('table')
+    parser.add_argument('--hops', type=int, default=2)
+    parser.add_argument('--direction', choices=('in', 'out', 'both'), default='both')
+    parser.add_argument('--sql', default=default_sql)
+    args = parser.parse_args()
+
+    graph = FkGraph(load_schema_model(args.sql))
+    depth = graph.depths()
+    related = graph.within_hops(args.table, args.hops, args.direction)
+    for name, hops in sorted(related.items(), key=lambda item: (item[1], item[0])):
+        print(f'{hops}  {name}  (độ sâu {depth.get(name, "?")})')
+
+
+if __name__ == '__main__':
+    main()
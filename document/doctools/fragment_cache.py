@@ -0,0 +1,48 @@
+"""Cache các đoạn XML đã render, khóa theo hash nội dung đầu vào.
+
+Mỗi lần build chỉ render lại những mục có hash thay đổi; các đoạn còn lại lấy
+từ cache và ghép lại đúng thứ tự. Khi lưu, cache chỉ giữ các mục được dùng
+trong lần build vừa rồi nên không phình ra theo thời gian.
+"""
+import hashlib
+import os
+import pickle
+
+
+def content_key(*parts):
+    """Hash ổn định cho một bộ giá trị đầu vào (chuỗi, số, tuple, list)."""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+class FragmentCache:
+    def __init__(self, path):
+        self.path = path
+        self.reused = 0
+        self.rebuilt = 0
+        self._used = {}
+        try:
+            with open(path, 'rb') as f:
+                self._entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self._entries = {}
+
+    def get_or_render(self, key, render):
+        """Trả về đoạn đã cache cho `key`, hoặc gọi `render()` nếu chưa có."""
+        fragment = self._entries.get(key)
+        if fragment is None:
+            fragment = render()
+            self.rebuilt += 1
+        else:
+            self.reused += 1
+        self._used[key] = fragment
+        return fragment
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self._used, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+    def summary(self):
+        return f'tái sử dụng {self.reused} đoạn, dựng lại {self.rebuilt} đoạn'
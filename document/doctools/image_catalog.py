@@ -0,0 +1,197 @@
+"""Danh mục ảnh chụp màn hình lưu trong SQLite, dùng chung cho script đổi tên và script dựng báo cáo.
+
+Mỗi ảnh được định danh bằng hash nội dung (sha256); danh mục lưu tên đã chuẩn
+hóa NFC (tên trên đĩa có thể là NFD, ví dụ trên HFS+), thư mục nhóm, kích thước
+ảnh (đọc từ header, không giải mã), kích thước file, mtime và khóa mô tả.
+
+Cập nhật là tăng dần: mỗi thư mục được quét bằng một lần scandir và stat
+từng file (ghi đè ảnh tại chỗ không đổi mtime thư mục nên không thể dựa vào
+đó); chỉ file có kích thước hoặc mtime thay đổi mới bị đọc và hash lại. File
+mới có cùng hash với file vừa biến mất được coi là đổi tên/di chuyển, giữ
+nguyên khóa mô tả. mtime thư mục chỉ được lưu làm thông tin.
+"""
+import hashlib
+import os
+import sqlite3
+import unicodedata
+from collections import Counter, namedtuple
+
+from .image_pipeline import image_size
+from .sql_schema import DEFAULT_CACHE_DIR
+
+# Tăng số này khi đổi cấu trúc bảng; danh mục cũ sẽ được dựng lại từ đầu
+CATALOG_VERSION = 1
+
+DEFAULT_CATALOG_PATH = os.path.join(DEFAULT_CACHE_DIR, 'image_catalog.sqlite')
+# Thư mục gốc để tính khóa thư mục nhóm (giống đường dẫn trong manifest chương 5)
+DEFAULT_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    digest TEXT PRIMARY KEY,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    disk_name TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES images(digest),
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    description_key TEXT NOT NULL,
+    PRIMARY KEY (folder, name)
+);
+CREATE INDEX IF NOT EXISTS files_digest ON files(digest);
+CREATE TABLE IF NOT EXISTS folders (
+    folder TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+# path: đường dẫn thật trên đĩa; name: tên dạng NFC dùng để tra manifest
+CatalogEntry = namedtuple('CatalogEntry', 'name path digest width height size mtime_ns description_key')
+
+
+def normalize_name(name):
+    return unicodedata.normalize('NFC', name)
+
+
+class ImageCatalog:
+    """Kết nối tới danh mục ảnh; dùng được như context manager."""
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH, base_dir=DEFAULT_BASE_DIR):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.base_dir = base_dir
+        self._conn = sqlite3.connect(path)
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != CATALOG_VERSION:
+            with self._conn:
+                self._conn.executescript('DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS images; '
+                                         'DROP TABLE IF EXISTS folders;')
+                self._conn.execute(f'PRAGMA user_version = {CATALOG_VERSION}')
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def folder_key(self, path):
+        """Khóa thư mục nhóm: đường dẫn tương đối so với base_dir, phân cách bằng '/'."""
+        return os.path.relpath(os.path.abspath(path), self.base_dir).replace(os.sep, '/')
+
+    def __contains__(self, path):
+        row = self._conn.execute('SELECT 1 FROM folders WHERE folder = ?', (self.folder_key(path),)).fetchone()
+        return row is not None
+
+    def refresh(self, paths, force=False):
+        """Cập nhật danh mục cho các thư mục `paths`; trả về thống kê số file theo loại thay đổi.
+
+        `force` đọc và hash lại mọi file kể cả khi kích thước và mtime không đổi.
+        """
+        stats = Counter()
+        vanished = {}  # digest -> [khóa mô tả của các file đã biến mất]
+        new = []
+        with self._conn:
+            for path in paths:
+                folder = self.folder_key(path)
+                try:
+                    dir_mtime = os.stat(path).st_mtime_ns
+                except FileNotFoundError:
+                    dir_mtime = None
+                known = {
+                    name: (disk_name, digest, size, mtime_ns, description_key)
+                    for name, disk_name, digest, size, mtime_ns, description_key in self._conn.execute(
+                        'SELECT name, disk_name, digest, size, mtime_ns, description_key FROM files '
+                        'WHERE folder = ?', (folder,))
+                }
+                seen = set()
+                entries = []
+                if dir_mtime is not None:
+                    with os.scandir(path) as it:
+                        entries = [entry for entry in it
+                                   if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()]
+                for entry in entries:
+                    name = normalize_name(entry.name)
+                    seen.add(name)
+                    st = entry.stat()
+                    old = known.get(name)
+                    if not force and old is not None and old[2] == st.st_size and old[3] == st.st_mtime_ns:
+                        if old[0] != entry.name:
+                            self._conn.execute('UPDATE files SET disk_name = ? WHERE folder = ? AND name = ?',
+                                               (entry.name, folder, name))
+                        stats['unchanged'] += 1
+                        continue
+                    digest = self._add_image(entry.path)
+                    if old is not None:
+                        self._conn.execute(
+                            'UPDATE files SET disk_name = ?, digest = ?, size = ?, mtime_ns = ? '
+                            'WHERE folder = ? AND name = ?',
+                            (entry.name, digest, st.st_size, st.st_mtime_ns, folder, name))
+                        stats['changed'] += 1
+                    else:
+                        new.append((folder, name, entry.name, digest, st.st_size, st.st_mtime_ns))
+                for name, (_, digest, _, _, description_key) in known.items():
+                    if name not in seen:
+                        vanished.setdefault(digest, []).append(description_key)
+                        self._conn.execute('DELETE FROM files WHERE folder = ? AND name = ?', (folder, name))
+                if dir_mtime is None:
+                    self._conn.execute('DELETE FROM folders WHERE folder = ?', (folder,))
+                else:
+                    self._conn.execute('INSERT OR REPLACE INTO folders VALUES (?, ?)', (folder, dir_mtime))
+            # Ghép file mới với file đã biến mất cùng hash (kể cả khác thư mục) thành một lần di chuyển
+            for folder, name, disk_name, digest, size, mtime_ns in new:
+                moved_from = vanished.get(digest)
+                if moved_from:
+                    description_key = moved_from.pop(0)
+                    stats['moved'] += 1
+                else:
+                    description_key = name
+                    stats['added'] += 1
+                self._conn.execute('INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                   (folder, name, disk_name, digest, size, mtime_ns, description_key))
+            removed = sum(len(keys) for keys in vanished.values())
+            if removed:
+                stats['removed'] += removed
+            self._conn.execute('DELETE FROM images WHERE digest NOT IN (SELECT digest FROM files)')
+        return stats
+
+    def _add_image(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        width, height = image_size(data)
+        self._conn.execute('INSERT OR IGNORE INTO images VALUES (?, ?, ?)', (digest, width, height))
+        return digest
+
+    def record_moves(self, path, moves):
+        """Ghi nhận các đổi tên (tên cũ, tên mới trên đĩa) vừa thực hiện trong thư mục, không cần đọc lại file."""
+        folder = self.folder_key(path)
+        with self._conn:
+            rows = []
+            for src, dst in moves:
+                row = self._conn.execute(
+                    'SELECT digest, size, mtime_ns, description_key FROM files WHERE folder = ? AND name = ?',
+                    (folder, normalize_name(src))).fetchone()
+                if row is not None:
+                    self._conn.execute('DELETE FROM files WHERE folder = ? AND name = ?',
+                                       (folder, normalize_name(src)))
+                    rows.append((folder, normalize_name(dst), dst) + row)
+            # Xóa hết rồi mới thêm: các chu trình đổi tên (a -> b, b -> a) không vi phạm khóa chính
+            self._conn.executemany('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def files(self, path):
+        """Các ảnh của một thư mục theo tên, chỉ truy vấn danh mục (không quét thư mục, không đọc ảnh)."""
+        return [
+            CatalogEntry(name, os.path.join(path, disk_name), digest, width, height, size, mtime_ns, description_key)
+            for name, disk_name, digest, width, height, size, mtime_ns, description_key in self._conn.execute(
+                'SELECT name, disk_name, digest, width, height, size, mtime_ns, description_key '
+                'FROM files JOIN images USING (digest) WHERE folder = ? ORDER BY name', (self.folder_key(path),))
+        ]
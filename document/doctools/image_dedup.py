@@ -0,0 +1,82 @@
+"""Gộp các ảnh trùng nhau để mỗi ảnh chỉ được nhúng một lần vào file Word.
+
+Ảnh trùng byte được nhận ra qua hash nội dung. Ảnh gần giống (cùng màn hình
+chụp lại, khác vài điểm ảnh) chỉ được gộp khi bật `max_distance`: khi đó so
+sánh difference hash (dHash) và kích thước ảnh.
+"""
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+# dHash 16x16 = 256 bit; 8x8 quá thô với ảnh chụp màn hình (các hộp thoại khác nhau vẫn gần nhau)
+HASH_SIZE = 16
+# Chênh lệch tỷ lệ khung hình tối đa để coi hai ảnh là cùng một màn hình
+MAX_ASPECT_DIFF = 0.02
+
+
+def file_digest(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dhash(path, size=HASH_SIZE):
+    """(difference hash, tỷ lệ khung hình) của ảnh: mỗi bit so sánh hai điểm ảnh xám liền kề."""
+    with Image.open(path) as image:
+        aspect = image.width / image.height
+        gray = image.convert('L').resize((size + 1, size), Image.LANCZOS)
+    pixels = gray.tobytes()
+    bits = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return bits, aspect
+
+
+def dedup_images(paths, max_distance=None, workers=8):
+    """Trả về ({ảnh: ảnh đại diện}, thống kê) cho danh sách ảnh theo thứ tự chèn.
+
+    Ảnh đầu tiên của mỗi nhóm trùng là ảnh đại diện. Thống kê gồm số lần chèn ảnh,
+    số ảnh thực sự nhúng, số ảnh gộp do gần giống và số byte không phải nhúng lại.
+    """
+    paths = list(paths)
+    # Cùng một file có thể được chèn nhiều lần (ảnh gốc trùng nhau dùng chung ảnh đã xử lý)
+    distinct = list(dict.fromkeys(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = dict(zip(distinct, pool.map(file_digest, distinct)))
+    canonical, by_digest = {}, {}
+    for path in distinct:
+        canonical[path] = by_digest.setdefault(digests[path], path)
+
+    near = 0
+    if max_distance is not None:
+        unique = list(by_digest.values())
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            hashes = dict(zip(unique, pool.map(dhash, unique)))
+        kept, merged = [], {}
+        for path in unique:
+            bits, aspect = hashes[path]
+            match = next((other for other in kept
+                          if abs(hashes[other][1] - aspect) <= MAX_ASPECT_DIFF * aspect
+                          and bin(hashes[other][0] ^ bits).count('1') <= max_distance), None)
+            if match is None:
+                kept.append(path)
+            else:
+                merged[path] = match
+                near += 1
+        canonical = {path: merged.get(target, target) for path, target in canonical.items()}
+
+    sizes = {path: os.path.getsize(path) for path in distinct}
+    embedded = set(canonical.values())
+    stats = {
+        'images': len(paths),
+        'embedded': len(embedded),
+        'near': near,
+        'saved_bytes': sum(sizes[path] for path in paths) - sum(sizes[path] for path in embedded),
+    }
+    return canonical, stats
@@ -0,0 +1,108 @@
+"""Chuẩn bị ảnh chụp màn hình trước khi chèn vào báo cáo Word.
+
+Word chỉ hiển thị ảnh rộng tối đa khoảng 5.5 inch, nên ảnh gốc được thu nhỏ về
+đúng số điểm ảnh cần cho DPI mục tiêu, bỏ kênh alpha (ghép lên nền trắng của
+trang), giảm về bảng màu và nén lại. Việc xử lý chạy song song trên mọi nhân
+CPU; kết quả được cache theo hash nội dung ảnh gốc + thiết lập, nên ảnh không
+đổi sẽ không bao giờ bị xử lý lại. Sau mỗi lần chạy, cache chỉ giữ các ảnh vừa
+dùng (giống FragmentCache), ảnh của bản chụp cũ hay DPI cũ bị xóa.
+"""
+import hashlib
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+from .sql_schema import DEFAULT_CACHE_DIR
+
+# Tăng số này khi đổi cách xử lý để cache cũ tự hết hiệu lực
+PREP_VERSION = 2
+
+# width_in: độ rộng hiển thị trong Word; dpi: mật độ điểm ảnh mục tiêu;
+# colors: số màu của bảng màu PNG (None để giữ ảnh RGB đầy đủ)
+PrepSettings = namedtuple('PrepSettings', 'width_in dpi colors')
+DEFAULT_SETTINGS = PrepSettings(width_in=5.5, dpi=200, colors=256)
+
+
+def _flatten(image):
+    """Ảnh RGB: ghép các điểm ảnh trong suốt lên nền trắng thay vì giữ kênh alpha."""
+    if image.mode in ('RGBA', 'LA', 'P', 'PA'):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def prepare_image(src_path, out_path, settings=DEFAULT_SETTINGS):
+    """Thu nhỏ, bỏ alpha và nén lại một ảnh; không phóng to ảnh nhỏ hơn kích thước mục tiêu."""
+    with Image.open(src_path) as image:
+        image = _flatten(image)
+    max_width = round(settings.width_in * settings.dpi)
+    if image.width > max_width:
+        image = image.resize((max_width, max(1, round(image.height * max_width / image.width))), Image.LANCZOS)
+    if settings.colors:
+        image = image.quantize(settings.colors, method=Image.Quantize.FASTOCTREE)
+    tmp_path = out_path + '.tmp'
+    image.save(tmp_path, 'PNG', optimize=True, dpi=(settings.dpi, settings.dpi))
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_key(digest, settings):
+    return hashlib.sha256(repr((PREP_VERSION, digest, tuple(settings))).encode()).hexdigest()
+
+
+def prune_cache(out_dir, keep):
+    """Xóa các ảnh trong `out_dir` không thuộc `keep` (kể cả file .tmp sót lại); trả về số file đã xóa."""
+    keep = {os.path.basename(path) for path in keep}
+    removed = 0
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(('.png', '.tmp')) and entry.name not in keep and entry.is_file():
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue
+                removed += 1
+    return removed
+
+
+def prepare_images(src_paths, cache_dir=DEFAULT_CACHE_DIR, settings=DEFAULT_SETTINGS, workers=None, digests=None,
+                   prune=True):
+    """Trả về ({ảnh gốc: ảnh đã xử lý trong cache}, số ảnh phải xử lý lại).
+
+    `digests` ({ảnh gốc: sha256}, ví dụ lấy từ danh mục ảnh) giúp không phải đọc lại ảnh gốc để tính hash.
+    Với `prune`, các ảnh trong cache không thuộc lần gọi này bị xóa: chỉ dùng khi
+    `src_paths` là toàn bộ ảnh của tài liệu.
+    """
+    out_dir = os.path.join(cache_dir, 'images')
+    os.makedirs(out_dir, exist_ok=True)
+    digests = digests or {}
+    prepared, jobs = {}, {}
+    for src_path in src_paths:
+        digest = digests.get(src_path) or file_sha256(src_path)
+        out_path = os.path.join(out_dir, _cache_key(digest, settings) + '.png')
+        prepared[src_path] = out_path
+        if not os.path.exists(out_path):
+            jobs[out_path] = src_path
+    if len(jobs) == 1 or workers == 1:
+        for out_path, src_path in jobs.items():
+            prepare_image(src_path, out_path, settings)
+    elif jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(prepare_image, src, out, settings) for out, src in jobs.items()]
+            for future in futures:
+                future.result()
+    if prune:
+        prune_cache(out_dir, prepared.values())
+    return prepared, len(jobs)
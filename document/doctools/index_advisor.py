@@ -0,0 +1,254 @@
+"""Gợi ý chỉ mục cho system_elearning.sql dựa trên khóa đã khai báo và cách các service truy vấn.
+
+Phần phân tích lược đồ tìm khóa ngoại không có chỉ mục bắt đầu bằng cột của nó,
+chỉ mục thừa (là tiền tố của chỉ mục khác) và khóa UNIQUE trên cột varchar rộng.
+Phần quét mã đọc backend/src/modules/*/*.service.ts, đếm các cột xuất hiện trong
+điều kiện `where` của find/findOne/update/... và của createQueryBuilder, để xếp
+hạng các chỉ mục còn thiếu theo tần suất truy vấn.
+"""
+import glob
+import os
+import re
+from collections import Counter, namedtuple
+
+from .entity_scan import balanced_args
+
+Advice = namedtuple('Advice', 'hits table columns kind detail statement')
+
+# Thứ tự hiển thị khi cùng tần suất truy vấn
+KINDS = ('fk', 'lookup', 'redundant', 'wide_unique')
+
+# Khóa InnoDB (COMPACT/REDUNDANT) giới hạn 767 byte; utf8mb4 tốn 4 byte mỗi ký tự nên tối đa 191 ký tự
+WIDE_KEY_CHARS = 191
+
+# Phương thức Repository nhận điều kiện ở tham số đầu / trong tùy chọn `where`
+_WHERE_ARG_METHODS = {'findBy', 'findOneBy', 'findOneByOrFail', 'findAndCountBy', 'countBy', 'existsBy',
+                      'update', 'delete', 'softDelete', 'restore'}
+_OPTION_METHODS = {'find', 'findOne', 'findOneOrFail', 'findAndCount', 'count', 'exists'}
+
+_INJECT_RE = re.compile(r'@InjectRepository\(\s*(\w+)\s*\)\s*(?:(?:private|public|protected|readonly)\s+)*(\w+)')
+_REPO_CALL_RE = re.compile(r'this\.(\w+)\s*\.\s*(\w+)\s*\(')
+_BUILDER_RE = re.compile(r"(?:this\.(\w+)\s*\.\s*)?createQueryBuilder\(\s*(?:(\w+)\s*,\s*)?'(\w+)'")
+_JOIN_RE = re.compile(r"Join(?:AndSelect)?\(\s*'(\w+)\.(\w+)'\s*,\s*'(\w+)'")
+_CONDITION_RE = re.compile(r"\.(?:where|andWhere|orWhere)\(\s*(['`])(.*?)\1", re.S)
+_QUALIFIED_RE = re.compile(r'\b(\w+)\.(\w+)\b')
+_BARE_RE = re.compile(r'(?<![\w.:])([A-Za-z_]\w*)\s*(?:=|<>|!=|>=|<=|<|>|\bIN\b|\bIS\b|\bLIKE\b|\bBETWEEN\b)', re.I)
+_VARCHAR_RE = re.compile(r'(?:var)?char\((\d+)\)')
+
+
+def _split_top(text, sep):
+    """Tách `text` theo `sep` ở mức ngoài cùng (bỏ qua ngoặc và chuỗi)."""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote and text[i - 1] != '\\':
+                quote = None
+        elif ch in '\'"`':
+            quote = ch
+        elif ch in '([{':
+            depth += 1
+        elif ch in ')]}':
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _object_entries(text):
+    """Các cặp (khóa, giá trị) của một object literal `{ ... }`; giá trị None với dạng viết tắt `{ id }`."""
+    text = text.strip()
+    if not text.startswith('{'):
+        return []
+    entries = []
+    for part in _split_top(text[1:text.rfind('}')], ','):
+        if part.startswith('...'):
+            continue
+        key_value = _split_top(part, ':')
+        key = key_value[0].strip('\'"')
+        if re.fullmatch(r'\w+', key):
+            entries.append((key, part[part.index(':') + 1:].strip() if len(key_value) > 1 else None))
+    return entries
+
+
+class _EntityIndex:
+    """Tra cứu bảng/cột SQL từ tên class và tên thuộc tính của entity."""
+
+    def __init__(self, entities):
+        self.by_class = {e['class']: e for e in entities if e['class'] and e['table']}
+
+    def table(self, cls):
+        entity = self.by_class.get(cls)
+        return entity['table'] if entity else None
+
+    def relation(self, cls, prop):
+        entity = self.by_class.get(cls)
+        return next((r for r in entity['relations'] if r['property'] == prop), None) if entity else None
+
+    def column(self, cls, prop):
+        """Tên cột SQL của thuộc tính `prop`, kể cả cột khóa ngoại của quan hệ có @JoinColumn."""
+        entity = self.by_class.get(cls)
+        if entity is None:
+            return None
+        for column in entity['columns']:
+            if prop in (column['property'], column['name']):
+                return column['name']
+        relation = self.relation(cls, prop)
+        return relation['join_column'] if relation else None
+
+
+def _where_columns(index, cls, where):
+    """Các cặp (bảng, cột) trong một điều kiện where dạng object hoặc mảng object."""
+    where = where.strip()
+    if where.startswith('['):
+        return [hit for item in _split_top(where[1:where.rfind(']')], ',') for hit in _where_columns(index, cls, item)]
+    hits = []
+    for key, value in _object_entries(where):
+        relation = index.relation(cls, key)
+        if relation and value and value.startswith('{'):
+            nested = _object_entries(value)
+            # { course: { id } } chỉ lọc theo cột khóa ngoại của bảng hiện tại
+            if relation['join_column'] and [k for k, _ in nested] == ['id']:
+                hits.append((index.table(cls), relation['join_column']))
+            else:
+                hits.extend(_where_columns(index, relation['target'], value))
+            continue
+        column = index.column(cls, key)
+        if column:
+            hits.append((index.table(cls), column))
+    return hits
+
+
+def _repository_hits(text, index, repositories):
+    hits = []
+    for m in _REPO_CALL_RE.finditer(text):
+        cls = repositories.get(m.group(1))
+        method = m.group(2)
+        if cls is None or method not in _WHERE_ARG_METHODS | _OPTION_METHODS:
+            continue
+        args, _ = balanced_args(text, m.end())
+        first = (_split_top(args, ',') or [''])[0]
+        if method in _WHERE_ARG_METHODS:
+            hits.extend(_where_columns(index, cls, first))
+        else:
+            where = dict(_object_entries(first)).get('where')
+            if where:
+                hits.extend(_where_columns(index, cls, where))
+    return hits
+
+
+def _builder_hits(text, index, repositories):
+    aliases, roots = {}, []
+    for m in _BUILDER_RE.finditer(text):
+        cls = m.group(2) or repositories.get(m.group(1))
+        if cls:
+            aliases[m.group(3)] = cls
+            roots.append((m.start(), cls))
+    # Alias của join có thể dựa trên alias join trước đó, lặp tới khi không đổi
+    joins = _JOIN_RE.findall(text)
+    for _ in range(len(joins)):
+        changed = False
+        for parent, prop, alias in joins:
+            relation = index.relation(aliases.get(parent), prop)
+            if relation and aliases.get(alias) != relation['target']:
+                aliases[alias] = relation['target']
+                changed = True
+        if not changed:
+            break
+
+    hits = []
+    for m in _CONDITION_RE.finditer(text):
+        condition = m.group(2)
+        for alias, prop in _QUALIFIED_RE.findall(condition):
+            column = index.column(aliases.get(alias), prop)
+            if column:
+                hits.append((index.table(aliases[alias]), column))
+        # Tên không có alias thuộc về query builder gần nhất phía trước
+        root = next((cls for pos, cls in reversed(roots) if pos < m.start()), None)
+        for prop in _BARE_RE.findall(_QUALIFIED_RE.sub('', condition)):
+            column = index.column(root, prop)
+            if column:
+                hits.append((index.table(root), column))
+    return hits
+
+
+def scan_query_usage(modules_dir, entities):
+    """Đếm số lần mỗi (bảng, cột) xuất hiện trong điều kiện truy vấn của các service."""
+    index = _EntityIndex(entities)
+    usage = Counter()
+    for path in sorted(glob.glob(os.path.join(modules_dir, '*', '*.service.ts'))):
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        repositories = {prop: cls for cls, prop in _INJECT_RE.findall(text)}
+        usage.update(_repository_hits(text, index, repositories))
+        usage.update(_builder_hits(text, index, repositories))
+    return usage
+
+
+def _indexes(table):
+    """[(tên, các cột, là khóa duy nhất)] gồm PRIMARY, UNIQUE và KEY."""
+    indexes = [('PRIMARY', table['primary_key'], True)] if table['primary_key'] else []
+    indexes += [(uk['name'], uk['columns'], True) for uk in table['unique_keys']]
+    indexes += [(k['name'], k['columns'], False) for k in table['keys']]
+    return indexes
+
+
+def _add_index(table, columns, types):
+    name = f"idx_{table}_{'_'.join(columns)}"[:64]
+    # Cột TEXT/BLOB chỉ đánh chỉ mục được theo tiền tố
+    cols = ', '.join(
+        f'`{c}`({WIDE_KEY_CHARS})' if types.get(c, '').endswith(('text', 'blob')) else f'`{c}`' for c in columns
+    )
+    return f'ALTER TABLE `{table}` ADD INDEX `{name}` ({cols});'
+
+
+def advise_indexes(model, usage=None):
+    """Trả về danh sách Advice, xếp theo số lần truy vấn giảm dần."""
+    usage = usage or Counter()
+    advice = []
+    for table in model:
+        name = table['name']
+        indexes = _indexes(table)
+        types = {c['name']: c['raw_type'] for c in table['columns']}
+
+        def covered(columns):
+            return any(cols[:len(columns)] == columns for _, cols, _ in indexes)
+
+        fk_columns = set()
+        for fk in table['foreign_keys']:
+            fk_columns.update(fk['columns'])
+            if not covered(fk['columns']):
+                hits = sum(usage[(name, c)] for c in fk['columns'])
+                advice.append(Advice(hits, name, fk['columns'], 'fk',
+                                     f"khóa ngoại tới {fk['ref_table']} không có chỉ mục bắt đầu bằng cột này",
+                                     _add_index(name, fk['columns'], types)))
+
+        for (usage_table, column), hits in usage.items():
+            if usage_table == name and column not in fk_columns and column in types and not covered([column]):
+                advice.append(Advice(hits, name, [column], 'lookup',
+                                     'được dùng trong điều kiện lọc của service nhưng chưa có chỉ mục',
+                                     _add_index(name, [column], types)))
+
+        for i, (key_name, columns, unique) in enumerate(indexes):
+            if unique:
+                continue
+            # Thừa nếu là tiền tố của chỉ mục dài hơn, của khóa duy nhất, hoặc trùng một KEY đứng trước
+            wider = next((other for j, (other, cols, other_unique) in enumerate(indexes) if j != i and (
+                len(cols) > len(columns) or other_unique or j < i) and cols[:len(columns)] == columns), None)
+            if wider:
+                hits = usage[(name, columns[0])]
+                advice.append(Advice(hits, name, columns, 'redundant',
+                                     f'`{key_name}` là tiền tố của `{wider}`',
+                                     f'ALTER TABLE `{name}` DROP INDEX `{key_name}`;'))
+
+        for key_name, columns, unique in indexes:
+            if not unique or key_name == 'PRIMARY':
+                continue
+            lengths = [int(m.group(1)) for c in columns if (m := _VARCHAR_RE.match(types.get(c, '')))]
+            if any(n > WIDE_KEY_CHARS for n in lengths):
+                advice.append(Advice(usage[(name, columns[0])], name, columns, 'wide_unique',
+                                     f'khóa UNIQUE `{key_name}` tới {sum(lengths) * 4} byte (utf8mb4); '
+                                     f'cân nhắc rút ngắn cột hoặc dùng cột băm', None))
+
+    return sorted(advice, key=lambda a: (-a.hits, KINDS.index(a.kind), a.table, a.columns))
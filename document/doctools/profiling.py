@@ -0,0 +1,142 @@
+"""Đo thời gian và bộ nhớ theo từng giai đoạn của các script sinh tài liệu.
+
+Mỗi giai đoạn (nạp nguồn, render bảng/hình, nhúng ảnh, dựng XML, ghi zip) được
+đo wall time, CPU time và đỉnh bộ nhớ theo tracemalloc; một giai đoạn có thể
+được vào nhiều lần và thời gian được cộng dồn. Thời gian từng mục (bảng, hình)
+được ghi riêng để tìm ra mục chậm nhất. Worker trong process pool tạo
+Profiler riêng và trả về report(), process chính gộp lại bằng merge().
+
+Profiler tắt (mặc định) không đo gì, nên các hàm render chỉ cần nhận tham số
+`profiler=None` và dùng `profiler or NULL_PROFILER`.
+"""
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class _Stage:
+    __slots__ = ('wall', 'cpu', 'peak', 'calls')
+
+    def __init__(self):
+        self.wall = self.cpu = 0.0
+        self.peak = 0
+        self.calls = 0
+
+
+class Profiler:
+    def __init__(self, enabled=True, trace_memory=True, cprofile_path=None):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.cprofile_path = cprofile_path if enabled else None
+        self.stages = {}
+        self.items = {}
+        self._open = []
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        return self
+
+    def _fold_peak(self):
+        # Đỉnh bộ nhớ hiện tại thuộc về mọi giai đoạn đang mở (kể cả giai đoạn lồng nhau)
+        if self.trace_memory and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            for stage in self._open:
+                stage.peak = max(stage.peak, peak)
+
+    @contextmanager
+    def stage(self, name):
+        """Đo một giai đoạn; gọi nhiều lần cùng tên thì cộng dồn."""
+        if not self.enabled:
+            yield
+            return
+        stage = self.stages.setdefault(name, _Stage())
+        self._fold_peak()
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self._open.append(stage)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stage.wall += time.perf_counter() - wall
+            stage.cpu += time.process_time() - cpu
+            stage.calls += 1
+            self._fold_peak()
+            self._open.pop()
+
+    @contextmanager
+    def item(self, kind, name):
+        """Đo thời gian của một mục (một bảng, một hình)."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.items.setdefault(kind, []).append((name, time.perf_counter() - start))
+
+    @contextmanager
+    def cprofile(self, label):
+        """Chạy khối lệnh dưới cProfile nếu có cprofile_path; ghi ra '<path>-<label>.prof'."""
+        if not self.cprofile_path:
+            yield
+            return
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            base, ext = os.path.splitext(self.cprofile_path)
+            profile.dump_stats(f'{base}-{label}{ext or ".prof"}')
+
+    def report(self):
+        """Kết quả dạng dict (dùng được với json và pickle qua process pool)."""
+        return {
+            'stages': {
+                name: {'wall_s': stage.wall, 'cpu_s': stage.cpu, 'peak_bytes': stage.peak, 'calls': stage.calls}
+                for name, stage in self.stages.items()
+            },
+            'items': {
+                kind: [{'name': name, 'seconds': seconds}
+                       for name, seconds in sorted(items, key=lambda item: item[1], reverse=True)]
+                for kind, items in self.items.items()
+            },
+        }
+
+    def merge(self, report, prefix=''):
+        """Gộp report() của một worker; tên giai đoạn được thêm tiền tố `prefix`."""
+        if not self.enabled or not report:
+            return
+        for name, data in report['stages'].items():
+            stage = self.stages.setdefault(prefix + name, _Stage())
+            stage.wall += data['wall_s']
+            stage.cpu += data['cpu_s']
+            stage.peak = max(stage.peak, data['peak_bytes'])
+            stage.calls += data['calls']
+        for kind, items in report['items'].items():
+            self.items.setdefault(kind, []).extend((prefix + item['name'], item['seconds']) for item in items)
+
+    def write_json(self, path, **meta):
+        data = dict(meta, **self.report())
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return path
+
+    def summary(self, top=5):
+        """Các dòng tóm tắt: từng giai đoạn và `top` mục chậm nhất mỗi loại."""
+        lines = [f"{'Giai đoạn':<24}{'wall (s)':>10}{'CPU (s)':>10}{'đỉnh (MB)':>11}"]
+        for name, stage in self.stages.items():
+            lines.append(f'{name:<24}{stage.wall:>10.3f}{stage.cpu:>10.3f}{stage.peak / 2**20:>11.1f}')
+        for kind, items in self.report()['items'].items():
+            slowest = ', '.join(f"{item['name']} {item['seconds'] * 1000:.1f} ms" for item in items[:top])
+            lines.append(f'Chậm nhất ({kind}): {slowest}')
+        return lines
+
+
+NULL_PROFILER = Profiler(enabled=False)
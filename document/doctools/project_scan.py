@@ -0,0 +1,116 @@
+"""Quét mã nguồn backend (NestJS) và frontend (React) để sinh các mục của README.md.
+
+Lấy ra các module trong backend/src/modules cùng controller và route của
+chúng, các route của frontend (<Route path=...>) và các entity TypeORM (qua
+entity_scan). Ba thư mục được quét song song; kết quả phân tích từng file được
+cache theo (mtime, kích thước) giống entity_scan, nên khi không có file nào đổi
+chỉ tốn vài lệnh stat.
+"""
+import os
+import pickle
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .entity_scan import scan_entities
+from .sql_schema import DEFAULT_CACHE_DIR
+
+# Tăng số này khi đổi cấu trúc kết quả để cache cũ tự hết hiệu lực
+SCANNER_VERSION = 1
+
+HTTP_METHODS = ('Get', 'Post', 'Put', 'Patch', 'Delete')
+
+_STRING = r"""(?:'([^']*)'|"([^"]*)")"""
+_CONTROLLER_RE = re.compile(r'@Controller\(\s*' + _STRING + r'?\s*\)[^{]*?\bclass\s+(\w+)')
+_ROUTE_RE = re.compile(r'@(' + '|'.join(HTTP_METHODS) + r')\(\s*' + _STRING + r'?\s*\)')
+_FRONTEND_ROUTE_RE = re.compile(r'<Route\b[^>]*?\bpath=' + _STRING)
+
+# prefix: tiền tố của @Controller; routes: các cặp (phương thức HTTP, đường dẫn đầy đủ)
+Controller = namedtuple('Controller', 'name prefix routes')
+# modules: {tên module: [Controller]}; pages: các đường dẫn frontend; reparsed: số file phải phân tích lại
+ProjectScan = namedtuple('ProjectScan', 'modules entities pages reparsed')
+
+
+def _join_route(prefix, path):
+    parts = [part.strip('/') for part in (prefix, path) if part and part.strip('/')]
+    return '/' + '/'.join(parts)
+
+
+def parse_controller_source(text):
+    """Các controller trong một file *.controller.ts, mỗi route gắn với controller đứng trước nó."""
+    matches = list(_CONTROLLER_RE.finditer(text))
+    controllers = []
+    for i, m in enumerate(matches):
+        prefix = m.group(1) if m.group(1) is not None else (m.group(2) or '')
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        routes = [
+            (r.group(1).upper(), _join_route(prefix, r.group(2) if r.group(2) is not None else r.group(3)))
+            for r in _ROUTE_RE.finditer(text, m.end(), end)
+        ]
+        controllers.append(Controller(m.group(3), prefix, routes))
+    return controllers
+
+
+def parse_frontend_routes(text):
+    """Các đường dẫn khai báo bằng <Route path=...> trong một file .tsx."""
+    return [m.group(1) if m.group(1) is not None else m.group(2) for m in _FRONTEND_ROUTE_RE.finditer(text)]
+
+
+def _scan_file(path, parser, cached):
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if cached and cached[0] == stamp:
+        return path, cached
+    with open(path, encoding='utf-8') as f:
+        return path, (stamp, parser(f.read()))
+
+
+def _walk(top, suffixes):
+    found = []
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames[:] = [name for name in dirnames if name not in ('node_modules', 'dist')]
+        found.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(suffixes))
+    return found
+
+
+def scan_project(root, cache_dir=DEFAULT_CACHE_DIR, workers=8):
+    """Quét backend/src/modules, backend/src/entities và frontend/src dưới `root`."""
+    modules_dir = os.path.join(root, 'backend', 'src', 'modules')
+    entities_dir = os.path.join(root, 'backend', 'src', 'entities')
+    frontend_dir = os.path.join(root, 'frontend', 'src')
+    cache_path = os.path.join(cache_dir, f'project-v{SCANNER_VERSION}.pickle') if cache_dir else None
+    cache = {}
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cache = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Entity có cache riêng trong entity_scan, chạy song song với phần còn lại
+        entities_future = pool.submit(scan_entities, entities_dir, cache_dir)
+        jobs = [(path, parse_controller_source) for path in sorted(_walk(modules_dir, ('.controller.ts',)))]
+        jobs += [(path, parse_frontend_routes) for path in sorted(_walk(frontend_dir, ('.tsx',)))]
+        results = dict(pool.map(lambda job: _scan_file(job[0], job[1], cache.get(job[0])), jobs))
+        entities, reparsed = entities_future.result()
+
+    reparsed += sum(1 for path in results if results[path] is not cache.get(path))
+    if cache_path and (set(cache) != set(results) or any(results[p] is not cache.get(p) for p in results)):
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+
+    with os.scandir(modules_dir) as it:
+        modules = {entry.name: [] for entry in sorted(it, key=lambda e: e.name) if entry.is_dir()}
+    pages = []
+    for path, parser in jobs:
+        found = results[path][1]
+        if parser is parse_frontend_routes:
+            pages.extend(found)
+        else:
+            module = os.path.relpath(path, modules_dir).split(os.sep)[0]
+            modules.setdefault(module, []).extend(found)
+    return ProjectScan(modules, entities, pages, reparsed)
@@ -0,0 +1,208 @@
+"""Lập kế hoạch và đổi tên hàng loạt ảnh chụp màn hình trong một thư mục.
+
+Mỗi thư mục chỉ được quét một lần bằng os.scandir; toàn bộ kế hoạch (tên cũ ->
+tên mới) được dựng trong bộ nhớ trước khi đổi tên file nào. Các xung đột (hai
+file cùng tên đích, tên đích đã có file khác) bị loại khỏi kế hoạch; chuỗi đổi
+tên được sắp để mỗi tên đích đã trống khi tới lượt, và mỗi chu trình (a -> b,
+b -> a) chỉ tốn đúng một bước qua tên tạm.
+
+Các bước được ghi vào journal trong thư mục trước khi thực hiện và đánh dấu
+sau mỗi lần đổi tên; nếu process chết giữa chừng, rollback_folder đưa thư mục
+về đúng trạng thái ban đầu.
+"""
+import json
+import os
+import unicodedata
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+JOURNAL_NAME = '.rename_journal.jsonl'
+_TEMP_SUFFIX = '.renaming'
+
+Move = namedtuple('Move', 'src dst')
+# moves: các cặp đổi tên hợp lệ; conflicts: (tên file, tên đích, lý do); steps: các bước đã sắp (kể cả tên tạm)
+RenamePlan = namedtuple('RenamePlan', 'folder moves conflicts steps')
+
+
+def name_key(name):
+    """Khóa so sánh tên file: NFC + không phân biệt hoa thường (an toàn trên macOS/Windows)."""
+    return unicodedata.normalize('NFC', name).casefold()
+
+
+def target_name(filename, mapping):
+    """Tên tiếng Việt của một ảnh, hoặc None nếu giữ nguyên.
+
+    Tên đã là tên tiếng Việt (có trong mapping, có dấu cách hoặc ký tự ngoài
+    ASCII) được giữ nguyên để chạy lại script không đổi tên lần nữa.
+    """
+    if filename.endswith('.png.tmp'):
+        # File còn sót lại từ lần đổi tên tạm trước đây
+        filename = filename[:-4]
+    elif not filename.endswith('.png'):
+        return None
+    name = unicodedata.normalize('NFC', filename)
+    stem = os.path.splitext(name)[0]
+    new_name = mapping.get(name.lower())
+    if new_name is None:
+        if name in mapping.values() or ' ' in stem or not stem.isascii():
+            return name
+        new_name = stem.replace('_', ' ').capitalize() + '.png'
+    return new_name
+
+
+def is_plain_name(name):
+    """Tên file đơn thuần trong thư mục: không rỗng, không phải '.'/'..', không chứa dấu phân cách thư mục."""
+    separators = {'/', os.sep} | ({os.altsep} if os.altsep else set())
+    return name not in ('', '.', '..') and not any(sep in name for sep in separators)
+
+
+def _resolve_conflicts(names, wanted):
+    """Loại các đổi tên xung đột; lặp tới khi ổn định vì file bị giữ lại có thể chặn file khác."""
+    conflicts = [(src, dst, 'tên đích chứa dấu phân cách thư mục') for src, dst in wanted.items()
+                 if not is_plain_name(dst)]
+    moves = {src: dst for src, dst in wanted.items() if is_plain_name(dst)}
+    while True:
+        # Tên (theo khóa) vẫn bị chiếm sau khi đổi: file không đổi tên và các đích
+        staying = {name_key(name) for name in names if name not in moves}
+        by_target = {}
+        for src, dst in moves.items():
+            by_target.setdefault(name_key(dst), []).append(src)
+        dropped = []
+        for src, dst in moves.items():
+            sources = by_target[name_key(dst)]
+            if len(sources) > 1:
+                dropped.append((src, dst, 'trùng tên đích với ' + ', '.join(s for s in sources if s != src)))
+            elif name_key(dst) in staying and name_key(dst) != name_key(src):
+                dropped.append((src, dst, 'tên đích đã tồn tại'))
+        if not dropped:
+            return [Move(src, dst) for src, dst in moves.items()], conflicts
+        for src, dst, reason in dropped:
+            del moves[src]
+            conflicts.append((src, dst, reason))
+
+
+def _temp_name(name, taken):
+    tmp = f'.{name}{_TEMP_SUFFIX}'
+    i = 1
+    while name_key(tmp) in taken:
+        i += 1
+        tmp = f'.{name}.{i}{_TEMP_SUFFIX}'
+    taken.add(name_key(tmp))
+    return tmp
+
+
+def order_moves(moves, names):
+    """Sắp các đổi tên thành các bước thực hiện tuần tự, thêm một bước tên tạm cho mỗi chu trình.
+
+    Sau khi loại xung đột, mỗi tên đích chỉ thuộc một file nên các đổi tên tạo
+    thành các chuỗi và chu trình rời nhau.
+    """
+    pending = {name_key(move.src): move for move in moves}
+    # tên -> đổi tên đang chờ tên đó trống
+    waiting = {name_key(move.dst): move for move in moves if name_key(move.dst) != name_key(move.src)}
+    taken = {name_key(name) for name in names} | {name_key(move.dst) for move in moves}
+    steps = []
+
+    def release(move, src):
+        # Thực hiện move rồi lần ngược chuỗi: file đang chờ tên vừa trống được đổi tiếp
+        while True:
+            steps.append((src, move.dst))
+            del pending[name_key(move.src)]
+            move = waiting.get(name_key(move.src))
+            if move is None or name_key(move.src) not in pending:
+                return
+            src = move.src
+
+    for move in moves:
+        dst = name_key(move.dst)
+        if name_key(move.src) in pending and (dst not in pending or dst == name_key(move.src)):
+            release(move, move.src)
+    # Còn lại chỉ là các chu trình: chuyển một file sang tên tạm để phá chu trình
+    for move in moves:
+        if name_key(move.src) not in pending:
+            continue
+        tmp = _temp_name(move.src, taken)
+        steps.append((move.src, tmp))
+        del pending[name_key(move.src)]
+        release(waiting[name_key(move.src)], waiting[name_key(move.src)].src)
+        steps.append((tmp, move.dst))
+    return steps
+
+
+def plan_folder(folder, mapping):
+    """Quét thư mục một lần và dựng kế hoạch đổi tên đầy đủ."""
+    with os.scandir(folder) as it:
+        names = [entry.name for entry in it if entry.name != JOURNAL_NAME]
+    wanted = {}
+    for name in names:
+        new_name = target_name(name, mapping)
+        # So sánh dạng NFC: HFS+ luôn trả tên dạng NFD, không cần đổi tên lại mỗi lần chạy
+        if new_name is not None and new_name != unicodedata.normalize('NFC', name):
+            wanted[name] = new_name
+    moves, conflicts = _resolve_conflicts(names, wanted)
+    return RenamePlan(folder, moves, conflicts, order_moves(moves, names))
+
+
+def apply_plan(plan):
+    """Thực hiện các bước của kế hoạch dưới journal; xóa journal khi hoàn tất."""
+    if not plan.steps:
+        return 0
+    journal_path = os.path.join(plan.folder, JOURNAL_NAME)
+    with open(journal_path, 'x', encoding='utf-8') as journal:
+        journal.write(json.dumps({'steps': plan.steps}, ensure_ascii=False) + '\n')
+        journal.flush()
+        os.fsync(journal.fileno())
+        for i, (src, dst) in enumerate(plan.steps):
+            os.rename(os.path.join(plan.folder, src), os.path.join(plan.folder, dst))
+            # Ghi ra OS sau mỗi bước: process chết giữa chừng vẫn còn đủ dấu vết để rollback
+            journal.write(f'{i}\n')
+            journal.flush()
+    os.remove(journal_path)
+    return len(plan.steps)
+
+
+def rollback_folder(folder):
+    """Hoàn tác các bước đã thực hiện theo journal còn sót lại; trả về số bước đã hoàn tác."""
+    journal_path = os.path.join(folder, JOURNAL_NAME)
+    try:
+        with open(journal_path, encoding='utf-8') as journal:
+            lines = journal.read().splitlines()
+    except FileNotFoundError:
+        return 0
+    steps = json.loads(lines[0])['steps'] if lines else []
+    done = sum(1 for line in lines[1:] if line.strip().isdigit())
+    # Bước đang dở khi process chết: đã đổi tên nhưng chưa kịp ghi journal
+    if done < len(steps):
+        src, dst = steps[done]
+        if not os.path.exists(os.path.join(folder, src)) and os.path.exists(os.path.join(folder, dst)):
+            done += 1
+    for src, dst in reversed(steps[:done]):
+        os.rename(os.path.join(folder, dst), os.path.join(folder, src))
+    os.remove(journal_path)
+    return done
+
+
+def rename_folders(folders, mapping, dry_run=False, workers=None):
+    """Lập kế hoạch và đổi tên song song trên nhiều thư mục.
+
+    Journal còn sót lại từ lần chạy bị ngắt được rollback trước khi quét thư mục.
+    Trả về các bộ (RenamePlan, số bước đã hoàn tác, lỗi) theo thứ tự `folders`;
+    lỗi là None, hoặc OSError khi đổi tên thất bại, khi đó thư mục đã được đưa
+    về trạng thái ban đầu và các thư mục khác vẫn được xử lý.
+    """
+    def run(folder):
+        undone = 0 if dry_run else rollback_folder(folder)
+        plan = plan_folder(folder, mapping)
+        if not dry_run:
+            try:
+                apply_plan(plan)
+            except OSError as e:
+                rollback_folder(folder)
+                return plan, undone, e
+        return plan, undone, None
+
+    folders = [folder for folder in folders if os.path.isdir(folder)]
+    if len(folders) <= 1 or workers == 1:
+        return [run(folder) for folder in folders]
+    with ThreadPoolExecutor(max_workers=workers or min(len(folders), 8)) as pool:
+        return list(pool.map(run, folders))
@@ -0,0 +1,100 @@
+"""Template .dotx dùng chung cho các script sinh tài liệu, có sẵn style 'hinh', 'mota' và 'bang'.
+
+Các script mở template này thay vì `Document()` rồi tạo/sửa style lúc chạy;
+đoạn văn chỉ tham chiếu style theo id (tra một lần qua StyleRegistry), không
+còn định dạng trực tiếp lặp lại trong document.xml.
+
+Dựng lại template khi đổi STYLES: python -m doctools.report_template
+"""
+import io
+import os
+import zipfile
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches, Pt, RGBColor
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'templates', 'report_base.dotx')
+
+_DOCUMENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml'
+_TEMPLATE_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml'
+
+# Tên style -> thuộc tính; mọi style đều là style đoạn văn
+STYLES = {
+    # Tiêu đề bảng trong database_schema*.docx
+    'bang': {'font': 'Times New Roman', 'size': Pt(13), 'color': RGBColor(0, 0, 0)},
+    # Chú thích hình trong bao_cao_chuong5.docx
+    'hinh': {'font': 'Times New Roman', 'size': Pt(12), 'bold': True, 'color': RGBColor(0, 0, 0)},
+    # Đoạn mô tả chức năng dưới mỗi hình
+    'mota': {
+        'font': 'Times New Roman', 'size': Pt(13),
+        'first_line_indent': Inches(0.5),  # 1.27cm = 0.5 inches
+        'space_after': Pt(12),
+        'alignment': WD_ALIGN_PARAGRAPH.JUSTIFY,
+    },
+}
+
+
+def _swap_content_type(blob, old, new):
+    """Đổi content type của phần document chính trong gói (docx <-> dotx)."""
+    src = zipfile.ZipFile(io.BytesIO(blob))
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == '[Content_Types].xml':
+                data = data.replace(old.encode(), new.encode())
+            dst.writestr(item, data)
+    return out.getvalue()
+
+
+def build_template(path=TEMPLATE_PATH):
+    """Dựng template từ STYLES và ghi ra `path` (.dotx)."""
+    doc = Document()
+    for name, spec in STYLES.items():
+        style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.font.name = spec['font']
+        style.font.size = spec['size']
+        if spec.get('bold'):
+            style.font.bold = True
+        if 'color' in spec:
+            style.font.color.rgb = spec['color']
+        paragraph_format = style.paragraph_format
+        for attr in ('first_line_indent', 'space_after', 'alignment'):
+            if attr in spec:
+                setattr(paragraph_format, attr, spec[attr])
+    out = io.BytesIO()
+    doc.save(out)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_swap_content_type(out.getvalue(), _DOCUMENT_TYPE, _TEMPLATE_TYPE))
+    return path
+
+
+# Nội dung template (đã đổi sang content type docx) theo đường dẫn, đọc một lần mỗi process
+_TEMPLATE_BLOBS = {}
+
+
+def load_base_document(path=TEMPLATE_PATH):
+    """Tài liệu mới dựa trên template; python-docx chỉ mở được docx nên content type được đổi trong bộ nhớ."""
+    blob = _TEMPLATE_BLOBS.get(path)
+    if blob is None:
+        with open(path, 'rb') as f:
+            blob = _TEMPLATE_BLOBS[path] = _swap_content_type(f.read(), _TEMPLATE_TYPE, _DOCUMENT_TYPE)
+    return Document(io.BytesIO(blob))
+
+
+class StyleRegistry:
+    """Bảng tên style -> style id của một tài liệu, tra một lần khi khởi tạo."""
+
+    def __init__(self, doc):
+        self._ids = {style.name: style.style_id for style in doc.styles}
+
+    def __getitem__(self, name):
+        return self._ids[name]
+
+
+if __name__ == '__main__':
+    print(f'Đã tạo file {build_template()} thành công!')
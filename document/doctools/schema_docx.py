@@ -0,0 +1,114 @@
+"""Dựng các bảng mô tả CSDL trong database_schema.docx."""
+from itertools import islice
+
+from docx.shared import Inches
+
+from .docx_append import BodyAppender
+from .fragment_cache import content_key
+from .profiling import NULL_PROFILER
+from .report_template import StyleRegistry, load_base_document
+from .table_xml import TableTemplate, paragraph_xml, parse_fragments
+
+HEADER = ('STT', 'Tên thuộc tính', 'Kiểu dữ liệu', 'Khóa', 'Mô tả')
+COLUMN_WIDTHS = (
+    Inches(0.2),  # STT column width
+    Inches(2.0),  # Tên thuộc tính
+    Inches(1.3),  # Kiểu dữ liệu
+    Inches(1.0),  # Khóa
+    Inches(3.0),  # Mô tả
+)
+CAPACITY_HEADER = ('Số hàng', 'Dữ liệu', 'Chỉ mục', 'Tổng')
+CAPACITY_WIDTHS = (Inches(1.2), Inches(1.6), Inches(1.6), Inches(1.6))
+
+# Số bảng được parse chung trong một lần khi nối vào tài liệu
+BATCH_SIZE = 200
+
+# Đoạn XML được cache không chứa số thứ tự bảng; ký tự này đánh dấu chỗ điền số
+# khi ghép lại (không thể xuất hiện trong XML hợp lệ)
+_COUNTER = '\x00'
+
+
+def new_document():
+    """Tài liệu trống từ template dùng chung (đã có style 'bang' cho tiêu đề bảng)."""
+    return load_base_document()
+
+
+class SchemaTableRenderer:
+    """Render tiêu đề + bảng thuộc tính của một bảng CSDL thành chuỗi XML."""
+
+    def __init__(self, doc, caption_style='bang'):
+        styles = StyleRegistry(doc)
+        self.caption_style_id = styles[caption_style]
+        self.template = TableTemplate(
+            HEADER, COLUMN_WIDTHS, doc._block_width,
+            style_id=styles['Table Grid'],
+        )
+        self.capacity_template = TableTemplate(
+            CAPACITY_HEADER, CAPACITY_WIDTHS, doc._block_width,
+            style_id=styles['Table Grid'], align='center',
+        )
+        # Thay đổi style/độ rộng cột làm mọi đoạn đã cache hết hiệu lực
+        self.settings_key = content_key(self.caption_style_id, self.template.render(()),
+                                        self.capacity_template.render(()))
+
+    def _render(self, table):
+        # Tiêu đề bảng căn giữa, bảng thuộc tính, quan hệ (nếu có), sau đó một đoạn trống
+        parts = [
+            paragraph_xml(f"Bảng 4.{_COUNTER} {table['name']}", self.caption_style_id, 'center'),
+            self.template.render((str(idx), *field) for idx, field in enumerate(table['fields'], 1)),
+        ]
+        if 'referenced_by' in table:
+            referenced_by = ', '.join(table['referenced_by']) or 'không có'
+            parts.append(paragraph_xml(f'Được tham chiếu bởi: {referenced_by}.'))
+            parts.append(paragraph_xml(f"Độ sâu phụ thuộc: {table['depth']}."))
+        if 'capacity' in table:
+            row_bytes, index_bytes, rows = table['capacity']
+            parts.append(paragraph_xml(
+                f'Ước tính dung lượng (~{row_bytes:.0f} B/hàng dữ liệu, ~{index_bytes:.0f} B/hàng chỉ mục):'))
+            parts.append(self.capacity_template.render(rows))
+        parts.append(paragraph_xml())
+        return ''.join(parts)
+
+    def render(self, table_counter, table, cache=None):
+        if cache is None:
+            fragment = self._render(table)
+        else:
+            key = content_key(self.settings_key, table['name'], table['fields'],
+                              table.get('referenced_by'), table.get('depth'), table.get('capacity'))
+            fragment = cache.get_or_render(key, lambda: self._render(table))
+        return fragment.replace(_COUNTER, str(table_counter), 1)
+
+
+def render_schema_tables(doc, records, caption_style='bang', cache=None, profiler=None):
+    """Sinh lần lượt chuỗi XML của từng bảng; `records` có thể là generator.
+
+    Nếu có `cache` (FragmentCache), chỉ những bảng có tên/thuộc tính thay đổi mới
+    được render lại. Thời gian từng bảng được ghi vào `profiler` (giai đoạn 'render').
+    """
+    profiler = profiler or NULL_PROFILER
+    renderer = SchemaTableRenderer(doc, caption_style)
+    for counter, table in enumerate(records, 1):
+        with profiler.item('table', table['name']), profiler.stage('render'):
+            fragment = renderer.render(counter, table, cache)
+        yield fragment
+
+
+def append_fragments(doc, fragments, batch_size=BATCH_SIZE, prefixes=('w',), profiler=None):
+    """Parse các đoạn XML theo lô và nối vào cuối body (giai đoạn 'xml' của `profiler`)."""
+    profiler = profiler or NULL_PROFILER
+    body = BodyAppender(doc)
+    fragments = iter(fragments)
+    while True:
+        batch = list(islice(fragments, batch_size))
+        if not batch:
+            break
+        with profiler.stage('xml'):
+            for element in parse_fragments(batch, prefixes):
+                body.append(element)
+    return doc
+
+
+def add_schema_tables(doc, db_schema, caption_style='bang', batch_size=BATCH_SIZE, cache=None, profiler=None):
+    """Thêm tiêu đề và bảng thuộc tính cho từng bảng trong db_schema vào cuối tài liệu."""
+    return append_fragments(doc, render_schema_tables(doc, db_schema, caption_style, cache, profiler), batch_size,
+                            profiler=profiler)
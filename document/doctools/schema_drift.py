@@ -0,0 +1,66 @@
+"""So sánh cấu trúc CSDL giữa entity TypeORM, system_elearning.sql và overlay mô tả (db_schema)."""
+from collections import namedtuple
+
+Drift = namedtuple('Drift', 'table column kind detail')
+
+
+def compare_entities(entities, model, overlay=None):
+    """Trả về danh sách Drift, sắp theo bảng rồi theo cột."""
+    findings = []
+    sql_tables = {t['name']: t for t in model}
+    entity_tables = {e['table']: e for e in entities if e['table']}
+    class_to_table = {e['class']: e['table'] for e in entities}
+
+    for name in sorted(entity_tables.keys() - sql_tables.keys()):
+        findings.append(Drift(name, None, 'table', 'có entity nhưng không có CREATE TABLE trong SQL'))
+    for name in sorted(sql_tables.keys() - entity_tables.keys()):
+        findings.append(Drift(name, None, 'table', 'có trong SQL nhưng không có entity'))
+
+    for name in sorted(entity_tables.keys() & sql_tables.keys()):
+        entity, table = entity_tables[name], sql_tables[name]
+        sql_columns = {c['name']: c for c in table['columns']}
+        entity_columns = {c['name']: c for c in entity['columns']}
+        for column in entity['columns']:
+            sql_column = sql_columns.get(column['name'])
+            if sql_column is None:
+                findings.append(Drift(name, column['name'], 'column', 'có trong entity nhưng không có trong SQL'))
+                continue
+            if column['type'] != sql_column['type']:
+                note = ' (kiểu mặc định của TypeORM, nên khai báo type)' if column['type_inferred'] else ''
+                findings.append(Drift(name, column['name'], 'type',
+                                      f"entity {column['type']} ≠ SQL {sql_column['type']}{note}"))
+            if column['decorator'] == 'Column' and not column['primary'] \
+                    and column['nullable'] != sql_column['nullable']:
+                findings.append(Drift(name, column['name'], 'nullable',
+                                      f"entity nullable={column['nullable']} ≠ SQL nullable={sql_column['nullable']}"))
+        for column_name in sql_columns.keys() - entity_columns.keys():
+            findings.append(Drift(name, column_name, 'column', 'có trong SQL nhưng entity không khai báo'))
+
+        sql_fks = {col: fk['ref_table'] for fk in table['foreign_keys'] for col in fk['columns']}
+        entity_fks = {}
+        for relation in entity['relations']:
+            if relation['kind'] in ('ManyToOne', 'OneToOne') and relation['join_column']:
+                entity_fks[relation['join_column']] = class_to_table.get(relation['target'], relation['target'])
+        for column_name, target in entity_fks.items():
+            if column_name not in sql_fks:
+                findings.append(Drift(name, column_name, 'relation',
+                                      f'@JoinColumn tới {target} nhưng SQL không có FOREIGN KEY'))
+            elif sql_fks[column_name] != target:
+                findings.append(Drift(name, column_name, 'relation',
+                                      f'entity tham chiếu {target} ≠ SQL tham chiếu {sql_fks[column_name]}'))
+        for column_name in sql_fks.keys() - entity_fks.keys():
+            findings.append(Drift(name, column_name, 'relation',
+                                  f'SQL có FOREIGN KEY tới {sql_fks[column_name]} nhưng entity không có @JoinColumn'))
+
+    # Mô tả viết tay cho bảng/cột không còn trong SQL (db_schema trong tài liệu bị lệch)
+    for name, info in (overlay or {}).items():
+        table = sql_tables.get(name)
+        if table is None:
+            findings.append(Drift(name, None, 'overlay', 'overlay mô tả bảng không có trong SQL'))
+            continue
+        sql_columns = {c['name'] for c in table['columns']}
+        for column_name in info.get('columns', {}):
+            if column_name not in sql_columns:
+                findings.append(Drift(name, column_name, 'overlay', 'overlay mô tả cột không có trong SQL'))
+
+    return sorted(findings, key=lambda d: (d.table, d.column or '', d.kind))
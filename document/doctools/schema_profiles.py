@@ -0,0 +1,176 @@
+"""Render nhiều dạng tài liệu CSDL từ một model đã nạp sẵn.
+
+Model (các bảng phân tích từ SQL + overlay mô tả) được nạp một lần ở process
+chính rồi chia sẻ cho các worker qua initializer của ProcessPoolExecutor, mỗi
+dạng tài liệu (profile) được render trong một process riêng.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from docx.shared import Inches
+
+from .docx_stream import save_streaming
+from .fk_graph import FkGraph
+from .fragment_cache import FragmentCache
+from .profiling import NULL_PROFILER, Profiler
+from .report_template import StyleRegistry
+from .schema_docx import append_fragments, new_document, render_schema_tables
+from .sql_schema import DEFAULT_CACHE_DIR, PROFILE_OUTPUTS, iter_db_schema
+from .table_xml import TableTemplate, paragraph_xml
+
+SUMMARY_TITLE = 'Tổng quan lược đồ cơ sở dữ liệu hệ thống E-Learning'
+SUMMARY_HEADER = ('STT', 'Tên bảng', 'Mô tả')
+SUMMARY_WIDTHS = (Inches(0.5), Inches(2.2), Inches(3.3))
+
+RELATION_HEADER = ('STT', 'Cột', 'Tham chiếu', 'Khi xóa', 'Khi cập nhật')
+RELATION_WIDTHS = (Inches(0.4), Inches(1.8), Inches(2.2), Inches(1.0), Inches(1.1))
+
+# Model dùng chung trong mỗi process worker, gán bởi _init_worker
+_MODEL = None
+
+
+def with_relations(records, graph):
+    """Bổ sung danh sách bảng tham chiếu tới và độ sâu phụ thuộc cho từng bản ghi."""
+    depth = graph.depths()
+    for record in records:
+        record['referenced_by'] = [
+            f"{src}({', '.join(cols)})" for src, cols in graph.referenced_by(record['table'])
+        ]
+        record['depth'] = depth.get(record['table'], 0)
+        yield record
+
+
+def with_capacity(records, capacity):
+    """Gắn ước tính dung lượng (xem capacity.capacity_by_table) cho các bảng có trong `capacity`."""
+    for record in records:
+        if record['table'] in capacity:
+            record['capacity'] = capacity[record['table']]
+        yield record
+
+
+def _save_fragments(doc, out_path, fragments, label, stream, profiler):
+    """Nối các đoạn XML vào cuối body của `doc` rồi lưu ra `out_path`.
+
+    Với `stream`, các đoạn được ghi thẳng vào zip (docx_stream) nên giai đoạn
+    'save' bao cả 'render' vì `fragments` được render trong lúc ghi.
+    """
+    if stream:
+        with profiler.cprofile(label), profiler.stage('save'):
+            save_streaming(doc, out_path, fragments)
+    else:
+        with profiler.cprofile(label):
+            append_fragments(doc, fragments, profiler=profiler)
+        with profiler.stage('save'):
+            doc.save(out_path)
+
+
+def render_full(model, out_path, stream=False, cache=None, profiler=None):
+    """Bảng thuộc tính đầy đủ của từng bảng (database_schema.docx)."""
+    profiler = profiler or NULL_PROFILER
+    doc = new_document()
+    records = with_relations(iter_db_schema(model['tables'], model['overlay']), FkGraph(model['tables']))
+    if model.get('capacity'):
+        records = with_capacity(records, model['capacity'])
+    _save_fragments(doc, out_path, render_schema_tables(doc, records, cache=cache, profiler=profiler), 'full',
+                    stream, profiler)
+
+
+def render_summary(model, out_path, stream=False, cache=None, profiler=None):
+    """Một bảng tóm tắt: tên bảng và mô tả ngắn (database_schema_summary.docx)."""
+    profiler = profiler or NULL_PROFILER
+    doc = new_document()
+    doc.add_heading(SUMMARY_TITLE, level=0)
+    template = TableTemplate(SUMMARY_HEADER, SUMMARY_WIDTHS, doc._block_width,
+                             style_id=StyleRegistry(doc)['Table Grid'], align='center')
+    def fragments():
+        with profiler.stage('render'):
+            records = iter_db_schema(model['tables'], model['overlay'])
+            rows = ((str(idx), record['table'], record['description']) for idx, record in enumerate(records, 1))
+            fragment = template.render(rows)
+        yield fragment
+        yield paragraph_xml()
+
+    _save_fragments(doc, out_path, fragments(), 'summary', stream, profiler)
+
+
+def render_relations(model, out_path, stream=False, cache=None, profiler=None):
+    """Chỉ các khóa ngoại của từng bảng (database_schema_relations.docx)."""
+    profiler = profiler or NULL_PROFILER
+    doc = new_document()
+    styles = StyleRegistry(doc)
+    caption_style_id = styles['bang']
+    template = TableTemplate(RELATION_HEADER, RELATION_WIDTHS, doc._block_width,
+                             style_id=styles['Table Grid'])
+    overlay = model['overlay']
+
+    def fragments():
+        counter = 0
+        for table in model['tables']:
+            if not table['foreign_keys']:
+                continue
+            counter += 1
+            title = overlay.get(table['name'], {}).get('title')
+            name = f"{title} ({table['name']})" if title else table['name']
+            rows = (
+                (
+                    str(idx),
+                    ', '.join(fk['columns']),
+                    f"{fk['ref_table']}({', '.join(fk['ref_columns'])})",
+                    fk['on_delete'] or 'RESTRICT',
+                    fk['on_update'] or 'RESTRICT',
+                )
+                for idx, fk in enumerate(table['foreign_keys'], 1)
+            )
+            with profiler.item('table', table['name']), profiler.stage('render'):
+                fragment = (
+                    paragraph_xml(f'Bảng 4.{counter} Quan hệ của {name}', caption_style_id, 'center')
+                    + template.render(rows)
+                    + paragraph_xml()
+                )
+            yield fragment
+
+    _save_fragments(doc, out_path, fragments(), 'relations', stream, profiler)
+
+
+PROFILES = {
+    'full': (PROFILE_OUTPUTS['full'], render_full),
+    'summary': (PROFILE_OUTPUTS['summary'], render_summary),
+    'relations': (PROFILE_OUTPUTS['relations'], render_relations),
+}
+
+
+def _init_worker(model):
+    global _MODEL
+    _MODEL = model
+
+
+def _run_profile(profile, out_path, stream, use_cache, profile_options=None):
+    renderer = PROFILES[profile][1]
+    profiler = Profiler(**profile_options).start() if profile_options is not None else None
+    cache = None
+    if use_cache and profile == 'full':
+        cache_name = os.path.splitext(os.path.basename(out_path))[0] + '.pickle'
+        cache = FragmentCache(os.path.join(DEFAULT_CACHE_DIR, 'schema_fragments', cache_name))
+    renderer(_MODEL, out_path, stream=stream, cache=cache, profiler=profiler)
+    report = profiler.report() if profiler is not None else None
+    if cache is not None:
+        cache.save()
+        return profile, out_path, cache.summary(), report
+    return profile, out_path, None, report
+
+
+def render_profiles(model, profiles, out_dir='.', stream=False, use_cache=True, workers=None, profile_options=None):
+    """Render các profile song song trong process pool, trả về [(profile, file, thống kê cache, report)].
+
+    Với `profile_options` (tham số của Profiler), mỗi profile được đo trong process của nó và
+    report là Profiler.report(); ngược lại report là None.
+    """
+    jobs = [(profile, os.path.join(out_dir, PROFILES[profile][0]), stream, use_cache, profile_options)
+            for profile in profiles]
+    if len(jobs) <= 1 or workers == 1:
+        _init_worker(model)
+        return [_run_profile(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers or len(jobs), initializer=_init_worker,
+                             initargs=(model,)) as pool:
+        futures = [pool.submit(_run_profile, *job) for job in jobs]
+        return [future.result() for future in futures]
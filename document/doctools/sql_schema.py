@@ -0,0 +1,239 @@
+"""Đọc cấu trúc CSDL trực tiếp từ file dump MySQL (system_elearning.sql).
+
+Kết quả phân tích được lưu vào cache trên đĩa, khóa theo hash nội dung file SQL,
+nên lần chạy sau với dump không đổi sẽ bỏ qua hoàn toàn bước phân tích.
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+
+# Tăng số này khi thay đổi cấu trúc model để cache cũ tự hết hiệu lực
+PARSER_VERSION = 1
+
+# Biến môi trường DOCTOOLS_CACHE_DIR đổi thư mục cache (ví dụ: benchmark chạy với cache riêng, trống)
+DEFAULT_CACHE_DIR = (os.environ.get('DOCTOOLS_CACHE_DIR')
+                     or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache'))
+
+# Tên file đầu ra của từng dạng tài liệu CSDL (profile), theo thứ tự sinh mặc định
+PROFILE_OUTPUTS = {
+    'full': 'database_schema.docx',
+    'summary': 'database_schema_summary.docx',
+    'relations': 'database_schema_relations.docx',
+}
+
+_CREATE_TABLE_RE = re.compile(
+    r'CREATE TABLE\s+`(?P<name>[^`]+)`\s*\((?P<body>.*?)\n\)(?P<options>[^;]*);',
+    re.S | re.I,
+)
+_COLUMN_RE = re.compile(r'`(?P<name>[^`]+)`\s+(?P<type>\w+(?:\((?:[^()\']|\'(?:[^\']|\'\')*\')*\))?)(?P<rest>.*)', re.S)
+_IDENT_LIST_RE = re.compile(r'`([^`]+)`')
+_PRIMARY_RE = re.compile(r'PRIMARY KEY\s*\((?P<cols>[^)]*)\)', re.I)
+_UNIQUE_RE = re.compile(r'UNIQUE KEY\s+`(?P<name>[^`]+)`\s*\((?P<cols>[^)]*)\)', re.I)
+_KEY_RE = re.compile(r'(?:FULLTEXT\s+|SPATIAL\s+)?KEY\s+`(?P<name>[^`]+)`\s*\((?P<cols>[^)]*)\)', re.I)
+_FOREIGN_RE = re.compile(
+    r'CONSTRAINT\s+`(?P<name>[^`]+)`\s+FOREIGN KEY\s*\((?P<cols>[^)]*)\)\s*'
+    r'REFERENCES\s+`(?P<ref_table>[^`]+)`\s*\((?P<ref_cols>[^)]*)\)(?P<actions>.*)',
+    re.I | re.S,
+)
+_COMMENT_RE = re.compile(r"COMMENT\s+'(?P<text>(?:[^'\\]|\\.|'')*)'", re.I)
+_DEFAULT_RE = re.compile(r"DEFAULT\s+('(?:[^'\\]|\\.|'')*'|\S+)", re.I)
+
+
+def _split_definitions(body):
+    """Tách phần thân CREATE TABLE theo dấu phẩy ở cấp ngoài cùng."""
+    parts, buf, depth, quote = [], [], 0, None
+    for ch in body:
+        if quote:
+            buf.append(ch)
+            if ch == quote:
+                quote = None
+            continue
+        if ch in ("'", '`'):
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(''.join(buf).strip())
+            buf = []
+            continue
+        buf.append(ch)
+    if ''.join(buf).strip():
+        parts.append(''.join(buf).strip())
+    return parts
+
+
+def _unquote(text):
+    return text.replace("''", "'").replace("\\'", "'")
+
+
+def _short_type(raw_type):
+    """Rút gọn kiểu dữ liệu như trong tài liệu: enum('a','b') -> enum, set(...) -> set."""
+    base = raw_type.split('(', 1)[0].lower()
+    if base in ('enum', 'set'):
+        return base
+    return raw_type.lower()
+
+
+def _parse_column(definition):
+    m = _COLUMN_RE.match(definition)
+    if not m:
+        return None
+    rest = m.group('rest')
+    comment = _COMMENT_RE.search(rest)
+    default = _DEFAULT_RE.search(rest)
+    return {
+        'name': m.group('name'),
+        'type': _short_type(m.group('type')),
+        'raw_type': m.group('type'),
+        'nullable': 'NOT NULL' not in rest.upper(),
+        'default': _unquote(default.group(1).strip("'")) if default else None,
+        'auto_increment': 'AUTO_INCREMENT' in rest.upper(),
+        'comment': _unquote(comment.group('text')) if comment else '',
+    }
+
+
+def _parse_table(name, body, options):
+    table = {
+        'name': name,
+        'columns': [],
+        'primary_key': [],
+        'unique_keys': [],
+        'keys': [],
+        'foreign_keys': [],
+        'comment': '',
+    }
+    for definition in _split_definitions(body):
+        upper = definition.upper()
+        if definition.startswith('`'):
+            column = _parse_column(definition)
+            if column:
+                table['columns'].append(column)
+        elif upper.startswith('PRIMARY KEY'):
+            m = _PRIMARY_RE.match(definition)
+            table['primary_key'] = _IDENT_LIST_RE.findall(m.group('cols'))
+        elif upper.startswith('UNIQUE KEY'):
+            m = _UNIQUE_RE.match(definition)
+            table['unique_keys'].append({'name': m.group('name'), 'columns': _IDENT_LIST_RE.findall(m.group('cols'))})
+        elif upper.startswith(('KEY', 'FULLTEXT', 'SPATIAL')):
+            m = _KEY_RE.match(definition)
+            table['keys'].append({'name': m.group('name'), 'columns': _IDENT_LIST_RE.findall(m.group('cols'))})
+        elif upper.startswith('CONSTRAINT') and 'FOREIGN KEY' in upper:
+            m = _FOREIGN_RE.match(definition)
+            actions = m.group('actions').upper()
+            on_delete = re.search(r'ON DELETE (CASCADE|SET NULL|RESTRICT|NO ACTION|SET DEFAULT)', actions)
+            on_update = re.search(r'ON UPDATE (CASCADE|SET NULL|RESTRICT|NO ACTION|SET DEFAULT)', actions)
+            table['foreign_keys'].append({
+                'name': m.group('name'),
+                'columns': _IDENT_LIST_RE.findall(m.group('cols')),
+                'ref_table': m.group('ref_table'),
+                'ref_columns': _IDENT_LIST_RE.findall(m.group('ref_cols')),
+                'on_delete': on_delete.group(1) if on_delete else None,
+                'on_update': on_update.group(1) if on_update else None,
+            })
+        # Các ràng buộc CHECK không cần cho tài liệu nên bỏ qua
+    comment = _COMMENT_RE.search(options)
+    if comment:
+        table['comment'] = _unquote(comment.group('text'))
+    return table
+
+
+def iter_ddl(sql_text):
+    """Lần lượt sinh từng bảng theo thứ tự CREATE TABLE trong dump."""
+    for m in _CREATE_TABLE_RE.finditer(sql_text):
+        yield _parse_table(m.group('name'), m.group('body'), m.group('options'))
+
+
+def parse_ddl(sql_text):
+    """Phân tích toàn bộ câu lệnh CREATE TABLE, trả về danh sách bảng theo thứ tự trong dump."""
+    return list(iter_ddl(sql_text))
+
+
+def load_schema_model(sql_path, cache_dir=DEFAULT_CACHE_DIR):
+    """Đọc model từ cache nếu nội dung file SQL chưa đổi, ngược lại phân tích và ghi cache."""
+    with open(sql_path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, 'sql_schema', f'v{PARSER_VERSION}-{digest}.pickle')
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+    model = parse_ddl(raw.decode('utf-8'))
+    if cache_path:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    return model
+
+
+def load_overlay(overlay_path):
+    """Đọc phần mô tả tiếng Việt viết tay (tên bảng, mô tả bảng, mô tả từng cột)."""
+    with open(overlay_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def column_key_label(table, column_name):
+    """Nhãn cột "Khóa" trong bảng tài liệu: PK, FK, UNIQUE hoặc kết hợp."""
+    labels = []
+    if column_name in table['primary_key']:
+        labels.append('PK')
+    if any(column_name in fk['columns'] for fk in table['foreign_keys']):
+        labels.append('FK')
+    if any(uk['columns'] == [column_name] for uk in table['unique_keys']):
+        labels.append('UNIQUE')
+    return ' '.join(labels)
+
+
+def order_tables(model, overlay):
+    """Sắp bảng theo thứ tự trong overlay, các bảng chưa có trong overlay nối vào cuối theo thứ tự dump."""
+    tables = {t['name']: t for t in model}
+    ordered = [tables[name] for name in overlay if name in tables]
+    ordered += [t for t in model if t['name'] not in overlay]
+    return ordered
+
+
+def load_model(sql_paths, overlay_path):
+    """Nạp model một lần: các bảng (đã sắp theo overlay) của mọi file dump và overlay mô tả."""
+    overlay = load_overlay(overlay_path)
+    tables = [table for path in sql_paths for table in order_tables(load_schema_model(path), overlay)]
+    return {'tables': tables, 'overlay': overlay}
+
+
+def iter_db_schema(tables, overlay):
+    """Ghép từng bảng của model với overlay mô tả, sinh bản ghi db_schema theo đúng thứ tự đầu vào.
+
+    `tables` có thể là generator; cột không có mô tả viết tay dùng COMMENT trong SQL.
+    """
+    for table in tables:
+        name = table['name']
+        info = overlay.get(name, {})
+        descriptions = info.get('columns', {})
+        title = info.get('title')
+        yield {
+            'name': f'{title} ({name})' if title else name,
+            'table': name,
+            'description': info.get('description', table['comment']),
+            'fields': [
+                (
+                    col['name'],
+                    col['type'],
+                    column_key_label(table, col['name']),
+                    descriptions.get(col['name'], col['comment']),
+                )
+                for col in table['columns']
+            ],
+        }
+
+
+def build_db_schema(model, overlay):
+    """Danh sách db_schema cho tài liệu, thứ tự bảng theo overlay."""
+    return list(iter_db_schema(order_tables(model, overlay), overlay))
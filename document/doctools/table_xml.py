@@ -0,0 +1,98 @@
+"""Sinh nhanh các bảng `w:tbl` từ template XML biên dịch sẵn.
+
+Thay vì đi qua các đối tượng proxy của python-docx (`add_row().cells`, `.text`)
+cho từng ô, mỗi hàng được render bằng một chuỗi template với các giá trị đã
+escape, cả lô bảng được parse một lần rồi nối vào body. XML sinh ra giống hệt
+XML mà python-docx tạo cho cùng dữ liệu.
+"""
+from xml.sax.saxutils import escape
+
+from docx.oxml.ns import nsdecls
+from docx.oxml.parser import parse_xml
+from docx.shared import Emu
+
+_TABLE_OPEN = (
+    '<w:tbl><w:tblPr><w:tblStyle w:val="{style_id}"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:jc w:val="{align}"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+)
+
+
+def run_xml(text):
+    """XML của một `w:r` chứa `text`, theo đúng quy tắc của python-docx (tab, xuống dòng)."""
+    if not text:
+        return '<w:r/>'
+    parts = []
+    buf = []
+
+    def flush():
+        if buf:
+            chunk = ''.join(buf)
+            space = ' xml:space="preserve"' if len(chunk.strip()) < len(chunk) else ''
+            parts.append(f'<w:t{space}>{escape(chunk)}</w:t>')
+            buf.clear()
+
+    if '\t' not in text and '\n' not in text and '\r' not in text:
+        buf.append(text)
+    else:
+        for char in text:
+            if char == '\t':
+                flush()
+                parts.append('<w:tab/>')
+            elif char in '\r\n':
+                flush()
+                parts.append('<w:br/>')
+            else:
+                buf.append(char)
+    flush()
+    return f'<w:r>{"".join(parts)}</w:r>'
+
+
+def paragraph_xml(text='', style_id=None, align=None):
+    ppr = ''
+    if style_id or align:
+        ppr = '<w:pPr>'
+        if style_id:
+            ppr += f'<w:pStyle w:val="{style_id}"/>'
+        if align:
+            ppr += f'<w:jc w:val="{align}"/>'
+        ppr += '</w:pPr>'
+    if not ppr and not text:
+        return '<w:p/>'
+    return f'<w:p>{ppr}{run_xml(text) if text else ""}</w:p>'
+
+
+def _cell_template(width_twips):
+    return f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width_twips}"/></w:tcPr><w:p>{{}}</w:p></w:tc>'
+
+
+class TableTemplate:
+    """Template biên dịch sẵn cho bảng có tiêu đề cột cố định và độ rộng cột cố định."""
+
+    def __init__(self, header, column_widths, block_width, style_id='TableGrid', align='right'):
+        self.n_cols = len(header)
+        widths = [Emu(w).twips for w in column_widths]
+        # Hàng tiêu đề giữ độ rộng ban đầu (block_width chia đều), giống add_table của python-docx
+        header_width = Emu(block_width // self.n_cols).twips
+        header_cell = _cell_template(header_width)
+        self._open = (
+            _TABLE_OPEN.format(style_id=style_id, align=align)
+            + '<w:tblGrid>' + ''.join(f'<w:gridCol w:w="{w}"/>' for w in widths) + '</w:tblGrid>'
+            + '<w:tr>' + ''.join(header_cell.format(run_xml(text)) for text in header) + '</w:tr>'
+        )
+        self._row = '<w:tr>' + ''.join(_cell_template(w) for w in widths) + '</w:tr>'
+
+    def render(self, rows):
+        """Render bảng từ các tuple giá trị (chuỗi thô, chưa escape)."""
+        row = self._row.format
+        return self._open + ''.join(row(*map(run_xml, values)) for values in rows) + '</w:tbl>'
+
+
+def parse_fragments(xml_fragments, prefixes=('w',)):
+    """Parse một lô phần tử body (w:p, w:tbl) trong một lần, trả về danh sách phần tử.
+
+    `prefixes` là các namespace được dùng trong các đoạn (ví dụ thêm 'wp', 'r' cho hình ảnh).
+    """
+    root = parse_xml(f'<w:body {nsdecls(*prefixes)}>{"".join(xml_fragments)}</w:body>')
+    return list(root)
@@ -1,660 +1,78 @@
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+import argparse
+import os
 
-# Dữ liệu chi tiết cho từng bảng (đã cập nhật theo Structure.sql)
-db_schema = [
-    {
-        "name": "Khoa (faculties)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("faculty_code", "varchar(50)", "UNIQUE", "Mã khoa (VD: FIT, FBA)"),
-            ("faculty_name", "varchar(255)", "", "Tên khoa"),
-            ("description", "text", "", "Mô tả"),
-            ("status", "enum", "", "Trạng thái (active/inactive)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Ngành (majors)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("faculty_id", "bigint", "FK", "Tham chiếu faculties(id)"),
-            ("major_code", "varchar(50)", "UNIQUE", "Mã ngành (VD: SE, CS)"),
-            ("major_name", "varchar(255)", "", "Tên ngành"),
-            ("description", "text", "", "Mô tả"),
-            ("status", "enum", "", "Trạng thái (active/inactive)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Chương trình đào tạo (programs)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("major_id", "bigint", "FK", "Tham chiếu majors(id)"),
-            ("program_code", "varchar(50)", "UNIQUE", "Mã chương trình (VD: BSIT2023)"),
-            ("program_name", "varchar(255)", "", "Tên chương trình"),
-            ("description", "text", "", "Mô tả"),
-            ("total_credits", "int", "", "Tổng số tín chỉ"),
-            ("duration_years", "int", "", "Thời gian đào tạo (năm)"),
-            ("status", "enum", "", "Trạng thái (active/inactive)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Khóa học chương trình (program_courses)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("program_id", "bigint", "FK", "Tham chiếu programs(id)"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("credits", "int", "", "Số tín chỉ của môn học"),
-            ("semester", "int", "", "Học kỳ"),
-            ("practice", "int", "", "Số giờ thực hành"),
-            ("theory", "int", "", "Số giờ lý thuyết"),
-            ("is_mandatory", "tinyint(1)", "", "Môn bắt buộc hay tùy chọn"),
-            ("start_time", "date", "", "Ngày bắt đầu môn học"),
-            ("end_time", "date", "", "Ngày kết thúc môn học"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Khóa học lớp học (academic_class_courses)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("class_id", "bigint", "FK", "Tham chiếu academic_classes(id)"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Giảng viên lớp học (academic_class_instructors)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("class_id", "bigint", "FK", "Tham chiếu academic_classes(id)"),
-            ("instructor_id", "bigint", "FK", "ID của user_instructors"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Lớp học chính quy (academic_classes)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("class_code", "varchar(50)", "UNIQUE", "Mã lớp"),
-            ("class_name", "varchar(255)", "", "Tên lớp"),
-            ("major_id", "bigint", "FK", "Tham chiếu majors(id)"),
-            ("program_id", "bigint", "FK", "Tham chiếu programs(id)"),
-            ("semester", "varchar(20)", "", "Học kỳ (VD: 20231)"),
-            ("status", "enum", "", "Trạng thái (active/completed/cancelled)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Bài nộp (assignment_submissions)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("assignment_id", "bigint", "FK", "Tham chiếu assignments(id)"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("submission_text", "text", "", "Nội dung nộp"),
-            ("file_url", "varchar(255)", "", "File đính kèm"),
-            ("submitted_at", "timestamp", "", "Thời gian nộp"),
-            ("status", "enum", "", "Trạng thái (submitted/graded/late/resubmit)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Bài tập (assignments)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("lesson_id", "bigint", "FK", "Tham chiếu course_lessons(id)"),
-            ("academic_class_id", "bigint", "FK", "Lớp học nếu là bài tập học thuật"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("description", "text", "", "Mô tả"),
-            ("due_date", "timestamp", "", "Hạn nộp"),
-            ("max_score", "int", "", "Điểm tối đa"),
-            ("file_requirements", "text", "", "Yêu cầu file"),
-            ("link_document_required", "text", "", "Yêu cầu tài liệu liên kết"),
-            ("assignment_type", "enum", "", "Loại bài tập"),
-            ("start_time", "datetime", "", "Bắt đầu"),
-            ("end_time", "datetime", "", "Kết thúc"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Danh mục khóa học (categories)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("name", "varchar(100)", "", "Tên danh mục"),
-            ("description", "text", "", "Mô tả"),
-            ("status", "enum", "", "Trạng thái (active/inactive)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Chứng chỉ (certificates)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("certificate_number", "varchar(100)", "UNIQUE", "Số chứng chỉ"),
-            ("certificate_url", "varchar(255)", "", "Đường dẫn chứng chỉ"),
-            ("issue_date", "timestamp", "", "Ngày cấp"),
-            ("expiry_date", "timestamp", "", "Ngày hết hạn"),
-            ("status", "enum", "", "Trạng thái (active/expired/revoked)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Phản hồi chatbot (chatbot_response)",
-        "fields": [
-            ("id", "int", "PK", "ID tự tăng"),
-            ("keywords", "json", "", "Từ khóa"),
-            ("response", "text", "", "Câu trả lời"),
-            ("category", "varchar(50)", "", "Danh mục"),
-            ("confidence", "float", "", "Độ tin cậy"),
-        ]
-    },
-    {
-        "name": "Thảo luận bài học (course_lesson_discussions)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("lesson_id", "bigint", "FK", "Tham chiếu course_lessons(id)"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("parent_id", "bigint", "FK", "NULL cho thảo luận chính, ID của thảo luận cha cho phản hồi"),
-            ("content", "text", "", "Nội dung thảo luận"),
-            ("status", "enum", "", "Trạng thái (active/hidden/locked)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Bài học (course_lessons)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("section_id", "bigint", "FK", "Tham chiếu course_sections(id)"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("content_type", "enum", "", "Loại nội dung (video/slide/txt/docx/pdf/xlsx/quiz/assignment)"),
-            ("content_url", "varchar(255)", "", "Đường dẫn nội dung"),
-            ("content", "text", "", "Nội dung"),
-            ("duration", "int", "", "Thời lượng (phút)"),
-            ("order_number", "int", "", "Thứ tự"),
-            ("is_free", "tinyint(1)", "", "Bài học miễn phí"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Tiến độ học tập (course_progress)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("lesson_id", "bigint", "FK", "Tham chiếu course_lessons(id)"),
-            ("completed_at", "timestamp", "", "Ngày hoàn thành"),
-            ("last_accessed", "timestamp", "", "Truy cập cuối"),
-        ]
-    },
-    {
-        "name": "Phần học (course_sections)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("description", "text", "", "Mô tả"),
-            ("order_number", "int", "", "Thứ tự"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Khóa học (courses)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("description", "text", "", "Mô tả"),
-            ("category_id", "bigint", "FK", "Tham chiếu categories(id)"),
-            ("instructor_id", "bigint", "FK", "Tham chiếu user_instructors(id)"),
-            ("price", "decimal(10,2)", "", "Giá"),
-            ("for", "enum", "", "Đối tượng (student/student_academic/both)"),
-            ("level", "enum", "", "Trình độ (beginner/intermediate/advanced)"),
-            ("status", "enum", "", "Trạng thái (draft/published/archived)"),
-            ("thumbnail_url", "varchar(255)", "", "Ảnh đại diện"),
-            ("required", "text", "", "Yêu cầu"),
-            ("learned", "text", "", "Kết quả đạt được"),
-            ("start_date", "date", "", "Ngày bắt đầu"),
-            ("end_date", "date", "", "Ngày kết thúc"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Tài liệu (documents)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("instructor_id", "bigint", "FK", "Tham chiếu user_instructors(id)"),
-            ("course_section_id", "bigint", "FK", "Tham chiếu course_sections(id)"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("description", "text", "", "Mô tả"),
-            ("file_url", "varchar(255)", "", "Đường dẫn file"),
-            ("file_type", "enum", "", "Loại file (pdf/slide/code/link/txt/docx/xlsx)"),
-            ("upload_date", "timestamp", "", "Ngày tải lên"),
-            ("download_count", "int", "", "Số lượt tải"),
-            ("status", "enum", "", "Trạng thái (active/archived)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Đăng ký khóa học (enrollments)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("enrollment_date", "timestamp", "", "Ngày đăng ký"),
-            ("status", "enum", "", "Trạng thái (active/completed/dropped)"),
-            ("completion_date", "timestamp", "", "Ngày hoàn thành"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Lượt thích diễn đàn (forum_likes)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("forum_id", "bigint", "FK", "Tham chiếu forums(id)"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Phản hồi diễn đàn (forum_replies)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("forum_id", "bigint", "FK", "Tham chiếu forums(id)"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("reply_id", "bigint", "FK", "ID phản hồi cha"),
-            ("content", "text", "", "Nội dung"),
-            ("is_solution", "tinyint(1)", "", "Là giải pháp"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Diễn đàn (forums)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("description", "text", "", "Mô tả"),
-            ("thumbnail_url", "text", "", "Ảnh đại diện"),
-            ("status", "enum", "", "Trạng thái (active/archived/closed)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Tin nhắn (messages)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("sender_id", "bigint", "FK", "Người gửi"),
-            ("receiver_id", "bigint", "FK", "Người nhận"),
-            ("message_text", "text", "", "Nội dung"),
-            ("reference_link", "text", "", "Liên kết tham chiếu"),
-            ("is_read", "tinyint(1)", "", "Đã đọc"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Tin nhắn nhóm (group_messages)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("sender_id", "bigint", "FK", "Người gửi"),
-            ("class_id", "bigint", "FK", "Tham chiếu academic_classes(id)"),
-            ("message_text", "text", "", "Nội dung tin nhắn"),
-            ("reference_link", "text", "", "Liên kết tham chiếu"),
-            ("reply_to_id", "bigint", "FK", "ID tin nhắn trả lời"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Thông báo (notifications)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("content", "text", "", "Nội dung"),
-            ("type", "enum", "", "Loại thông báo (course/assignment/quiz/system/message/schedule)"),
-            ("is_read", "tinyint(1)", "", "Đã đọc"),
-            ("teaching_schedule_id", "bigint", "FK", "Tham chiếu teaching_schedules(id)"),
-            ("notification_time", "datetime", "", "Thời gian thông báo"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Thanh toán (payments)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("amount", "decimal(10,2)", "", "Số tiền"),
-            ("payment_method", "enum", "", "Phương thức (credit_card/bank_transfer/e_wallet/zalopay)"),
-            ("transaction_id", "varchar(100)", "", "Mã giao dịch"),
-            ("status", "enum", "", "Trạng thái (pending/completed/failed/refunded)"),
-            ("payment_date", "timestamp", "", "Ngày thanh toán"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Lần làm bài kiểm tra (quiz_attempts)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("quiz_id", "bigint", "FK", "Tham chiếu quizzes(id)"),
-            ("start_time", "timestamp", "", "Bắt đầu"),
-            ("end_time", "timestamp", "", "Kết thúc"),
-            ("score", "decimal(5,2)", "", "Điểm"),
-            ("status", "enum", "", "Trạng thái (in_progress/completed/abandoned)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Lựa chọn câu hỏi (quiz_options)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("question_id", "bigint", "FK", "Tham chiếu quiz_questions(id)"),
-            ("option_text", "text", "", "Nội dung"),
-            ("is_correct", "tinyint(1)", "", "Đáp án đúng"),
-            ("order_number", "int", "", "Thứ tự"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Câu hỏi kiểm tra (quiz_questions)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("quiz_id", "bigint", "FK", "Tham chiếu quizzes(id)"),
-            ("question_text", "text", "", "Nội dung câu hỏi"),
-            ("question_type", "enum", "", "Loại câu hỏi (multiple_choice/true_false)"),
-            ("correct_explanation", "text", "", "Giải thích đáp án"),
-            ("points", "int", "", "Số điểm"),
-            ("order_number", "int", "", "Thứ tự"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Câu trả lời kiểm tra (quiz_responses)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("attempt_id", "bigint", "FK", "Tham chiếu quiz_attempts(id)"),
-            ("question_id", "bigint", "FK", "Tham chiếu quiz_questions(id)"),
-            ("selected_option_id", "bigint", "FK", "Tham chiếu quiz_options(id)"),
-            ("score", "decimal(5,2)", "", "Điểm"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Bài kiểm tra (quizzes)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("lesson_id", "bigint", "FK", "Tham chiếu course_lessons(id)"),
-            ("academic_class_id", "bigint", "FK", "Lớp học nếu là bài kiểm tra học thuật"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("description", "text", "", "Mô tả"),
-            ("time_limit", "int", "", "Giới hạn thời gian (phút)"),
-            ("passing_score", "int", "", "Điểm đạt"),
-            ("attempts_allowed", "int", "", "Số lần làm"),
-            ("quiz_type", "enum", "", "Loại bài kiểm tra (practice/homework/midterm/final)"),
-            ("show_explanation", "tinyint(1)", "", "Hiện giải thích"),
-            ("random", "tinyint(1)", "", "Trộn câu hỏi"),
-            ("start_time", "datetime", "", "Bắt đầu"),
-            ("end_time", "datetime", "", "Kết thúc"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Đánh giá (reviews)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_student_id", "bigint", "FK", "Tham chiếu user_students(id)"),
-            ("course_id", "bigint", "FK", "Khóa học liên quan"),
-            ("review_type", "enum", "", "Loại đánh giá (instructor/course)"),
-            ("rating", "int", "", "Số sao (1-5)"),
-            ("review_text", "text", "", "Nội dung"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Điểm danh buổi học (session_attendances)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("schedule_id", "bigint", "FK", "Tham chiếu teaching_schedules(id)"),
-            ("student_academic_id", "bigint", "FK", "Tham chiếu user_students_academic(id)"),
-            ("status", "enum", "", "Trạng thái (present/absent/late/excused)"),
-            ("join_time", "datetime", "", "Thời gian tham gia"),
-            ("leave_time", "datetime", "", "Thời gian rời đi"),
-            ("duration_minutes", "int", "", "Thời lượng (phút)"),
-            ("notes", "text", "", "Ghi chú"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Lịch dạy (teaching_schedules)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("academic_class_id", "bigint", "FK", "Tham chiếu academic_classes(id)"),
-            ("academic_class_instructor_id", "bigint", "FK", "Tham chiếu academic_class_instructors(id)"),
-            ("academic_class_course_id", "bigint", "FK", "Tham chiếu academic_class_courses(id)"),
-            ("title", "varchar(255)", "", "Tiêu đề"),
-            ("description", "text", "", "Mô tả"),
-            ("start_time", "datetime", "", "Bắt đầu"),
-            ("end_time", "datetime", "", "Kết thúc"),
-            ("meeting_link", "varchar(255)", "", "Link cuộc họp"),
-            ("meeting_id", "varchar(100)", "", "ID cuộc họp"),
-            ("meeting_password", "varchar(100)", "", "Mật khẩu cuộc họp"),
-            ("status", "enum", "", "Trạng thái (scheduled/completed/in-progress/cancelled)"),
-            ("is_recurring", "tinyint(1)", "", "Lặp lại"),
-            ("recurring_pattern", "json", "", "Mẫu lặp lại"),
-            ("recording_url", "text", "", "URL ghi lại"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Quản trị viên (user_admins)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK UNIQUE", "Tham chiếu users(id)"),
-            ("full_name", "varchar(100)", "", "Họ tên"),
-            ("department", "varchar(100)", "", "Phòng ban"),
-            ("position", "varchar(100)", "", "Chức vụ"),
-            ("admin_level", "enum", "", "Cấp quản trị (super_admin/admin/moderator)"),
-            ("permissions", "json", "", "Quyền hạn"),
-            ("emergency_contact", "varchar(100)", "", "Liên hệ khẩn cấp"),
-            ("office_location", "varchar(255)", "", "Văn phòng"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Điểm số (user_grades)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK", "Tham chiếu users(id)"),
-            ("graded_by", "bigint", "FK", "ID của giảng viên chấm điểm"),
-            ("course_id", "bigint", "FK", "Tham chiếu courses(id)"),
-            ("lesson_id", "bigint", "FK", "Tham chiếu course_lessons(id)"),
-            ("assignment_submission_id", "bigint", "FK", "Tham chiếu assignment_submissions(id)"),
-            ("quiz_attempt_id", "bigint", "FK", "Tham chiếu quiz_attempts(id)"),
-            ("grade_type", "enum", "", "Loại điểm (assignment/quiz/midterm/final/participation)"),
-            ("score", "decimal(5,2)", "", "Điểm"),
-            ("max_score", "decimal(5,2)", "", "Điểm tối đa"),
-            ("weight", "decimal(5,2)", "", "Trọng số điểm"),
-            ("feedback", "text", "", "Nhận xét"),
-            ("graded_at", "timestamp", "", "Ngày chấm"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Giảng viên (user_instructors)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK UNIQUE", "Tham chiếu users(id)"),
-            ("faculty_id", "bigint", "FK", "Tham chiếu faculties(id)"),
-            ("full_name", "varchar(100)", "", "Họ tên"),
-            ("professional_title", "varchar(100)", "", "Chức danh"),
-            ("specialization", "varchar(255)", "", "Chuyên môn"),
-            ("education_background", "text", "", "Học vấn"),
-            ("teaching_experience", "text", "", "Kinh nghiệm"),
-            ("bio", "text", "", "Giới thiệu"),
-            ("expertise_areas", "text", "", "Lĩnh vực chuyên môn"),
-            ("certificates", "text", "", "Chứng chỉ"),
-            ("linkedin_profile", "varchar(255)", "", "LinkedIn"),
-            ("website", "varchar(255)", "", "Website"),
-            ("payment_info", "json", "", "Thông tin thanh toán"),
-            ("verification_status", "enum", "", "Trạng thái xác minh (pending/verified/rejected)"),
-            ("verification_documents", "text", "", "Tài liệu xác minh"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Học viên (user_students)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK UNIQUE", "Tham chiếu users(id)"),
-            ("full_name", "varchar(100)", "", "Họ tên"),
-            ("date_of_birth", "date", "", "Ngày sinh"),
-            ("gender", "enum", "", "Giới tính (male/female/other)"),
-            ("education_level", "varchar(100)", "", "Trình độ học vấn"),
-            ("occupation", "varchar(100)", "", "Nghề nghiệp"),
-            ("bio", "text", "", "Giới thiệu"),
-            ("interests", "text", "", "Sở thích"),
-            ("address", "text", "", "Địa chỉ"),
-            ("city", "varchar(100)", "", "Thành phố"),
-            ("country", "varchar(100)", "", "Quốc gia"),
-            ("learning_goals", "text", "", "Mục tiêu học tập"),
-            ("preferred_language", "varchar(50)", "", "Ngôn ngữ"),
-            ("notification_preferences", "json", "", "Tùy chọn thông báo"),
-            ("total_courses_enrolled", "int", "", "Số khóa đã đăng ký"),
-            ("total_courses_completed", "int", "", "Số khóa đã hoàn thành"),
-            ("achievement_points", "int", "", "Điểm thành tích"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Sinh viên học thuật (user_students_academic)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("user_id", "bigint", "FK UNIQUE", "Tham chiếu users(id)"),
-            ("academic_class_id", "bigint", "FK", "Lớp học thuật"),
-            ("student_code", "varchar(50)", "UNIQUE", "Mã sinh viên"),
-            ("full_name", "varchar(100)", "", "Họ tên"),
-            ("academic_year", "varchar(20)", "", "Khóa học (K65, K66...)"),
-            ("status", "enum", "", "Trạng thái (studying/graduated/suspended/dropped)"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    },
-    {
-        "name": "Người dùng (users)",
-        "fields": [
-            ("id", "bigint", "PK", "ID tự tăng"),
-            ("username", "varchar(50)", "", "Tên đăng nhập"),
-            ("email", "varchar(100)", "", "Email"),
-            ("phone", "varchar(15)", "", "Số điện thoại"),
-            ("password", "varchar(255)", "", "Mật khẩu"),
-            ("role", "enum", "", "Vai trò (student/instructor/admin/student_academic/chatbot)"),
-            ("status", "enum", "", "Trạng thái (active/inactive/banned)"),
-            ("avatar_url", "varchar(255)", "", "Ảnh đại diện"),
-            ("two_factor_enabled", "tinyint(1)", "", "Bảo mật 2 lớp"),
-            ("two_factor_secret", "varchar(100)", "", "Mã bảo mật 2 lớp"),
-            ("social_login_provider", "varchar(50)", "", "Đăng nhập MXH"),
-            ("social_login_id", "text", "", "ID MXH"),
-            ("last_login", "timestamp", "", "Đăng nhập cuối"),
-            ("refresh_token", "text", "", "Refresh token"),
-            ("created_at", "timestamp", "", "Ngày tạo"),
-            ("updated_at", "timestamp", "", "Ngày cập nhật"),
-        ]
-    }
-]
+from doctools.sql_schema import PROFILE_OUTPUTS
 
-doc = Document()
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SQL_PATH = os.path.join(BASE_DIR, 'system_elearning.sql')
+# Mô tả tiếng Việt viết tay cho từng bảng/cột, ghép với model theo tên bảng và tên cột
+OVERLAY_PATH = os.path.join(BASE_DIR, 'schema_overlay.json')
 
-# Create custom style 'bang' if not exists
-styles = doc.styles
-if 'bang' not in [s.name for s in styles]:
-    bang_style = styles.add_style('bang', 1)  # 1 = paragraph style
-    bang_style.font.name = 'Times New Roman'
-    bang_style.font.size = Pt(13)
-    bang_style.font.color.rgb = RGBColor(0, 0, 0)
 
-table_counter = 1
+def main():
+    parser = argparse.ArgumentParser(description='Sinh tài liệu mô tả CSDL (database_schema*.docx).')
+    parser.add_argument('--sql', nargs='+', default=[SQL_PATH], help='một hoặc nhiều file dump MySQL')
+    parser.add_argument('--profiles', nargs='+', choices=list(PROFILE_OUTPUTS), default=list(PROFILE_OUTPUTS),
+                        help='các dạng tài liệu cần sinh (mặc định: tất cả)')
+    parser.add_argument('--out-dir', default=BASE_DIR, help='thư mục ghi các file .docx')
+    parser.add_argument('--stream', action='store_true',
+                        help='ghi document.xml dần từng bảng vào zip, bộ nhớ không tăng theo số bảng')
+    parser.add_argument('--no-cache', action='store_true', help='render lại toàn bộ bảng, không dùng cache')
+    parser.add_argument('--capacity', action='store_true',
+                        help='thêm ước tính dung lượng 10^5..10^9 hàng cho mỗi bảng và ghi database_schema_capacity.csv')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='chỉ nạp model và in số bảng cùng các file sẽ ghi, không dựng tài liệu')
+    parser.add_argument('--workers', type=int, help='số process render song song (mặc định: mỗi profile một process)')
+    parser.add_argument('--profile', metavar='JSON',
+                        help='đo wall/CPU/đỉnh bộ nhớ từng giai đoạn và thời gian từng bảng, ghi ra file JSON')
+    parser.add_argument('--cprofile', metavar='PATH',
+                        help='ghi thống kê cProfile của vòng render mỗi profile ra PATH-<profile>.prof')
+    args = parser.parse_args()
 
-for table in db_schema:
-    # Add table name above the table, centered
-    p = doc.add_paragraph(f"Bảng 4.{table_counter} {table['name']}", style='bang')
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    t = doc.add_table(rows=1, cols=5)
-    t.alignment = WD_TABLE_ALIGNMENT.RIGHT
-    t.style = 'Table Grid'
-    
-    # Set column widths
-    t.columns[0].width = Inches(0.2)  # STT column width
-    t.columns[1].width = Inches(2.0)  # Tên thuộc tính
-    t.columns[2].width = Inches(1.3)  # Kiểu dữ liệu
-    t.columns[3].width = Inches(1.0)  # Khóa
-    t.columns[4].width = Inches(3.0)  # Mô tả
-    
-    # Add right margin to the table
-    paragraph = doc.add_paragraph()
-    paragraph._p.addnext(t._element)
-    doc.paragraphs[-1]._element.getparent().remove(paragraph._element)
-    
-    hdr_cells = t.rows[0].cells
-    hdr_cells[0].text = 'STT'
-    hdr_cells[1].text = 'Tên thuộc tính'
-    hdr_cells[2].text = 'Kiểu dữ liệu'
-    hdr_cells[3].text = 'Khóa'
-    hdr_cells[4].text = 'Mô tả'
-    
-    for idx, field in enumerate(table['fields'], 1):
-        row_cells = t.add_row().cells
-        row_cells[0].text = str(idx)
-        row_cells[1].text = field[0]
-        row_cells[2].text = field[1]
-        row_cells[3].text = field[2]
-        row_cells[4].text = field[3]
-    
-    table_counter += 1
-    doc.add_paragraph()
+    # Import sau khi đọc tham số: --help và --dry-run không phải nạp python-docx
+    from doctools.builders import build_schema_doc
+    from doctools.profiling import Profiler
+    from doctools.sql_schema import load_model
 
-doc.save('database_schema.docx')
-print("Đã tạo file database_schema.docx thành công!")
\ No newline at end of file
+    profile_options = None
+    if args.profile or args.cprofile:
+        profile_options = {'trace_memory': bool(args.profile), 'cprofile_path': args.cprofile}
+    profiler = Profiler(enabled=profile_options is not None, trace_memory=bool(args.profile)).start()
+
+    # Nạp model một lần, dùng chung cho mọi profile
+    with profiler.stage('load'):
+        model = load_model(args.sql, OVERLAY_PATH)
+    if args.dry_run:
+        print(f"{len(model['tables'])} bảng từ {', '.join(args.sql)}")
+        for profile in args.profiles:
+            print(f'{profile}: {os.path.join(args.out_dir, PROFILE_OUTPUTS[profile])}')
+        return
+    if args.capacity:
+        # numpy chỉ cần khi lập kế hoạch dung lượng
+        from doctools.capacity import HOT_TABLES, capacity_by_table, plan_capacity, write_csv
+
+        with profiler.stage('capacity'):
+            plan = plan_capacity(model['tables'])
+            model['capacity'] = capacity_by_table(plan)
+        os.makedirs(args.out_dir, exist_ok=True)
+        csv_path = write_csv(plan, os.path.join(args.out_dir, 'database_schema_capacity.csv'))
+        for name in HOT_TABLES:
+            if name in model['capacity']:
+                projection = ', '.join(f'{rows}: {total}' for rows, _, _, total in model['capacity'][name][2])
+                print(f'Dung lượng {name}: {projection}')
+        print(f'Đã tạo file {csv_path} thành công!')
+    with profiler.stage('profiles'):
+        results = build_schema_doc(model, args.out_dir, args.profiles, stream=args.stream,
+                                   use_cache=not args.no_cache, workers=args.workers, profile_options=profile_options)
+    for profile, out_path, cache_summary, report in results:
+        profiler.merge(report, f'{profile}/')
+        if cache_summary:
+            print(f'Bảng ({profile}): {cache_summary}')
+        print(f"Đã tạo file {out_path} thành công!")
+    if args.profile:
+        print('\n'.join(profiler.summary()))
+        print(f"Đã ghi profile vào {profiler.write_json(args.profile, script='generate_db_schema_docx.py')}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,354 @@
+import argparse
+import hashlib
+import os
+
+from doctools.project_scan import scan_project
+from doctools.sql_schema import DEFAULT_CACHE_DIR
+
+# Script nằm trong document/, README.md ở thư mục gốc của dự án
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+README_PATH = os.path.join(ROOT_DIR, 'README.md')
+
+# Nhóm trang frontend theo tiền tố đường dẫn; các trang còn lại thuộc học viên/khách
+PAGE_AREAS = (('/instructor', 'Instructors'), ('/admin', 'Administrators'))
+
+
+# Phần mô tả viết tay của README, giữ nguyên từng dòng; chỉ các mục sinh từ mã nguồn được chèn vào giữa
+INTRO = """\
+# Hybrid Learning Platform: Marketplace + LMS
+
+<div align='center'>
+
+<!-- Logo -->
+
+<img src='https://github.com/user-attachments/assets/2d72d588-ea32-4ba8-86e2-33dbd6c78391' alt='Platform Logo' width='200'/>
+
+<!-- Demo Link -->
+
+[![Live Demo](https://img.shields.io/badge/Live-Demo-brightgreen)]([DEMO_URL])
+
+[![Documentation](https://img.shields.io/badge/Docs-Read%20More-blue)]([DOCS_URL])
+
+</div>
+
+## 🖼️ Platform Showcase
+
+<div align='center'>
+
+<!-- Featured Images Grid -->
+
+<table>
+
+  <tr>
+
+    <td align='center'><b>Marketplace Interface</b><br><img src='[MARKETPLACE_DASHBOARD_URL]' width='400'/><br>Course marketplace with advanced search and filtering</td>
+
+    <td align='center'><b>Learning Dashboard</b><br><img src='[LEARNING_DASHBOARD_URL]' width='400'/><br>Student learning progress and course management</td>
+
+  </tr>
+
+  <tr>
+
+    <td align='center'><b>Course Creation</b><br><img src='[COURSE_CREATION_URL]' width='400'/><br>Intuitive course creation interface for instructors</td>
+
+    <td align='center'><b>AI Learning Assistant</b><br><img src='[AI_CHATBOT_URL]' width='400'/><br>Smart chatbot powered by OpenAI</td>
+
+  </tr>
+
+  <tr>
+
+    <td align='center'><b>Academic Management</b><br><img src='[ACADEMIC_DASHBOARD_URL]' width='400'/><br>Comprehensive academic class management</td>
+
+    <td align='center'><b>Analytics Dashboard</b><br><img src='[ANALYTICS_DASHBOARD_URL]' width='400'/><br>Detailed analytics and reporting</td>
+
+  </tr>
+
+</table>
+
+</div>
+
+## 📱 Quick Links
+
+- [Live Demo]([DEMO_URL]) - Experience the platform firsthand
+
+- [Documentation]([DOCS_URL]) - Detailed platform documentation
+
+- [API Reference]([API_URL]) - Technical API documentation
+
+- [Support]([SUPPORT_URL]) - Get help and support
+
+A comprehensive hybrid learning platform that combines the features of a Course Marketplace and a Learning Management System (LMS), designed to support both commercial online courses and academic education.
+
+## 🌟 Platform Overview
+
+### 🏪 Marketplace Features
+
+- **Course Marketplace**: Platform for instructors to sell their courses
+  - Course listing and discovery
+  - Flexible pricing models
+  - Instructor profiles and ratings
+  - Course previews and demos
+  - Student reviews and feedback
+  - Revenue sharing system
+  - Marketing tools for instructors
+
+### 🎓 LMS Features
+
+- **Academic Learning Management**: Comprehensive tools for educational institutions
+  - Academic class management
+  - Student enrollment and tracking
+  - Grade management
+  - Attendance monitoring
+  - Academic reporting
+  - Institutional analytics
+
+### 🤖 AI-Powered Learning Assistant
+
+- **Smart Chatbot**: OpenAI-powered chatbot for instant student support
+  - Natural language understanding for student queries
+  - Context-aware responses based on course content
+  - 24/7 automated assistance for common questions
+  - Multi-language support for diverse student base
+  - Learning path recommendations
+  - Course content explanations
+
+### 📝 AI-Enhanced Quiz System
+
+- **Intelligent Quiz Generation**: OpenAI integration for quiz creation
+  - Automatic question generation from course content
+  - Multiple question types (multiple choice, true/false)
+  - Difficulty level adjustment
+  - Smart answer explanations
+  - Performance analytics and insights
+  - Adaptive learning paths based on quiz results
+"""
+
+ROLES_AND_FEATURES = """\
+## 👥 User Roles & Management
+
+### Marketplace Users
+
+- **Instructors**: Create and sell courses
+
+  - Course creation and management
+  - Student engagement tools
+  - Revenue tracking
+  - Marketing capabilities
+  - Performance analytics
+
+- **Students**: Purchase and learn from courses
+  - Course browsing and enrollment
+  - Learning progress tracking
+  - Certificate management
+  - Payment history
+  - Course reviews and ratings
+
+### LMS Users
+
+- **Academic Instructors**: Manage academic classes
+
+  - Class management
+  - Student assessment
+  - Grade management
+  - Attendance tracking
+  - Academic reporting
+
+- **Academic Students**: Participate in formal education
+
+  - Class enrollment
+  - Assignment submission
+  - Grade tracking
+  - Academic progress monitoring
+  - Certificate management
+
+- **Administrators**: Oversee both marketplace and LMS
+  - User management
+  - Content moderation
+  - System configuration
+  - Analytics and reporting
+  - Platform maintenance
+
+## 💰 Revenue Model
+
+- **Marketplace Revenue**
+
+  - Course sales commission
+  - Premium instructor features
+  - Featured course listings
+  - Marketing services
+  - Subscription options
+
+- **LMS Revenue**
+  - Institutional licensing
+  - Per-student pricing
+  - Feature-based packages
+  - Custom integration services
+  - Support and training
+
+## 📚 Content Management
+
+- **Marketplace Content**
+
+  - Course creation tools
+  - Content monetization
+  - Marketing materials
+  - Student engagement features
+  - Analytics and insights
+
+- **Academic Content**
+  - Curriculum management
+  - Assignment creation
+  - Quiz generation
+  - Resource sharing
+  - Academic standards compliance
+
+## 🔄 System Integration
+
+- OpenAI API integration for AI features
+- Payment gateway integration
+- Social media platforms
+- Learning tools and resources
+- Analytics and reporting systems
+
+## 📈 Analytics & Reporting
+
+- **Marketplace Analytics**
+
+  - Sales performance
+  - Course popularity
+  - Student engagement
+  - Revenue metrics
+  - Marketing effectiveness
+
+- **Academic Analytics**
+  - Student performance
+  - Class progress
+  - Attendance statistics
+  - Academic outcomes
+  - Institutional metrics
+
+## 🛠 Technical Requirements
+
+- MySQL Database (8.0+)
+- UTF-8 Character Support
+- Secure File Storage
+- Web Server Support
+- OpenAI API Access
+- Payment Gateway Integration
+"""
+
+SYSTEM_UPDATES = """\
+## 🔄 System Updates
+
+The system is regularly updated with:
+
+- New marketplace features
+- Enhanced LMS capabilities
+- AI feature improvements
+- Security patches
+- Performance optimizations
+- User feedback implementation
+- OpenAI model updates
+"""
+
+
+def render_modules(scan):
+    """Bảng module backend (route prefix, số endpoint) và danh sách endpoint đầy đủ."""
+    endpoints = sum(len(controller.routes) for controllers in scan.modules.values() for controller in controllers)
+    lines = [
+        "## 🧩 Backend Modules",
+        "",
+        f"The NestJS backend is split into {len(scan.modules)} modules under `backend/src/modules`, "
+        f"exposing {endpoints} REST endpoints:",
+        "",
+        "| Module | Route prefix | Endpoints |",
+        "|---|---|---|",
+    ]
+    for module, controllers in scan.modules.items():
+        prefixes = ', '.join(f"`/{controller.prefix}`" for controller in controllers) or '—'
+        count = sum(len(controller.routes) for controller in controllers)
+        lines.append(f"| `{module}` | {prefixes} | {count or '—'} |")
+    lines += ["", "<details>", "<summary>API endpoints</summary>", ""]
+    for module, controllers in scan.modules.items():
+        routes = [route for controller in controllers for route in controller.routes]
+        if routes:
+            lines.append(f"- **{module}**: " + ', '.join(f"`{method} {path}`" for method, path in routes))
+    lines += ["", "</details>"]
+    return "\n".join(lines)
+
+
+def render_pages(scan):
+    """Các trang frontend theo nhóm người dùng."""
+    areas = {}
+    for path in dict.fromkeys(scan.pages):
+        area = next((name for prefix, name in PAGE_AREAS if path == prefix or path.startswith(prefix + '/')),
+                    'Students & visitors')
+        areas.setdefault(area, []).append(path)
+    lines = [
+        "## 🖥️ Frontend Pages",
+        "",
+        f"The React frontend (`frontend/src`) declares {sum(len(paths) for paths in areas.values())} routes:",
+        "",
+    ]
+    for area in ['Students & visitors'] + [name for _, name in PAGE_AREAS]:
+        if area in areas:
+            lines.append(f"- **{area}**: " + ', '.join(f"`{path}`" for path in areas[area]))
+    return "\n".join(lines)
+
+
+def render_database(scan):
+    """Bảng các entity TypeORM: tên bảng, lớp, số cột và các entity liên kết."""
+    lines = [
+        "## 📝 Database Structure",
+        "",
+        "The system uses a comprehensive database structure supporting both marketplace and LMS features, "
+        f"mapped by {len(scan.entities)} TypeORM entities in `backend/src/entities`:",
+        "",
+        "| Table | Entity | Columns | Related entities |",
+        "|---|---|---|---|",
+    ]
+    for entity in sorted(scan.entities, key=lambda e: e['table'] or ''):
+        related = ', '.join(dict.fromkeys(r['target'] for r in entity['relations'] if r['target'])) or '—'
+        lines.append(f"| `{entity['table']}` | {entity['class']} | {len(entity['columns'])} | {related} |")
+    return "\n".join(lines)
+
+
+def generate_readme(root=ROOT_DIR, out_path=README_PATH, cache_dir=DEFAULT_CACHE_DIR):
+    """Sinh README.md từ mã nguồn thật; không ghi lại file khi nội dung không đổi. Trả về True nếu đã ghi."""
+    scan = scan_project(root, cache_dir)
+    sections = [
+        INTRO,
+        render_modules(scan),
+        render_pages(scan),
+        ROLES_AND_FEATURES,
+        render_database(scan),
+        SYSTEM_UPDATES,
+    ]
+    content = "\n\n".join(section.rstrip("\n") for section in sections) + "\n"
+    # Giữ nguyên file (và mtime) khi nội dung không đổi để các bước phụ thuộc README.md không bị chạy lại
+    digest = hashlib.sha256(content.encode("utf-8")).digest()
+    try:
+        with open(out_path, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == digest:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sinh README.md từ backend/src và frontend/src.")
+    parser.add_argument("--root", default=ROOT_DIR, help="thư mục gốc của dự án")
+    parser.add_argument("--out", default=README_PATH, help="file README cần ghi")
+    parser.add_argument("--no-cache", action="store_true", help="phân tích lại mọi file, không dùng cache")
+    args = parser.parse_args()
+    if generate_readme(args.root, args.out, None if args.no_cache else DEFAULT_CACHE_DIR):
+        print(f"Đã tạo file {args.out} thành công!")
+    else:
+        print(f"{args.out} không đổi, bỏ qua.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
+import argparse
 import os
 
+from doctools.figure_manifest import load_manifest
+from doctools.image_catalog import ImageCatalog
+from doctools.rename_plan import rename_folders
+
 # Mapping học sinh/sinh viên
 mapping_hocvien = {
     'dangky.png': 'Đăng ký.png',
@@ -115,54 +120,39 @@ mapping.update(mapping_hocvien)
 mapping.update(mapping_gv)
 mapping.update(mapping_admin)
 
-folders = [
-    'images/hocviensinhvien',
-    'images/giangvien',
-    'images/quantrivien'
-]
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Thư mục ảnh của các nhóm lấy từ manifest chương 5
+MANIFEST_PATH = os.path.join(BASE_DIR, 'chuong5_manifest.json')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Đổi tên ảnh chụp màn hình sang tên tiếng Việt.')
+    parser.add_argument('folders', nargs='*', help='các thư mục ảnh (mặc định: các nhóm trong manifest chương 5)')
+    parser.add_argument('--manifest', default=MANIFEST_PATH, help='file JSON mô tả nhóm ảnh')
+    parser.add_argument('--dry-run', action='store_true', help='chỉ in kế hoạch đổi tên, không đổi tên file nào')
+    parser.add_argument('--workers', type=int, help='số thư mục xử lý song song')
+    args = parser.parse_args()
 
-# Bước 1: Đổi tên tạm thời để tránh trùng lặp
-# for folder in folders:
-#     if not os.path.exists(folder):
-#         continue
-#     for filename in os.listdir(folder):
-#         if filename.endswith('.png'):
-#             tmp_name = filename + '.tmp'
-#             old_path = os.path.join(folder, filename)
-#             tmp_path = os.path.join(folder, tmp_name)
-#             os.rename(old_path, tmp_path)
+    folders = args.folders or [group['path'] for group in load_manifest(args.manifest)['groups']]
+    results = rename_folders(folders, mapping, dry_run=args.dry_run, workers=args.workers)
+    if not args.dry_run:
+        # Ghi nhận đổi tên vào danh mục ảnh dưới dạng di chuyển, giữ hash và khóa mô tả, không đọc lại ảnh
+        with ImageCatalog() as catalog:
+            for plan, _, error in results:
+                if error is None:
+                    catalog.record_moves(plan.folder, plan.moves)
+    for plan, undone, error in results:
+        if undone:
+            print(f"Đã hoàn tác {undone} bước đổi tên dở dang trong {plan.folder}")
+        for src, dst, reason in plan.conflicts:
+            print(f"Bỏ qua {src} -> {dst} trong {plan.folder}: {reason}")
+        if error is not None:
+            print(f"Lỗi khi đổi tên trong {plan.folder}, đã hoàn tác thư mục này: {error}")
+            continue
+        verb = 'Sẽ đổi tên' if args.dry_run else 'Đã đổi tên'
+        for src, dst in plan.moves:
+            print(f"{verb}: {src} -> {dst}")
 
-# Bước 2: Đổi tên về chữ thường
-for folder in folders:
-    if not os.path.exists(folder):
-        continue
-    for filename in os.listdir(folder):
-        if filename.endswith('.png.tmp'):
-            new_name = filename[:-4].lower() + '.png'
-            old_path = os.path.join(folder, filename)
-            new_path = os.path.join(folder, new_name)
-            os.rename(old_path, new_path)
-            print(f"Đã đổi tên: {filename} -> {new_name}")
 
-# Đổi tên sang tiếng Việt
-for folder in folders:
-    if not os.path.exists(folder):
-        continue
-    for filename in os.listdir(folder):
-        if filename.endswith('.png'):
-            filename_lower = filename.lower()
-            # Tra cứu mapping bằng tên file chữ thường
-            new_name = mapping.get(filename_lower)
-            if not new_name:
-                name_no_ext = os.path.splitext(filename)[0]
-                new_name = name_no_ext.replace('_', ' ').capitalize() + '.png'
-            old_path = os.path.join(folder, filename)
-            new_path = os.path.join(folder, new_name)
-            try:
-                if old_path != new_path:
-                    os.rename(old_path, new_path)
-                    print(f"Đã đổi tên: {filename} -> {new_name}")
-            except FileNotFoundError:
-                print(f"Không tìm thấy file: {old_path}")
-            except Exception as e:
-                print(f"Lỗi khi đổi tên {filename}: {e}") 
\ No newline at end of file
+if __name__ == '__main__':
+    main()
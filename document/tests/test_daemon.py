@@ -0,0 +1,76 @@
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from doctools.build_graph import Target
+from doctools.daemon import BuildDaemon, request
+
+
+def _raw_request(socket_path, line):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5)
+        sock.connect(socket_path)
+        sock.sendall(line + b'\n')
+        with sock.makefile('rb') as f:
+            return json.loads(f.readline())
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    (tmp_path / 'in.txt').write_text('a', encoding='utf-8')
+
+    def build_out():
+        (tmp_path / 'out.txt').write_text((tmp_path / 'in.txt').read_text(encoding='utf-8'), encoding='utf-8')
+        return 'ok'
+
+    target = Target('out.txt', outputs=('out.txt',), inputs=('in.txt',), command=('build_out',))
+    daemon = BuildDaemon(tmp_path, [target], {'out.txt': build_out}, socket_path=str(tmp_path / 'd.sock'),
+                         interval=0.05, log=lambda line: None, state_path=str(tmp_path / 'state.json'))
+    thread = threading.Thread(target=daemon.run)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while daemon.last.get('out.txt') is None:
+        assert time.monotonic() < deadline, 'daemon không build lần đầu'
+        time.sleep(0.01)
+    yield daemon
+    daemon.stop()
+    thread.join(10)
+    assert not os.path.exists(daemon.socket_path)
+
+
+@pytest.mark.parametrize('line', [
+    b'not json',
+    b'[]',
+    b'"x"',
+    b'42',
+    b'{"cmd": "wait", "after": "a"}',
+    b'{"cmd": "wait", "timeout": "x"}',
+    b'{"cmd": "build", "targets": 5}',
+    b'{"cmd": "build", "targets": [1]}',
+    b'{"cmd": "build", "targets": ["khong-co"]}',
+    b'{"cmd": "nope"}',
+])
+def test_malformed_request_gets_error_reply(daemon, line):
+    reply = _raw_request(daemon.socket_path, line)
+    assert set(reply) == {'error'}
+    # Daemon vẫn phục vụ các yêu cầu tiếp theo
+    assert 'out.txt' in request(daemon.socket_path, {'cmd': 'status'}, timeout=5)['targets']
+
+
+def test_status_and_build_round_trip(daemon):
+    status = request(daemon.socket_path, {'cmd': 'status'}, timeout=5)
+    assert status['targets']['out.txt']['status'] == 'built'
+
+    reply = request(daemon.socket_path, {'cmd': 'build', 'targets': ['out.txt']}, timeout=5)
+    assert [(r['name'], r['status']) for r in reply['results']] == [('out.txt', 'up-to-date')]
+
+    reply = request(daemon.socket_path, {'cmd': 'build', 'targets': ['out.txt'], 'force': True}, timeout=5)
+    assert [(r['name'], r['status'], r['log']) for r in reply['results']] == [('out.txt', 'built', 'ok')]
+
+    events = request(daemon.socket_path, {'cmd': 'wait', 'after': status['seq'], 'timeout': 5}, timeout=10)['events']
+    assert [event['target'] for event in events] == ['out.txt']
+    assert request(daemon.socket_path, {'cmd': 'stop'}, timeout=5) == {'stopped': True}
@@ -0,0 +1,57 @@
+import time
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from doctools.docx_append import BodyAppender
+
+
+def _tags(doc):
+    return [child.tag for child in doc.element.body]
+
+
+def test_appends_before_trailing_sectpr():
+    doc = Document()
+    doc.add_paragraph('mở đầu')
+    assert _tags(doc)[-1] == qn('w:sectPr')
+
+    body = BodyAppender(doc)
+    body.add_paragraph('đoạn 1')
+    table = body.add_table(rows=2, cols=3, style='Table Grid')
+    body.add_paragraph('đoạn 2', style='Heading 1')
+
+    assert _tags(doc) == [qn('w:p'), qn('w:p'), qn('w:tbl'), qn('w:p'), qn('w:sectPr')]
+    assert [p.text for p in doc.paragraphs] == ['mở đầu', 'đoạn 1', 'đoạn 2']
+    assert doc.paragraphs[-1].style.name == 'Heading 1'
+    assert doc.tables[0]._element is table._element
+    assert table.style.name == 'Table Grid' and len(table.rows) == 2 and len(table.columns) == 3
+
+
+def test_order_is_kept_over_many_appends():
+    doc = Document()
+    body = BodyAppender(doc)
+    for i in range(500):
+        body.add_paragraph(f'Bảng {i}')
+        body.add_table(rows=1, cols=2)
+    assert _tags(doc) == [qn('w:p'), qn('w:tbl')] * 500 + [qn('w:sectPr')]
+    assert [p.text for p in doc.paragraphs] == [f'Bảng {i}' for i in range(500)]
+
+
+
+def _seconds_per_table(n_tables):
+    best = None
+    for _ in range(3):
+        doc = Document()
+        body = BodyAppender(doc)
+        start = time.perf_counter()
+        for i in range(n_tables):
+            body.add_paragraph(f'Bảng {i}')
+            body.add_table(rows=1, cols=2)
+        elapsed = (time.perf_counter() - start) / n_tables
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_cost_per_table_stays_flat():
+    # Vòng lặp cũ (tìm lại sectPr, doc.paragraphs[-1]) cho tỉ lệ khoảng 7; ngưỡng 3 chừa chỗ cho nhiễu đo
+    assert _seconds_per_table(3000) < 3 * _seconds_per_table(300)
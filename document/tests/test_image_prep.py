@@ -0,0 +1,30 @@
+import os
+
+from PIL import Image
+
+from doctools.image_prep import DEFAULT_SETTINGS, prepare_images
+
+
+def _screenshot(path, color):
+    Image.new('RGB', (1600, 900), color).save(path)
+    return str(path)
+
+
+def test_cache_keeps_only_images_of_the_last_run(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    a = _screenshot(tmp_path / 'a.png', (200, 10, 10))
+    b = _screenshot(tmp_path / 'b.png', (10, 200, 10))
+
+    prepared, reprocessed = prepare_images([a, b], cache_dir, workers=1)
+    assert reprocessed == 2
+    _screenshot(tmp_path / 'a.png', (10, 10, 200))  # ảnh a được chụp lại
+    prepared, reprocessed = prepare_images([a, b], cache_dir, workers=1)
+    assert reprocessed == 1
+    assert sorted(os.listdir(os.path.join(cache_dir, 'images'))) == sorted(map(os.path.basename, prepared.values()))
+
+    prepared, reprocessed = prepare_images([a, b], cache_dir, DEFAULT_SETTINGS._replace(dpi=150), workers=1)
+    assert reprocessed == 2
+    assert sorted(os.listdir(os.path.join(cache_dir, 'images'))) == sorted(map(os.path.basename, prepared.values()))
+
+    prepare_images([a], cache_dir, workers=1, prune=False)
+    assert len(os.listdir(os.path.join(cache_dir, 'images'))) == 3
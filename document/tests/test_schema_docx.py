@@ -0,0 +1,44 @@
+import pytest
+from docx.shared import Inches
+
+from bench_schema_docx import check_equivalent, new_document
+from doctools.schema_docx import COLUMN_WIDTHS, HEADER, add_schema_tables
+from doctools.table_xml import TableTemplate, parse_fragments
+
+# Độ rộng cột của script gốc (t.columns[i].width = Inches(...))
+PROXY_WIDTHS = (Inches(0.2), Inches(2.0), Inches(1.3), Inches(1.0), Inches(3.0))
+
+
+def test_template_matches_proxy_build():
+    assert check_equivalent()
+
+
+@pytest.mark.parametrize('text', [
+    '&',
+    '<',
+    '>',
+    'a & b < c > d',
+    '"trích dẫn" và \'nháy đơn\'',
+    'Mã định danh người học',
+    'Trạng thái: đã duyệt/chờ duyệt',
+    '  khoảng trắng đầu cuối  ',
+    'tab\tvà\nxuống dòng',
+])
+def test_escaped_values_match_proxy_build(text):
+    db_schema = [{'name': f'{text} (bảng_{text})', 'fields': [(text, text, text, text), ('id', 'int', 'PK', '')]}]
+    assert check_equivalent(db_schema=db_schema)
+
+
+def test_column_widths_match_proxy_widths():
+    assert COLUMN_WIDTHS == PROXY_WIDTHS
+    doc = new_document()
+    template = TableTemplate(HEADER, COLUMN_WIDTHS, doc._block_width)
+    table, = parse_fragments([template.render([('1', 'id', 'int', 'PK', '')])])
+    ns = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+    w = '{%s}w' % ns['w']
+    grid = [int(col.get(w)) for col in table.iterfind('w:tblGrid/w:gridCol', ns)]
+    cells = [int(tcw.get(w)) for tcw in table.iterfind('w:tr[2]/w:tc/w:tcPr/w:tcW', ns)]
+    assert grid == cells == [width.twips for width in PROXY_WIDTHS]
+
+    add_schema_tables(doc, [{'name': 'users', 'fields': [('id', 'int', 'PK', '')]}])
+    assert [column.width for column in doc.tables[0].columns] == list(PROXY_WIDTHS)
@@ -1,201 +0,0 @@
-import os
-from pathlib import Path
-
-def generate_readme():
-    readme_content = [
-        "# Hybrid Learning Platform: Marketplace + LMS\n",
-        "<div align='center'>\n",
-        "<!-- Logo -->\n",
-        "<img src='[LOGO_URL]' alt='Platform Logo' width='200'/>\n\n",
-        "<!-- Demo Link -->\n",
-        "[![Live Demo](https://img.shields.io/badge/Live-Demo-brightgreen)]([DEMO_URL])\n",
-        "[![Documentation](https://img.shields.io/badge/Docs-Read%20More-blue)]([DOCS_URL])\n",
-        "</div>\n\n",
-        "## 🖼️ Platform Showcase\n",
-        "<div align='center'>\n",
-        "<!-- Featured Images Grid -->\n",
-        "<table>\n",
-        "  <tr>\n",
-        "    <td align='center'><b>Marketplace Interface</b><br><img src='[MARKETPLACE_DASHBOARD_URL]' width='400'/><br>Course marketplace with advanced search and filtering</td>\n",
-        "    <td align='center'><b>Learning Dashboard</b><br><img src='[LEARNING_DASHBOARD_URL]' width='400'/><br>Student learning progress and course management</td>\n",
-        "  </tr>\n",
-        "  <tr>\n",
-        "    <td align='center'><b>Course Creation</b><br><img src='[COURSE_CREATION_URL]' width='400'/><br>Intuitive course creation interface for instructors</td>\n",
-        "    <td align='center'><b>AI Learning Assistant</b><br><img src='[AI_CHATBOT_URL]' width='400'/><br>Smart chatbot powered by OpenAI</td>\n",
-        "  </tr>\n",
-        "  <tr>\n",
-        "    <td align='center'><b>Academic Management</b><br><img src='[ACADEMIC_DASHBOARD_URL]' width='400'/><br>Comprehensive academic class management</td>\n",
-        "    <td align='center'><b>Analytics Dashboard</b><br><img src='[ANALYTICS_DASHBOARD_URL]' width='400'/><br>Detailed analytics and reporting</td>\n",
-        "  </tr>\n",
-        "</table>\n",
-        "</div>\n\n",
-        "## 📱 Quick Links\n",
-        "- [Live Demo]([DEMO_URL]) - Experience the platform firsthand\n",
-        "- [Documentation]([DOCS_URL]) - Detailed platform documentation\n",
-        "- [API Reference]([API_URL]) - Technical API documentation\n",
-        "- [Support]([SUPPORT_URL]) - Get help and support\n\n",
-        
-        "A comprehensive hybrid learning platform that combines the features of a Course Marketplace and a Learning Management System (LMS), designed to support both commercial online courses and academic education.\n",
-        
-        "## 🌟 Platform Overview\n",
-        "### 🏪 Marketplace Features",
-        "- **Course Marketplace**: Platform for instructors to sell their courses",
-        "  - Course listing and discovery",
-        "  - Flexible pricing models",
-        "  - Instructor profiles and ratings",
-        "  - Course previews and demos",
-        "  - Student reviews and feedback",
-        "  - Revenue sharing system",
-        "  - Marketing tools for instructors\n",
-        
-        "### 🎓 LMS Features",
-        "- **Academic Learning Management**: Comprehensive tools for educational institutions",
-        "  - Academic class management",
-        "  - Student enrollment and tracking",
-        "  - Grade management",
-        "  - Attendance monitoring",
-        "  - Academic reporting",
-        "  - Institutional analytics\n",
-        
-        "### 🤖 AI-Powered Learning Assistant",
-        "- **Smart Chatbot**: OpenAI-powered chatbot for instant student support",
-        "  - Natural language understanding for student queries",
-        "  - Context-aware responses based on course content",
-        "  - 24/7 automated assistance for common questions",
-        "  - Multi-language support for diverse student base",
-        "  - Learning path recommendations",
-        "  - Course content explanations\n",
-        
-        "### 📝 AI-Enhanced Quiz System",
-        "- **Intelligent Quiz Generation**: OpenAI integration for quiz creation",
-        "  - Automatic question generation from course content",
-        "  - Multiple question types (multiple choice, true/false)",
-        "  - Difficulty level adjustment",
-        "  - Smart answer explanations",
-        "  - Performance analytics and insights",
-        "  - Adaptive learning paths based on quiz results\n",
-        
-        "## 👥 User Roles & Management",
-        "### Marketplace Users",
-        "- **Instructors**: Create and sell courses",
-        "  - Course creation and management",
-        "  - Student engagement tools",
-        "  - Revenue tracking",
-        "  - Marketing capabilities",
-        "  - Performance analytics\n",
-        
-        "- **Students**: Purchase and learn from courses",
-        "  - Course browsing and enrollment",
-        "  - Learning progress tracking",
-        "  - Certificate management",
-        "  - Payment history",
-        "  - Course reviews and ratings\n",
-        
-        "### LMS Users",
-        "- **Academic Instructors**: Manage academic classes",
-        "  - Class management",
-        "  - Student assessment",
-        "  - Grade management",
-        "  - Attendance tracking",
-        "  - Academic reporting\n",
-        
-        "- **Academic Students**: Participate in formal education",
-        "  - Class enrollment",
-        "  - Assignment submission",
-        "  - Grade tracking",
-        "  - Academic progress monitoring",
-        "  - Certificate management\n",
-        
-        "- **Administrators**: Oversee both marketplace and LMS",
-        "  - User management",
-        "  - Content moderation",
-        "  - System configuration",
-        "  - Analytics and reporting",
-        "  - Platform maintenance\n",
-        
-        "## 💰 Revenue Model",
-        "- **Marketplace Revenue**",
-        "  - Course sales commission",
-        "  - Premium instructor features",
-        "  - Featured course listings",
-        "  - Marketing services",
-        "  - Subscription options\n",
-        
-        "- **LMS Revenue**",
-        "  - Institutional licensing",
-        "  - Per-student pricing",
-        "  - Feature-based packages",
-        "  - Custom integration services",
-        "  - Support and training\n",
-        
-        "## 📚 Content Management",
-        "- **Marketplace Content**",
-        "  - Course creation tools",
-        "  - Content monetization",
-        "  - Marketing materials",
-        "  - Student engagement features",
-        "  - Analytics and insights\n",
-        
-        "- **Academic Content**",
-        "  - Curriculum management",
-        "  - Assignment creation",
-        "  - Quiz generation",
-        "  - Resource sharing",
-        "  - Academic standards compliance\n",
-        
-        "## 🔄 System Integration",
-        "- OpenAI API integration for AI features",
-        "- Payment gateway integration",
-        "- Social media platforms",
-        "- Learning tools and resources",
-        "- Analytics and reporting systems\n",
-        
-        "## 📈 Analytics & Reporting",
-        "- **Marketplace Analytics**",
-        "  - Sales performance",
-        "  - Course popularity",
-        "  - Student engagement",
-        "  - Revenue metrics",
-        "  - Marketing effectiveness\n",
-        
-        "- **Academic Analytics**",
-        "  - Student performance",
-        "  - Class progress",
-        "  - Attendance statistics",
-        "  - Academic outcomes",
-        "  - Institutional metrics\n",
-        
-        "## 🛠 Technical Requirements",
-        "- MySQL Database (8.0+)",
-        "- UTF-8 Character Support",
-        "- Secure File Storage",
-        "- Web Server Support",
-        "- OpenAI API Access",
-        "- Payment Gateway Integration\n",
-        
-        "## 📝 Database Structure",
-        "The system uses a comprehensive database structure supporting both marketplace and LMS features:",
-        "- User management (users, user_students, user_instructors, user_admins)",
-        "- Course management (courses, course_sections, course_lessons)",
-        "- Academic management (academic_classes, academic_class_courses)",
-        "- Learning activities (assignments, quizzes, discussions)",
-        "- Assessment (user_grades, quiz_attempts, assignment_submissions)",
-        "- Communication (messages, group_messages, notifications, chatbot_response)",
-        "- Payment processing (payments, enrollments)\n",
-        
-        "## 🔄 System Updates",
-        "The system is regularly updated with:",
-        "- New marketplace features",
-        "- Enhanced LMS capabilities",
-        "- AI feature improvements",
-        "- Security patches",
-        "- Performance optimizations",
-        "- User feedback implementation",
-        "- OpenAI model updates\n"
-    ]
-    
-    with open("README.md", "w", encoding="utf-8") as f:
-        f.write("\n".join(readme_content))
-
-if __name__ == "__main__":
-    generate_readme() 
\ No newline at end of file